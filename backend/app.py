@@ -4,6 +4,7 @@ import datetime
 from flask      import Flask
 from flask.json import JSONEncoder
 from flask_cors import CORS
+from flask_compress import Compress
 
 from model      import (
     UserDao,
@@ -63,6 +64,7 @@ def create_app():
     History :
         2020-08-19 (tnwjd060124@gmail.com)  : 초기 생성
         2020-08-25 (sincerity410@gmail.com) : AdminProduct 관련 추가
+        2020-09-10 (sincerity410@gmail.com) : json 응답 압축(br, gzip) 설정
     """
 
     app = Flask(__name__)
@@ -74,6 +76,14 @@ def create_app():
     #config 설정
     app.config.from_pyfile("config.py")
 
+    # 1KB 이상 json 응답 압축 설정 (brotli 우선, Vary: Accept-Encoding 자동 추가)
+    app.config.setdefault('COMPRESS_ALGORITHM', ['br', 'gzip'])
+    app.config.setdefault('COMPRESS_LEVEL', 4)
+    app.config.setdefault('COMPRESS_BR_LEVEL', 4)
+    app.config.setdefault('COMPRESS_MIN_SIZE', 1024)
+    app.config.setdefault('COMPRESS_MIMETYPES', ['application/json'])
+    Compress(app)
+
     # DAO 생성
     user_dao = UserDao()
     order_dao = OrderDao()
@@ -86,7 +96,7 @@ def create_app():
 
     # view blueprint 등록
     app.register_blueprint(create_user_endpoints(user_service))
-    app.register_blueprint(create_admin_user_endpoints(user_service))
+    app.register_blueprint(create_admin_user_endpoints(user_service, order_service))
     app.register_blueprint(create_admin_order_endpoints(order_service))
     app.register_blueprint(service_product_endpoint(product_service))
     app.register_blueprint(create_admin_product_endpoints(product_service))
@@ -1,21 +1,29 @@
-import pymysql, boto3
+import pymysql, boto3, redis
+
+from botocore.config import Config
+from sqlalchemy      import create_engine, event
+from sqlalchemy.pool import QueuePool
 
 from config import DATABASE
 from config import S3
+from config import REDIS
 
-def get_connection():
+def create_pymysql_connection():
     """
 
-    import 되어서 사용될 때마다 connection 생성
+    connection pool 이 새로운 connection 을 만들 때 사용하는 creator
 
     Returns :
-        database connection 객체
+        pymysql connection 객체
 
     Authors :
         tnwjd060124@gmail.com (손수정)
 
     History :
         2020-08-19 (tnwjd060124@gmail.com) : 초기 생성
+        2020-09-08 (tnwjd060124@gmail.com) : connection pool creator 로 분리
+        2020-09-10 (tnwjd060124@gmail.com) : time_zone 설정에 사용한 cursor close
+        2020-09-10 (tnwjd060124@gmail.com) : autocommit 비활성화 명시 (commit / rollback 으로 transaction 처리)
 
     """
 
@@ -26,18 +34,126 @@ def get_connection():
         password    = DATABASE["password"],
         database    = DATABASE["database"],
         charset     = DATABASE["charset"],
-        cursorclass = pymysql.cursors.DictCursor
+        cursorclass = pymysql.cursors.DictCursor,
+        autocommit  = False
     )
-    connection.cursor().execute("""SET time_zone='Asia/Seoul'""")
+    with connection.cursor() as cursor:
+        cursor.execute("""SET time_zone='Asia/Seoul'""")
 
     return connection
 
-def get_s3_connection():
-    s3_connection = boto3.client(
-        's3',
-        aws_access_key_id     = S3['aws_access_key_id'],
-        aws_secret_access_key = S3['aws_secret_access_key']
+# connection pool 설정 (config DATABASE 에 값이 없으면 기본값 사용)
+# pool_use_lifo 로 최근 사용한 connection 부터 재사용하므로 부하가 줄면 남는 connection 은
+# idle 상태로 남았다가 pool_recycle(초) 이 지나면 다시 연결된다
+engine = create_engine(
+    'mysql+pymysql://',
+    creator         = create_pymysql_connection,
+    poolclass       = QueuePool,
+    pool_size       = DATABASE.get('pool_size', 5),
+    max_overflow    = DATABASE.get('pool_max_overflow', 15),
+    pool_timeout    = DATABASE.get('pool_timeout', 30),
+    pool_recycle    = DATABASE.get('pool_recycle', 1800),
+    pool_pre_ping   = True,
+    pool_use_lifo   = True
+)
+
+@event.listens_for(engine, 'checkin')
+def release_last_result(dbapi_connection, connection_record):
+    """
+
+    connection 이 pool 로 반환될 때 마지막 query 결과를 해제
+    pymysql connection 은 다음 query 를 실행할 때까지 마지막 결과(_result)를 들고 있으므로
+    pool 에서 idle 상태로 있는 동안 결제 완료 리스트 같은 큰 결과가 메모리에 남지 않도록 한다
+
+    Args :
+        dbapi_connection  : pool 로 반환되는 pymysql connection 객체 (invalidate 된 경우 None)
+        connection_record : pool 의 connection record
+
+    Authors :
+        tnwjd060124@gmail.com (손수정)
+
+    History :
+        2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
+
+    """
+
+    if dbapi_connection is not None:
+        dbapi_connection._result = None
+
+def get_connection():
+    """
+
+    connection pool 에서 connection 을 꺼내서 반환
+    close() 호출 시 connection 이 끊기지 않고 pool 로 반환된다
+
+    Returns :
+        database connection 객체
+
+    Authors :
+        tnwjd060124@gmail.com (손수정)
+
+    History :
+        2020-08-19 (tnwjd060124@gmail.com) : 초기 생성
+        2020-09-08 (tnwjd060124@gmail.com) : connection pool 사용하도록 변경
+
+    """
+
+    return engine.raw_connection()
+
+s3_connection = boto3.client(
+    's3',
+    aws_access_key_id     = S3['aws_access_key_id'],
+    aws_secret_access_key = S3['aws_secret_access_key'],
+    config                = Config(
+        max_pool_connections = 64,
+        retries              = {'max_attempts' : 3, 'mode' : 'adaptive'},
+        s3                   = {'addressing_style' : 'virtual'}
     )
+)
+
+def get_s3_connection():
+    """
+
+    module 단위로 생성된 s3 client 반환
+    (boto3 client 는 thread-safe 하므로 요청마다 새로 만들지 않고 공유한다)
+
+    Returns :
+        s3 client 객체
+
+    Authors :
+        sincerity410@gmail.com (이곤호)
+
+    History :
+        2020-09-10 (sincerity410@gmail.com) : module 단위 client 공유하도록 변경
+
+    """
 
     return s3_connection
 
+redis_connection = redis.Redis(
+    connection_pool = redis.ConnectionPool(
+        host     = REDIS['host'],
+        port     = REDIS['port'],
+        db       = REDIS['db'],
+        password = REDIS.get('password')
+    )
+)
+
+def get_redis_connection():
+    """
+
+    module 단위로 생성된 redis client 반환
+    (connection pool 을 공유하므로 요청마다 새로 만들지 않는다)
+
+    Returns :
+        redis client 객체
+
+    Authors :
+        sincerity410@gmail.com (이곤호)
+
+    History :
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+    """
+
+    return redis_connection
@@ -1,13 +1,18 @@
+import csv, io
+
 from flask                      import (
     Blueprint,
+    Response,
     request,
-    jsonify
+    jsonify,
+    stream_with_context
 )
 from flask_request_validator    import (
     GET,
     PATH,
     Param,
     JSON,
+    Pattern,
     validate_params
 )
 
@@ -29,7 +34,10 @@ def create_admin_order_endpoints(order_service):
         Param('orderer', GET, str, required=False),
         Param('phoneNumber', GET, str, required=False),
         Param('productName', GET, str, required=False),
-        Param('toDate', GET, int, required=False, rules=[DatetimeRule()])
+        Param('toDate', GET, int, required=False, rules=[DatetimeRule()]),
+        Param('cursorTime', GET, str, required=False,
+            rules=[Pattern(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")]),
+        Param('cursorId', GET, int, required=False)
     )
     def order_list(*args):
 
@@ -52,7 +60,10 @@ def create_admin_order_endpoints(order_service):
                 'orderer'           : args[6],
                 'phone_number'      : args[7],
                 'product_name'      : args[8],
-                'to_date'           : args[9]
+                'to_date'           : args[9],
+                # 이전 page 마지막 row 의 order_time, order_product_no (keyset pagination)
+                'cursor_time'       : args[10],
+                'cursor_id'         : args[11]
             }
 
             if db_connection:
@@ -62,18 +73,16 @@ def create_admin_order_endpoints(order_service):
 
                 if filters:
 
-                    # filter 조건 정보에 해당하는 총 결제 완료 건수 조회
-                    count = order_service.get_total_number(filters, db_connection)
-
-                    if count:
+                    # filter 정보를 전달하여 결제 완료 리스트와 총 결제 완료 건수, 다음 page cursor 를 함께 가져와서 저장
+                    # (마지막 page 인 경우 next_cursor 는 None)
+                    result, count, next_cursor = order_service.get_order_list(filters, db_connection)
 
-                        # filter 정보를 전달하여 결제 완료 리스트 가져와서 result에 저장
-                        result = order_service.get_order_list(filters, db_connection)
+                    if count['total_number']:
 
                         if result:
 
-                            # 총 갯수와 result return
-                            return jsonify({"total_number" : count['total_number'], "data" : result}), 200
+                            # 총 갯수와 result, 다음 page 조회 시 사용할 cursor return
+                            return jsonify({"total_number" : count['total_number'], "data" : result, "next_cursor" : next_cursor}), 200
 
                         # page에 해당하는 data 없을 시
                         return jsonify({"total_number" : count['total_number'], "data" : []}),200
@@ -98,6 +107,127 @@ def create_admin_order_endpoints(order_service):
             if db_connection:
                 db_connection.close()
 
+    @admin_order_app.route('/orderCompletedList/export', methods=['GET'], endpoint='order_list_export')
+    @catch_exception
+    @validate_params(
+        Param('fromDate', GET, int, required=False, rules=[DatetimeRule()]),
+        Param('sort', GET, bool, default=False, required=False),
+        Param('orderId', GET, int, required=False),
+        Param('orderDetailId', GET, int, required=False),
+        Param('orderer', GET, str, required=False),
+        Param('phoneNumber', GET, str, required=False),
+        Param('productName', GET, str, required=False),
+        Param('toDate', GET, int, required=False, rules=[DatetimeRule()])
+    )
+    def order_list_export(*args):
+
+        """
+
+        결제 완료 리스트 전체를 CSV 파일로 내려줍니다.
+        server side cursor 로 조회한 row 를 하나씩 바로 응답에 써서 전체 결과를 메모리에 올리지 않습니다.
+
+        Args:
+            fromDate, sort, orderId, orderDetailId, orderer, phoneNumber, productName, toDate : 결제 완료 리스트 filter
+
+        Returns:
+            200 : text/csv 결제 완료 리스트
+            401 : INVALID_FILTER
+            400 : 정의하지 않은 에러
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                응답 전에 query 를 실행하고, 응답 종료 시 server side cursor 를 닫은 뒤 연결 반환
+
+        """
+
+        db_connection = None
+
+        try:
+
+            # db 연결
+            db_connection = get_connection()
+
+            # request의 filter 정보 저장
+            filter_info = {
+                'from_date'         : args[0],
+                'sort'              : args[1],
+                'order_id'          : args[2],
+                'order_detail_id'   : args[3],
+                'orderer'           : args[4],
+                'phone_number'      : args[5],
+                'product_name'      : args[6],
+                'to_date'           : args[7]
+            }
+
+            # filter 유효성 검사
+            filters = order_service.check_filter_list(filter_info)
+
+            # filter 조건 불충족
+            if not filters:
+                db_connection.close()
+                return jsonify({"message" : "INVALID_FILTER"}), 401
+
+            # query 실행과 첫 row 조회를 응답 전에 마쳐서 DB 에러는 아래 except 에서 400 으로 반환
+            cursor, first_order = order_service.export_order_list(filters, db_connection)
+
+        #정의하지 않은 모든 error를 잡아줌
+        except Exception as e:
+            if db_connection:
+                db_connection.close()
+            return jsonify({"message" : f'{e}'}), 400
+
+        columns = (
+            'order_time', 'order_no', 'order_detail_no', 'product_name', 'size', 'color',
+            'quantity', 'user_name', 'phone_number', 'order_status', 'total_price'
+        )
+
+        def generate():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+
+            writer.writerow(columns)
+
+            try:
+                order = first_order
+
+                while order is not None:
+                    writer.writerow([order[column] for column in columns])
+                    yield buffer.getvalue()
+
+                    buffer.seek(0)
+                    buffer.truncate(0)
+
+                    order = cursor.fetchone()
+
+                yield buffer.getvalue()
+
+            finally:
+                # 중간에 연결이 끊겨도 읽지 않은 row 를 모두 읽고 cursor 를 닫음
+                cursor.close()
+
+        def close_export():
+            # generator 가 시작되지 않은 경우에도 cursor 를 먼저 닫은 뒤 connection 을 pool 로 반환
+            # (읽지 않은 결과가 남은 connection 을 반환하면 pool 의 rollback 이 실패합니다.)
+            try:
+                cursor.close()
+            finally:
+                db_connection.close()
+
+        response = Response(
+            stream_with_context(generate()),
+            mimetype = 'text/csv',
+            headers  = {'Content-Disposition' : 'attachment; filename=order_completed_list.csv'}
+        )
+
+        # 응답 전송이 끝난 후에 cursor, db 연결을 닫습니다.
+        response.call_on_close(close_export)
+
+        return response
+
     @admin_order_app.route('/detail/<order_detail_id>', methods=['GET'], endpoint='get_order_detail')
     @catch_exception
     @validate_params(
@@ -200,6 +330,7 @@ def create_service_order_endpoints(order_service):
             2020-09-10 (minho.lee0716@gmail.com) : 추가
                 해당 상품의 구매 가능한 최소, 최대 수량을 가져와 받아온 수량을 확인하여
                 최소 구매 수량보다 적게 샀을 경우와 최대 구매 수량보다 많이 샀을 경우에 대한 에러처리를 하였습니다.
+            2020-09-10 (minho.lee0716@gmail.com) : 유저 존재 유무와 최소, 최대 구매 수량을 한 번의 조회로 확인
 
         """
 
@@ -223,21 +354,18 @@ def create_service_order_endpoints(order_service):
                 # 받아온 user_info객체에서 유저의 id를 가져옵니다.
                 user_no = user_info['user_no']
 
-                # 해당 유저의 정보가 올바른 유저인지 검사해줍니다.
-                user_existence = order_service.check_user_existence(user_no, db_connection)
+                # 유저의 존재 유무와 해당 상품의 구매가능한 최소수량과 최대수량을 한 번에 가져옵니다.
+                order_preconditions = order_service.get_order_preconditions(product_info, user_no, db_connection)
 
                 # 해당 유저의 정보가 없다면,
-                if user_existence is None:
+                if order_preconditions is None:
 
                     # UNAUTHORIZED 에러 메세지를 보내줍니다.
                     return jsonify({'message' : 'UNAUTHORIZED'}), 401
 
-                # 해당 상품의 구매가능한 최소수량과 최대수량의 개수를 가져옵니다.
-                product_quantity_range = order_service.get_product_quantity_range(product_info, db_connection)
-
                 # 가져온 최소, 최대 구매 가능한 상품의 수량을 각 변수에 담아줍니다.
-                min_q = product_quantity_range['min_sales_quantity']
-                max_q = product_quantity_range['max_sales_quantity']
+                min_q = order_preconditions['min_sales_quantity']
+                max_q = order_preconditions['max_sales_quantity']
 
                 # 구매하려고 하는 상품의 수량이 최소 구매 가능한 수량보다 작을 때
                 if product_info['quantity'] < min_q:
@@ -311,7 +439,7 @@ def create_service_order_endpoints(order_service):
             200 : message, SUCCESS
             400 : VALIDATION_ERROR
             400 : The maximum/minimum number of products that can be purchased is 'quantity' or more/less.
-            400 : The number of products available for purchase has been exceeded.
+            400 : OUT_OF_STOCK
             400 : Total price is incorrect.
             500 : NO_DATABASE_CONNECTION_ERROR
 
@@ -328,6 +456,10 @@ def create_service_order_endpoints(order_service):
             2020-09-10 (minho.lee0716@gmail.com) : 추가
                 프론트에서 받아온 구매할 상품에 대한 총 가격에이 DB에 있는 상품의 정보를 이용한 총 가격과 일치하는지
                 검사를 하였고, 일치해야만 주문이 진행되게 하였습니다.
+            2020-09-10 (minho.lee0716@gmail.com) : 주문 완료 후 결제 완료 건수, 주문자 정보 cache 무효화
+            2020-09-10 (minho.lee0716@gmail.com) : 유저 존재 유무, 상품 가격과 할인율, 최소, 최대 구매 수량을 한 번의 조회로 확인
+            2020-09-10 (minho.lee0716@gmail.com) : 주문 전후 재고 조회 대신 재고 차감 시 재고 부족(OUT_OF_STOCK) 확인
+            2020-09-10 (minho.lee0716@gmail.com) : 배송지 저장과 주문 생성을 명시적인 transaction 으로 처리
 
         """
 
@@ -358,11 +490,11 @@ def create_service_order_endpoints(order_service):
                 # 데코레이터에서 받은 user_info객체에서 user_no을 가져옵니다.
                 user_no = user_info['user_no']
 
-                # 해당 유저의 정보가 올바른 유저인지 검사해줍니다.
-                user_existence = order_service.check_user_existence(user_no, db_connection)
+                # 유저의 존재 유무, 상품의 가격과 할인율, 구매가능한 최소수량과 최대수량을 한 번에 가져옵니다.
+                order_preconditions = order_service.get_order_preconditions(order_info, user_no, db_connection)
 
                 # 해당 유저의 정보가 없다면,
-                if user_existence is None:
+                if order_preconditions is None:
 
                     # UNAUTHORIZED 에러 메세지를 보내줍니다.
                     return jsonify({'message' : 'UNAUTHORIZED'}), 401
@@ -370,12 +502,9 @@ def create_service_order_endpoints(order_service):
                 # user_no의 값을 쓰기 편하도록 order_info에 넣어줍니다.
                 order_info['user_no'] = user_no
 
-                # 해당 상품의 구매가능한 최소수량과 최대수량의 개수를 가져와 product_quantity_range라는 변수에 담아줍니다.
-                product_quantity_range = order_service.get_product_quantity_range(order_info, db_connection)
-
                 # 가져온 최소, 최대 구매 가능한 상품의 수량을 각 변수에 담아줍니다.
-                min_q = product_quantity_range['min_sales_quantity']
-                max_q = product_quantity_range['max_sales_quantity']
+                min_q = order_preconditions['min_sales_quantity']
+                max_q = order_preconditions['max_sales_quantity']
 
                 # 구매하려고 하는 상품의 수량이 최소 구매 가능한 수량보다 적을 때
                 if order_info['quantity'] < min_q:
@@ -389,18 +518,9 @@ def create_service_order_endpoints(order_service):
                     # 최대 n개 이하의 수량을 구매해야 한다고 에러 메세지를 보내줍니다.
                     return jsonify({'message' : f"The maximum number of products that can be purchased is {max_q} or less."}), 400
 
-                # 상품을 주문하기 전, 현재 선택한 옵션의 상품 재고를 가져오는 메소드를 실행 후, 변수에 담아줍니다.
-                current_quantity = order_service.get_current_quantity(order_info, db_connection)
-
-                # 만약 사용자가 구매하려는 상품의 개수가 현재 재고보다 많다면,
-                if order_info['quantity'] > current_quantity['current_quantity']:
-
-                    # 구매 가능한 상품의 수가 초과되었다고 에러를 보내줍니다.
-                    return jsonify({'message' : 'The number of products available for purchase has been exceeded.'}), 400
-
                 # 구매하고자 하는 수량에 문제가 없다면, 유저가 구매하고자 하는 수량에 대해 총 가격에 대한 검사를 해줍니다.
-                # 먼저 주문 정보를 알려준 후, 총 가격을 계산해주는 메소드를 실행하여 total_price라는 변수에 넣어줍니다.
-                total_price = order_service.check_total_price(order_info, db_connection)
+                # 미리 가져온 상품의 가격과 할인율로 총 가격을 계산해주는 메소드를 실행하여 total_price라는 변수에 넣어줍니다.
+                total_price = order_service.check_total_price(order_info, order_preconditions)
 
                 # 만약 프론트에서 계산한 총 가격과, DB에서 계산한 총 가격이 다르다면,
                 if order_info['total_price'] != total_price:
@@ -409,22 +529,24 @@ def create_service_order_endpoints(order_service):
                     return jsonify({'message' : 'Total price is incorrect.'}), 400
 
                 # 프론트에서 계산한 총 가격이 문제가 없다면 결제를 이어서 진행합니다.
-                # 만약 사용자가 구매하려는 상품의 개수가 현재 재고와 작거나 같다면 이어서 결제를 진행합니다.
+                # 배송지 저장부터 주문 생성, 재고 차감까지를 하나의 transaction 으로 묶어 commit 또는 rollback 합니다.
+                db_connection.begin()
+
                 # 구매하기전, 해당 유저의 배송지 정보를 추가 또는 변경해주는 메소드를 호출합니다.
                 order_service.modify_user_shipping_details(order_info, db_connection)
 
                 # order의 정보를 인자로 넘겨 주문이력을 생성하는 메소드를 호출해 줍니다.
+                # 재고 차감은 현재 재고가 구매 수량 이상일 때만 이루어지며, 재고가 부족하면 OUT_OF_STOCK 에러가 발생합니다.
                 order_service.create_order_completed(order_info, db_connection)
 
-                # 마지막으로 상품결제를 하고, 한번 더 검사를 해줍니다.
-                # DB에 현재 옵션에 대한 재고가 0보다 작다면,
-                if order_service.get_current_quantity(order_info, db_connection)['current_quantity'] < 0:
+                # 주문이 정상적으로 생성되었다면 DB에 저장을 해줍니다.
+                db_connection.commit()
 
-                    # 똑같이 구매 가능한 상품의 수가 초과되었다고 에러를 보내줍니다.
-                    return jsonify({'message' : 'The number of products available for purchase has been exceeded.'}), 400
+                # 주문이 추가되었으므로 cache 된 결제 완료 건수를 무효화합니다.
+                order_service.invalidate_total_number()
 
-                # 만약 재고가 0개 이상이라면 DB에 정상적으로 저장을 해줍니다.
-                db_connection.commit()
+                # 배송지 정보가 추가 또는 변경되었으므로 cache 된 주문자 정보를 삭제합니다.
+                order_service.invalidate_orderer_info(user_no)
 
                 return jsonify({'message' : 'SUCCESS'}), 200
 
@@ -435,7 +557,8 @@ def create_service_order_endpoints(order_service):
         except Exception as e:
 
             # DB를 원래대로 되돌립니다.
-            db_connection.rollback()
+            if db_connection:
+                db_connection.rollback()
             return jsonify({"message" : f"{e}"}), 400
 
         finally:
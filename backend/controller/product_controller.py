@@ -1,12 +1,13 @@
 from utils import ResizeImage, login_required
 from decimal import *
 from datetime import *
-import pymysql, json
+import hashlib, orjson, time
 
 from flask import (
     request,
     Blueprint,
-    jsonify
+    jsonify,
+    g
 )
 from flask_request_validator    import (
     GET,
@@ -17,14 +18,90 @@ from flask_request_validator    import (
     validate_params
 )
 
-from connection import get_connection, get_s3_connection
-from utils      import (
+from connection              import get_s3_connection, get_redis_connection
+from service.product_service import PRODUCT_LIST_VERSION_KEY
+from tasks                   import process_product_images
+from utils                   import (
     DatetimeRule,
     PageRule,
     LimitRule,
-    catch_exception
+    OptionQuantityRule,
+    catch_exception,
+    fast_validate_params,
+    stream_form_data,
+    with_db,
+    dumps_json,
+    fast_json
 )
 
+# 상품등록 시 사용되는 기준 정보(옵션, 카테고리) cache 설정
+REFERENCE_CACHE_TTL     = 600
+OPTION_CACHE_KEY        = 'opt:all'
+MAIN_CATEGORY_CACHE_KEY = 'maincat:all'
+SUB_CATEGORY_CACHE_KEY  = 'subcat:{}'
+
+# 상품 List cache 설정 (상품 변경 시 version 을 올려 기존 cache 전체를 무효화)
+# (version key 는 상품관리 List 의 Total Count cache 와 공유)
+PRODUCT_LIST_CACHE_TTL   = 60
+PRODUCT_LIST_CACHE_KEY   = 'prodlist:v{}:{}'
+
+def get_product_list_version(redis_connection):
+    """
+
+    상품 변경 시 증가하는 상품 List version 반환
+
+    Args:
+        redis_connection : redis client
+
+    Returns:
+        상품 List version (int)
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+    """
+
+    return int(redis_connection.get(PRODUCT_LIST_VERSION_KEY) or 0)
+
+def get_product_list_cache_key(redis_connection, filter_info=None, version=None):
+    """
+
+    상품 List cache key 생성
+    filter 조건을 JSON 으로 직렬화한 뒤 hash 값을 key 로 사용
+
+    Args:
+        redis_connection : redis client
+        filter_info      : 상품 List filter 조건 tuple (None 일 경우 전체 List)
+        version          : 이미 조회한 상품 List version (None 일 경우 redis 에서 조회)
+
+    Returns:
+        'prodlist:v{version}:{filter hash}' 형태의 cache key
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기생성
+        2020-09-10 (sincerity410@gmail.com) : filter 조건을 위치 인자 tuple 로 전달받도록 변경
+
+    """
+
+    if version is None:
+        version = get_product_list_version(redis_connection)
+
+    if filter_info is None:
+        return PRODUCT_LIST_CACHE_KEY.format(version, 'all')
+
+    filter_hash = hashlib.blake2b(
+        orjson.dumps(filter_info),
+        digest_size = 16
+    ).hexdigest()
+
+    return PRODUCT_LIST_CACHE_KEY.format(version, filter_hash)
+
 def create_admin_product_endpoints(product_service):
 
     # 'admin/product' end point prefix 설정
@@ -32,6 +109,15 @@ def create_admin_product_endpoints(product_service):
 
     @admin_product_app.route('', methods=['POST'])
     @catch_exception
+    @stream_form_data(
+        form_fields = [
+            'mainCategoryId', 'subCategoryId', 'sellYn', 'exhibitionYn', 'productName',
+            'simpleDescription', 'detailInformation', 'price', 'discountRate',
+            'discountStartDate', 'discountEndDate', 'minSalesQuantity', 'maxSalesQuantity',
+            'optionQuantity'
+        ],
+        file_fields = [f'product_image_{number}' for number in range(1, 6)]
+    )
     @validate_params(
         Param('mainCategoryId', FORM, str, rules = [Pattern(r'^([1-9]|1[0-1])$')]),
         Param('subCategoryId', FORM, str, rules = [Pattern(r'^([1-9]|[1-5][0-9]|6[0-2])$')]),
@@ -49,9 +135,10 @@ def create_admin_product_endpoints(product_service):
              rules = [Pattern(r"^\d\d\d\d-(0?[1-9]|1[0-2])-(0?[1-9]|[12][0-9]|3[01]) (00|[0-9]|1[0-9]|2[0-3]):([0-9]|[0-5][0-9])$")]),
         Param('minSalesQuantity', FORM, str, rules = [Pattern(r"^([1-9]|1[0-9]|20)$")]),
         Param('maxSalesQuantity', FORM, str, rules = [Pattern(r"^([1-9]|1[0-9]|20)$")]),
-        Param('optionQuantity', FORM, str)
+        Param('optionQuantity', FORM, str, rules = [OptionQuantityRule()])
     )
-    def product_register(*args):
+    @with_db()
+    def product_register(db_connection, *args):
 
         """
 
@@ -83,8 +170,22 @@ def create_admin_product_endpoints(product_service):
             request.files
                 product_image_(No.) : 상품이미지 파일(Number: 1-5)
 
+            request.json: (이미지를 미리 업로드 한 경우, request.form 과 같은 key 사용)
+                imageUrls : 사이즈 별 상품이미지 URL List(최대 5개, 첫번째가 대표사진)
+                            ([GET] /admin/product/image/presign 으로 발급받은 public_url 만 허용)
+                    {
+                        product_image_L : Large 사이즈 url
+                        product_image_M : Medium 사이즈 url
+                        product_image_S : Small 사이즈 url
+                    }
+
         Returns:
-            200 : SUCCESS, 상품등록 완료 message
+            200 : SUCCESS, 상품등록 완료 message (json 요청)
+            202 : 상품정보 저장 완료, 이미지 처리 중
+                {
+                    product_id : 등록된 상품 id,
+                    status     : "processing"
+                }
             400 : VALIDATION_ERROR, KEY_ERROR
             500 : NO_DATABASE_CONNECTION_ERROR
 
@@ -99,88 +200,82 @@ def create_admin_product_endpoints(product_service):
             2020-09-02 (sincerity410@gmail.com) : product_code column 추가에 따른 구조 수정
             2020-09-08 (sincerity410@gmail.com) : request Validation Check 추가
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2020-09-10 (sincerity410@gmail.com) : 등록 완료 시 기준 정보, 상품 List cache 무효화
+            2020-09-10 (sincerity410@gmail.com) : streaming-form-data 로 multipart parsing
+            2020-09-10 (sincerity410@gmail.com) : with_db 데코레이터로 connection 관리
+            2020-09-10 (sincerity410@gmail.com) : 이미지 처리를 background worker 로 분리, 202 Return
+            2020-09-10 (sincerity410@gmail.com) : 이미지 URL 을 전달하는 application/json 요청 처리 추가
+            2020-09-10 (sincerity410@gmail.com) : optionQuantity 형식 Validation Check 추가
+            2020-09-10 (sincerity410@gmail.com) : 상품 원본 이미지를 임시 파일 대신 S3에 임시 저장
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
+        product_info = {
+            'mainCategoryId'    : args[0],
+            'subCategoryId'     : args[1],
+            'sellYn'            : args[2],
+            'exhibitionYn'      : args[3],
+            'productName'       : args[4],
+            'simpleDescription' : args[5],
+            'detailInformation' : args[6],
+            'price'             : args[7],
+            'discountRate'      : args[8],
+            'discountStartDate' : args[9],
+            'discountEndDate'   : args[10],
+            'minSalesQuantity'  : args[11],
+            'maxSalesQuantity'  : args[12],
+            'optionQuantity'    : args[13]
+        }
+
+        if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
+            product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
+
+        # 이미지를 미리 업로드하고 URL만 전달하는 json 요청은 resize, S3 upload 없이 바로 등록
+        if request.is_json:
+            product_id = product_service.create_product(product_info, db_connection)
+            product_service.register_product_image_url(g.image_urls, product_id, db_connection)
+
+            # cache 무효화 전에 변경 내역이 반영되도록 먼저 commit 처리
+            db_connection.commit()
+
+            # 상품등록에 사용된 기준 정보, 상품 List cache 무효화
+            get_redis_connection().delete(
+                OPTION_CACHE_KEY,
+                MAIN_CATEGORY_CACHE_KEY,
+                SUB_CATEGORY_CACHE_KEY.format(product_info['mainCategoryId'])
+            )
+            get_redis_connection().incr(PRODUCT_LIST_VERSION_KEY)
 
-        try:
+            return fast_json({'message' : 'SUCCESS', 'product_id' : product_id})
 
-            db_connection = get_connection()
+        # 상품이미지 유효성 검사는 상품정보 저장 전에 요청 안에서 수행
+        product_images = product_service.validate_product_image(request.files)
 
-            if db_connection:
+        # 상품정보를 DB에 저장하는 Function 실행
+        product_id = product_service.create_product(product_info, db_connection)
 
-                product_info = {
-                    'mainCategoryId'    : args[0],
-                    'subCategoryId'     : args[1],
-                    'sellYn'            : args[2],
-                    'exhibitionYn'      : args[3],
-                    'productName'       : args[4],
-                    'simpleDescription' : args[5],
-                    'detailInformation' : args[6],
-                    'price'             : args[7],
-                    'discountRate'      : args[8],
-                    'discountStartDate' : args[9],
-                    'discountEndDate'   : args[10],
-                    'minSalesQuantity'  : args[11],
-                    'maxSalesQuantity'  : args[12],
-                    'optionQuantity'    : args[13]
-                }
+        # web 서버와 worker 가 파일 시스템을 공유하지 않아도 되도록 상품 원본 이미지를 S3에 임시 저장
+        staged_images = product_service.stage_product_image(product_images, product_id, get_s3_connection())
 
-                if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
-                    product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
-
-                # 사이즈 별(Large, Medium, Small) 상품이미지 저장 위한 S3 Connection Instance 생성
-                s3_connection = get_s3_connection()
-                images        = request.files
-
-                # 상품정보를 DB에 저장하는 Function 실행
-                product_id = product_service.create_product(product_info, db_connection)
-
-                # 상품이미지를 사이즈 별로 S3에 저장 및 URL을 DB에 Insert 하는 Function 실행
-                product_service.upload_product_image(
-                    images,
-                    product_id,
-                    s3_connection,
-                    db_connection
-                )
-
-                # Exception이 발생하지 않았다면, commit 처리
-                db_connection.commit()
-
-                return jsonify({'message' : 'SUCCESS'}), 200
-
-        except pymysql.err.InternalError:
-            db_connection.rollback()
-            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
-        except pymysql.err.OperationalError:
-            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
-        except pymysql.err.ProgrammingError:
-            db_connection.rollback()
-            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
-        except pymysql.err.IntegrityError:
-            db_connection.rollback()
-            return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
-        except pymysql.err.DataError:
-            db_connection.rollback()
-            return jsonify({'message' : 'DATA_ERROR'}), 400
-        except KeyError:
-            db_connection.rollback()
-            return jsonify({'message' 'KEY_ERROR'}), 400
-        except json.decoder.JSONDecodeError as e:
-            db_connection.rollback()
-            return jsonify({'message' : 'optionQuantity_VALUE_INVALID_JSON'}), 400
-        except Exception as e:
-            db_connection.rollback()
-            return jsonify({'message' : f'{e}'}), 500
+        # 상품 이미지 처리 작업이 상품정보를 조회할 수 있도록 먼저 commit 처리
+        db_connection.commit()
+
+        # 상품등록에 사용된 기준 정보 cache 무효화
+        get_redis_connection().delete(
+            OPTION_CACHE_KEY,
+            MAIN_CATEGORY_CACHE_KEY,
+            SUB_CATEGORY_CACHE_KEY.format(product_info['mainCategoryId'])
+        )
 
-        finally:
-            if db_connection:
-                db_connection.close()
+        # 사이즈 별 resize, S3 저장 및 URL Insert 는 background worker 에서 처리
+        # (이미지 저장이 끝나면 worker 에서 상품 List cache 무효화)
+        process_product_images.delay(product_id, staged_images, PRODUCT_LIST_VERSION_KEY)
+
+        return fast_json({'product_id' : product_id, 'status' : 'processing'}, 202)
 
     @admin_product_app.route('/option', methods=['GET'])
-    def option_list():
+    @with_db()
+    def option_list(db_connection):
 
         """
 
@@ -213,40 +308,27 @@ def create_admin_product_endpoints(product_service):
             2020-08-29 (sincerity410@gmail.com) : 초기생성
             2020-09-02 (sincerity410@gmail.com) : 옵션(색상, 사이즈) 통합 형태로 제공
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2020-09-10 (sincerity410@gmail.com) : Redis cache 적용
+            2020-09-10 (sincerity410@gmail.com) : with_db 데코레이터로 connection 관리
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
+        # cache 에 저장된 옵션 List 가 있다면 DB 조회 없이 반환
+        redis_connection = get_redis_connection()
+        cached_options   = redis_connection.get(OPTION_CACHE_KEY)
 
-        try:
-            db_connection = get_connection()
-            if db_connection:
-
-                # get_option_list 함수 호출해 색상 List 받아오기
-                options = product_service.get_option_list(db_connection)
-
-                return jsonify({'data' : options}), 200
-
-        except pymysql.err.InternalError:
-            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
-        except pymysql.err.OperationalError:
-            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
-        except pymysql.err.ProgrammingError:
-            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
-        except pymysql.err.IntegrityError:
-            return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
-        except pymysql.err.DataError:
-            return jsonify({'message' : 'DATA_ERROR'}), 400
-        except Exception as e:
-            return jsonify({'message' : f'{e}'}), 500
+        if cached_options:
+            return fast_json({'data' : orjson.loads(cached_options)})
+
+        # get_option_list 함수 호출해 색상 List 받아오기
+        options = product_service.get_option_list(db_connection)
+        redis_connection.setex(OPTION_CACHE_KEY, REFERENCE_CACHE_TTL, dumps_json(options))
 
-        finally:
-            if db_connection:
-                db_connection.close()
+        return fast_json({'data' : options})
 
     @admin_product_app.route('/category', methods=['GET'])
-    def main_category_list():
+    @with_db()
+    def main_category_list(db_connection):
 
         """
 
@@ -270,45 +352,31 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2020-09-10 (sincerity410@gmail.com) : Redis cache 적용
+            2020-09-10 (sincerity410@gmail.com) : with_db 데코레이터로 connection 관리
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
+        # cache 에 저장된 Main Category List 가 있다면 DB 조회 없이 반환
+        redis_connection     = get_redis_connection()
+        cached_main_category = redis_connection.get(MAIN_CATEGORY_CACHE_KEY)
 
-        try:
-            db_connection = get_connection()
-
-            if db_connection:
-
-                # get_main_category_list 함수 호출해 Main Category List 받아오기
-                main_category = product_service.get_main_category_list(db_connection)
+        if cached_main_category:
+            return fast_json({'data' : orjson.loads(cached_main_category)})
 
-                return jsonify({'data' : main_category}), 200
-
-        except pymysql.err.InternalError:
-            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
-        except pymysql.err.OperationalError:
-            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
-        except pymysql.err.ProgrammingError:
-            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
-        except pymysql.err.IntegrityError:
-            return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
-        except pymysql.err.DataError:
-            return jsonify({'message' : 'DATA_ERROR'}), 400
-        except Exception as e:
-            return jsonify({'message' : f'{e}'}), 500
+        # get_main_category_list 함수 호출해 Main Category List 받아오기
+        main_category = product_service.get_main_category_list(db_connection)
+        redis_connection.setex(MAIN_CATEGORY_CACHE_KEY, REFERENCE_CACHE_TTL, dumps_json(main_category))
 
-        finally:
-            if db_connection:
-                db_connection.close()
+        return fast_json({'data' : main_category})
 
     @admin_product_app.route('/category/<main_category_id>', methods=['GET'])
     @catch_exception
-    @validate_params(
+    @fast_validate_params(
         Param('main_category_id', PATH, int)
     )
-    def sub_category_list(*args):
+    @with_db()
+    def sub_category_list(db_connection, *args):
 
         """
 
@@ -336,46 +404,31 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2020-09-10 (sincerity410@gmail.com) : Redis cache 적용
+            2020-09-10 (sincerity410@gmail.com) : with_db 데코레이터로 connection 관리
+            2020-09-10 (sincerity410@gmail.com) : 사전 생성된 spec 으로 유효성 검사(fast_validate_params)
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
-        try:
-            db_connection = get_connection()
+        main_category_id = args[0]
 
-            if db_connection:
+        # cache 에 저장된 Sub Category List 가 있다면 DB 조회 없이 반환
+        redis_connection    = get_redis_connection()
+        sub_category_key    = SUB_CATEGORY_CACHE_KEY.format(main_category_id)
+        cached_sub_category = redis_connection.get(sub_category_key)
 
-                main_category_id = args[0]
+        if cached_sub_category:
+            return fast_json({'data' : orjson.loads(cached_sub_category)})
 
-                # sub_category_list 함수 호출해 Sub Category List 받아오기
-                sub_category = product_service.get_sub_category_list(main_category_id, db_connection)
+        # sub_category_list 함수 호출해 Sub Category List 받아오기
+        sub_category = product_service.get_sub_category_list(main_category_id, db_connection)
+        redis_connection.setex(sub_category_key, REFERENCE_CACHE_TTL, dumps_json(sub_category))
 
-                return jsonify({'data' : sub_category}), 200
-
-        except pymysql.err.InternalError:
-            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
-        except pymysql.err.OperationalError:
-            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
-        except pymysql.err.ProgrammingError:
-            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
-        except pymysql.err.IntegrityError:
-            return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
-        except pymysql.err.DataError:
-            return jsonify({'message' : 'DATA_ERROR'}), 400
-        except KeyError:
-            return jsonify({'message' 'KEY_ERROR'}), 400
-        except Exception as e:
-            return jsonify({'message' : f'{e}'}), 500
-
-        finally:
-            if db_connection:
-                db_connection.close()
+        return fast_json({'data' : sub_category})
 
     @admin_product_app.route('', methods=['GET'])
     @catch_exception
-    @validate_params(
+    @fast_validate_params(
         Param('sellYn', GET, str, required=False, rules = [Pattern(r'^([0-1])$')]),
         Param('discountYn', GET, str, required=False, rules = [Pattern(r'^([0-1])$')]),
         Param('exhibitionYn', GET, str, required=False, rules = [Pattern(r'^([0-1])$')]),
@@ -387,8 +440,8 @@ def create_admin_product_endpoints(product_service):
         Param('page', GET, int, rules=[PageRule()]),
         Param('limit', GET, int, rules=[LimitRule()])
     )
-
-    def registered_product_list(*args):
+    @with_db()
+    def registered_product_list(db_connection, *args):
 
         """
 
@@ -442,53 +495,28 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-08-31 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2020-09-10 (sincerity410@gmail.com) : filter 조건 별 Redis cache 적용
+            2020-09-10 (sincerity410@gmail.com) : with_db 데코레이터로 connection 관리
+            2020-09-10 (sincerity410@gmail.com) : 사전 생성된 spec 으로 유효성 검사(fast_validate_params)
+            2020-09-10 (sincerity410@gmail.com) : filter 조건을 위치 인자로 service 에 전달
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
+        # 동일한 filter 조건의 cache 가 있다면 DB 조회 없이 반환
+        # (args 순서: sellYn, discountYn, exhibitionYn, startDate, endDate,
+        #             productName, productNo, productCode, page, limit)
+        redis_connection    = get_redis_connection()
+        cache_key           = get_product_list_cache_key(redis_connection, args)
+        cached_product_list = redis_connection.get(cache_key)
 
-        try:
-            db_connection = get_connection()
-
-            if db_connection:
-
-                filter_info = {
-                    'sellYn'       : args[0],
-                    'discountYn'   : args[1],
-                    'exhibitionYn' : args[2],
-                    'startDate'    : args[3],
-                    'endDate'      : args[4],
-                    'productName'  : args[5],
-                    'productNo'    : args[6],
-                    'productCode'  : args[7],
-                    'page'         : args[8],
-                    'limit'        : args[9]
-                }
+        if cached_product_list:
+            return fast_json({'data' : orjson.loads(cached_product_list)})
 
-                # 상품 List, Totacl Count 받는 service 함수 호출 
-                product_list = product_service.get_registered_product_list(filter_info, db_connection)
-
-                return jsonify({'data' : product_list}), 200
-
-        except pymysql.err.InternalError:
-            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
-        except pymysql.err.OperationalError:
-            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
-        except pymysql.err.ProgrammingError:
-            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
-        except pymysql.err.IntegrityError:
-            return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
-        except pymysql.err.DataError:
-            return jsonify({'message' : 'DATA_ERROR'}), 400
-        except KeyError:
-            return jsonify({'message' 'KEY_ERROR'}), 400
-        except Exception as e:
-            return jsonify({'message' : f'{e}'}), 500
+        # 상품 List, Totacl Count 받는 service 함수 호출 
+        product_list = product_service.get_registered_product_list(*args, db_connection)
+        redis_connection.setex(cache_key, PRODUCT_LIST_CACHE_TTL, dumps_json(product_list))
 
-        finally:
-            if db_connection:
-                db_connection.close()
+        return fast_json({'data' : product_list})
 
     @admin_product_app.route('/detail-image', methods=['POST'])
     def product_detail_image_upload():
@@ -527,7 +555,100 @@ def create_admin_product_endpoints(product_service):
                 s3_connection
             )
 
-            return jsonify(image_url_info), 200
+            return fast_json(image_url_info)
+
+        except Exception as e:
+            return jsonify({'message' : f"{e}"}), 400
+
+    @admin_product_app.route('/detail-image/presign', methods=['GET'])
+    @catch_exception
+    @validate_params(
+        Param('contentType', GET, str, rules = [Pattern(r'^image/[a-z0-9.+-]+$')])
+    )
+    def product_detail_image_presign(*args):
+
+        """
+
+        [상품관리 > 상품등록] - 엔드포인트 Function
+        [GET] http://ip:5000/admin/product/detail-image/presign?contentType=image/jpeg
+
+        Args:
+            Parameter:
+                contentType : 업로드 할 이미지의 Content-Type
+
+        Returns:
+            200 :
+                {
+                    url        : S3 presigned PUT URL (5분간 유효),
+                    fileName   : S3 object key,
+                    public_url : 업로드 완료 후 상세 설명에 사용할 image URL
+                }
+            400 : VALIDATION_ERROR
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+        """
+
+        try:
+            # 상품의 상세 설명 이미지를 브라우저에서 S3로 직접 올리기 위한 URL 발급
+            s3_connection   = get_s3_connection()
+            upload_url_info = product_service.create_detail_image_upload_url(
+                args[0],
+                s3_connection
+            )
+
+            return fast_json(upload_url_info)
+
+        except Exception as e:
+            return jsonify({'message' : f"{e}"}), 400
+
+    @admin_product_app.route('/image/presign', methods=['GET'])
+    @catch_exception
+    @validate_params(
+        Param('contentType', GET, str, rules = [Pattern(r'^image/[a-z0-9.+-]+$')])
+    )
+    def product_image_presign(*args):
+
+        """
+
+        [상품관리 > 상품등록] - 엔드포인트 Function
+        [GET] http://ip:5000/admin/product/image/presign?contentType=image/jpeg
+
+        Args:
+            Parameter:
+                contentType : 업로드 할 이미지의 Content-Type
+
+        Returns:
+            200 :
+                {
+                    product_image_L : { url : S3 presigned PUT URL (5분간 유효), fileName : S3 object key, public_url : image URL },
+                    product_image_M : { url : S3 presigned PUT URL (5분간 유효), fileName : S3 object key, public_url : image URL },
+                    product_image_S : { url : S3 presigned PUT URL (5분간 유효), fileName : S3 object key, public_url : image URL }
+                }
+            400 : VALIDATION_ERROR
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+        """
+
+        try:
+            # 상품 이미지 1개의 사이즈 별(L, M, S) 이미지를 브라우저에서 S3로 직접 올리기 위한 URL 발급
+            # (업로드 후 public_url 을 상품등록 json 요청의 imageUrls 로 전달)
+            s3_connection   = get_s3_connection()
+            upload_url_info = product_service.create_product_image_upload_url(
+                args[0],
+                s3_connection
+            )
+
+            return fast_json(upload_url_info)
 
         except Exception as e:
             return jsonify({'message' : f"{e}"}), 400
@@ -537,7 +658,8 @@ def create_admin_product_endpoints(product_service):
     @validate_params(
         Param('product_id', PATH, int)
     )
-    def product_detail(*args):
+    @with_db()
+    def product_detail(db_connection, *args):
 
         """
 
@@ -565,42 +687,16 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-09-05 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2020-09-10 (sincerity410@gmail.com) : with_db 데코레이터로 connection 관리
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
-        try:
-            db_connection = get_connection()
-
-            if db_connection:
-
-                product_id = args[0]
+        product_id = args[0]
 
-                # sub_category_list 함수 호출해 Sub Category List 받아오기
-                product_info = product_service.get_product_detail(product_id, db_connection)
+        # sub_category_list 함수 호출해 Sub Category List 받아오기
+        product_info = product_service.get_product_detail(product_id, db_connection)
 
-                return jsonify({'data' : product_info}), 200
-
-        except pymysql.err.InternalError:
-            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
-        except pymysql.err.OperationalError:
-            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
-        except pymysql.err.ProgrammingError:
-            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
-        except pymysql.err.IntegrityError:
-            return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
-        except pymysql.err.DataError:
-            return jsonify({'message' : 'DATA_ERROR'}), 400
-        except KeyError:
-            return jsonify({'message' 'KEY_ERROR'}), 400
-        except Exception as e:
-            return jsonify({'message' : f'{e}'}), 500
-
-        finally:
-            if db_connection:
-                db_connection.close()
+        return fast_json({'data' : product_info})
 
     @admin_product_app.route('/<product_id>', methods=['PUT'])
     @catch_exception
@@ -622,9 +718,10 @@ def create_admin_product_endpoints(product_service):
              rules = [Pattern(r"^\d\d\d\d-(0?[1-9]|1[0-2])-(0?[1-9]|[12][0-9]|3[01]) (00|[0-9]|1[0-9]|2[0-3]):([0-9]|[0-5][0-9])$")]),
         Param('minSalesQuantity', FORM, str, rules = [Pattern(r"^([1-9]|1[0-9]|20)$")]),
         Param('maxSalesQuantity', FORM, str, rules = [Pattern(r"^([1-9]|1[0-9]|20)$")]),
-        Param('optionQuantity', FORM, str)
+        Param('optionQuantity', FORM, str, rules = [OptionQuantityRule()])
     )
-    def product_modify(*args):
+    @with_db()
+    def product_modify(db_connection, *args):
 
         """
 
@@ -667,96 +764,65 @@ def create_admin_product_endpoints(product_service):
         History:
             2020-09-06 (sincerity410@gmail.com) : 초기생성
             2020-09-09 (sincerity410@gmail.com) : Validation Check 고도화
+            2020-09-10 (sincerity410@gmail.com) : 수정 완료 시 상품 List cache 무효화
+            2020-09-10 (sincerity410@gmail.com) : with_db 데코레이터로 connection 관리
+            2020-09-10 (sincerity410@gmail.com) : optionQuantity 형식 Validation Check 추가
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
-        try:
-
-            db_connection = get_connection()
-
-            if db_connection:
-
-                product_id   = args[0]
-                product_info = {
-                    'mainCategoryId'    : int(args[1]),
-                    'subCategoryId'     : int(args[2]),
-                    'sellYn'            : int(args[3]),
-                    'exhibitionYn'      : int(args[4]),
-                    'productName'       : args[5],
-                    'simpleDescription' : args[6],
-                    'detailInformation' : args[7],
-                    'price'             : args[8],
-                    'discountRate'      : int(args[9]),
-                    'discountStartDate' : args[10],
-                    'discountEndDate'   : args[11],
-                    'minSalesQuantity'  : int(args[12]),
-                    'maxSalesQuantity'  : int(args[13]),
-                    'optionQuantity'    : args[14]
-                }
-
-                if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
-                    product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
-
-                # DB 저장 내역과 비교를 위한 price value Decimal 변경
-                product_info['price'] = round(Decimal(product_info['price']),2)
-
-                # DB 저장 내역과 비교를 위한 discountStartDate, discountEndDate datetime 형태로 변경
-                if product_info['discountStartDate'] is not None:
-                    product_info['discountStartDate'] = datetime.strptime(product_info['discountStartDate'], '%Y-%m-%d %H:%M')
-                if product_info['discountEndDate'] is not None:
-                    product_info['discountEndDate'] = datetime.strptime(product_info['discountEndDate'], '%Y-%m-%d %H:%M')
-
-                # 사이즈 별(Large, Medium, Small) 상품이미지 저장 위한 S3 Connection Instance 생성
-                s3_connection = get_s3_connection()
-                images        = request.files
-
-                # 상품정보를 DB에 저장하는 Function 실행
-                product_service.update_product(product_id, product_info, db_connection)
-
-                # 기존 상품 이미지(product_images, images)를 제거하고
-                # 업데이트한 상품이미지를 사이즈 별로 S3에 저장 및 URL을 DB에 Insert 하는 Function 실행
-                product_service.update_product_image(
-                    images,
-                    product_id,
-                    s3_connection,
-                    db_connection
-                )
-
-                # Exception이 발생하지 않았다면, commit 처리
-                db_connection.commit()
-
-                return jsonify({'message' : 'SUCCESS'}), 200
-
-        except pymysql.err.InternalError:
-            db_connection.rollback()
-            return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
-        except pymysql.err.OperationalError:
-            return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
-        except pymysql.err.ProgrammingError:
-            db_connection.rollback()
-            return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
-        except pymysql.err.IntegrityError:
-            db_connection.rollback()
-            return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
-        except pymysql.err.DataError:
-            db_connection.rollback()
-            return jsonify({'message' : 'DATA_ERROR'}), 400
-        except KeyError:
-            db_connection.rollback()
-            return jsonify({'message' 'KEY_ERROR'}), 400
-        except json.decoder.JSONDecodeError as e:
-            db_connection.rollback()
-            return jsonify({'message' : 'optionQuantity_VALUE_INVALID_JSON'}), 400
-        except Exception as e:
-            db_connection.rollback()
-            return jsonify({'message' : f'{e}'}), 500
-
-        finally:
-            if db_connection:
-                db_connection.close()
+        product_id   = args[0]
+        product_info = {
+            'mainCategoryId'    : int(args[1]),
+            'subCategoryId'     : int(args[2]),
+            'sellYn'            : int(args[3]),
+            'exhibitionYn'      : int(args[4]),
+            'productName'       : args[5],
+            'simpleDescription' : args[6],
+            'detailInformation' : args[7],
+            'price'             : args[8],
+            'discountRate'      : int(args[9]),
+            'discountStartDate' : args[10],
+            'discountEndDate'   : args[11],
+            'minSalesQuantity'  : int(args[12]),
+            'maxSalesQuantity'  : int(args[13]),
+            'optionQuantity'    : args[14]
+        }
+
+        if product_info['minSalesQuantity'] > product_info['maxSalesQuantity']:
+            product_info['minSalesQuantity'] = product_info['maxSalesQuantity']
+
+        # DB 저장 내역과 비교를 위한 price value Decimal 변경
+        product_info['price'] = round(Decimal(product_info['price']),2)
+
+        # DB 저장 내역과 비교를 위한 discountStartDate, discountEndDate datetime 형태로 변경
+        if product_info['discountStartDate'] is not None:
+            product_info['discountStartDate'] = datetime.strptime(product_info['discountStartDate'], '%Y-%m-%d %H:%M')
+        if product_info['discountEndDate'] is not None:
+            product_info['discountEndDate'] = datetime.strptime(product_info['discountEndDate'], '%Y-%m-%d %H:%M')
+
+        # 사이즈 별(Large, Medium, Small) 상품이미지 저장 위한 S3 Connection Instance 생성
+        s3_connection = get_s3_connection()
+        images        = request.files
+
+        # 상품정보를 DB에 저장하는 Function 실행
+        product_service.update_product(product_id, product_info, db_connection)
+
+        # 기존 상품 이미지(product_images, images)를 제거하고
+        # 업데이트한 상품이미지를 사이즈 별로 S3에 저장 및 URL을 DB에 Insert 하는 Function 실행
+        product_service.update_product_image(
+            images,
+            product_id,
+            s3_connection,
+            db_connection
+        )
+
+        # cache 무효화 전에 변경 내역이 반영되도록 먼저 commit 처리
+        db_connection.commit()
+
+        # 상품 List cache 무효화
+        get_redis_connection().incr(PRODUCT_LIST_VERSION_KEY)
+
+        return jsonify({'message' : 'SUCCESS'}), 200
 
     return admin_product_app
 
@@ -766,7 +832,8 @@ def service_product_endpoint(product_service):
     service_product_app = Blueprint('service_product_app', __name__, url_prefix='/product')
 
     @service_product_app.route('', methods=['GET'])
-    def product_list():
+    @with_db(exception_status=400)
+    def product_list(db_connection):
 
         """
 
@@ -774,6 +841,7 @@ def service_product_endpoint(product_service):
         [GET] http://ip:5000/product
 
         Returns:
+            304 : If-None-Match 헤더가 현재 ETag와 같은 경우
             200 : "data": [
                         {
                           "discount_rate": 30,
@@ -809,46 +877,52 @@ def service_product_endpoint(product_service):
                 엔드포인트를 찾아가지 못하는 문제 해결
             2020-08-27 (minho.lee0716@gmail.com) : 수정
                 상품이 하나도 존재하지 않을 경우 빈 배열을 리턴
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                상품 리스트를 Redis에 cache
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                with_db 데코레이터로 connection 관리
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                상품 리스트 version 기반 ETag, 304 Not Modified 적용
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
-        try:
-            db_connection = get_connection()
-
-            # DB에 연결이 잘 되었을 경우
-            if db_connection:
+        redis_connection = get_redis_connection()
+        version          = get_product_list_version(redis_connection)
 
-                # 모든 상품을 products라는 변수에 가져와 담습니다.
-                products = product_service.get_product_list(db_connection)
+        # 상품 리스트 version과 cache 유효 시간 단위로 ETag를 만들고,
+        # (할인 기간처럼 시간에 따라 바뀌는 가격이 cache 유효 시간 이상 유지되지 않도록 시간 단위 포함)
+        # 클라이언트가 가진 리스트와 같다면 DB 조회와 직렬화 없이 304를 리턴해줍니다.
+        etag = f'W/"{version}-{int(time.time()) // PRODUCT_LIST_CACHE_TTL}"'
 
-                # 상품이 1개라도 존재하지 않을 경우 json 리턴값이 null 인걸 확인하였고, 그럴 경우엔
-                if not products:
+        if request.headers.get('If-None-Match') == etag:
+            return '', 304
 
-                    # 빈 배열을 리턴해줍니다.
-                    return jsonify({'data' : []}), 200
+        # cache에 저장된 상품 리스트가 있다면 DB를 조회하지 않고 리턴해줍니다.
+        cache_key       = get_product_list_cache_key(redis_connection, version=version)
+        cached_products = redis_connection.get(cache_key)
 
-                # 상품이 1개 이상 존재할 경우, 모든 상품 리스트를 리턴해줍니다.
-                return jsonify({'data' : products}), 200
+        if cached_products:
+            products = orjson.loads(cached_products)
 
-            # DB에 연결이 되지 않았을 경우, DB에 연결되지 않았다는 에러메시지를 보내줍니다.
-            return jsonify({'message' : 'NO_DATABASE_CONNECTION'}), 500
+        else:
+            # 모든 상품을 products라는 변수에 가져와 담습니다.
+            # 상품이 1개라도 존재하지 않을 경우 json 리턴값이 null 인걸 확인하였고, 그럴 경우엔 빈 배열을 리턴해줍니다.
+            products = product_service.get_product_list(db_connection) or []
+            redis_connection.setex(cache_key, PRODUCT_LIST_CACHE_TTL, dumps_json(products))
 
-        except Exception as e:
-            return jsonify({'message' : e}), 400
+        response = fast_json({'data' : products})
+        response.headers['ETag']          = etag
+        response.headers['Cache-Control'] = f'public, max-age={PRODUCT_LIST_CACHE_TTL // 2}'
 
-        finally:
-            if db_connection:
-                db_connection.close()
+        return response
 
     @service_product_app.route('/<product_id>', methods=['GET'])
     @catch_exception
     @validate_params(
         Param('product_id', PATH, int)
     )
-    def product_details(product_id):
+    @with_db(exception_status=400)
+    def product_details(db_connection, product_id):
 
         """
 
@@ -894,59 +968,38 @@ def service_product_endpoint(product_service):
                 색상의 조건이 들어올 시, 나머지 사이즈와 재고를 리턴
             2020-09-09 (tnwjd060124@gmail.com) : 수정
                 path parameter로 들어온 product_id에 해당하는 제품이 없을 때 401에러 리턴
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                with_db 데코레이터로 connection 관리
 
         """
 
-        # finally error 발생 방지
-        db_connection = None
-
-        try:
-            db_connection = get_connection()
-
-            # DB에 연결이 됐다면
-            if db_connection:
-
-                # service에서 상세정보, 이미지, 옵션을 묶은 정보들을 details에 저장
-                details = product_service.get_product_details(product_id, db_connection)
+        # service에서 상세정보, 이미지, 옵션을 묶은 정보들을 details에 저장
+        details = product_service.get_product_details(product_id, db_connection)
 
-                # 상품id에 해당하는 정보가 존재하는 경우에만 실행
-                if details:
+        # 상품id에 해당하는 정보가 존재하는 경우에만 실행
+        if details:
 
-                    # Query Parameter의 요청이 존재할 경우
-                    if request.args:
+            # Query Parameter의 요청이 존재할 경우
+            if request.args:
 
-                        # color_id로 들어온 키의 값을 color_id라는 변수에 저장
-                        color_id = request.args['color_id']
+                # color_id로 들어온 키의 값을 color_id라는 변수에 저장
+                color_id = request.args['color_id']
 
-                        # 나머지 옵션을 가져오기 위해 딕셔너리를 생성
-                        product_info = {
-                            'product_id' : product_id,
-                            'color_id'   : color_id
-                        }
-
-                        # service에서 나머지 옵션(사이즈, 재고)을 묶은 정보들을 etc_options에 저장
-                        # 나머지 옵션들의 정보가 없다면 service에서 raise를 이용한 에러 처리
-                        etc_options = product_service.get_etc_options(product_info, db_connection)
-
-                        return jsonify({'data' : etc_options}), 200
-
-                    return jsonify({'data' : details}), 200
-
-                # 상품 id에 해당하는 data가 존재하지 않은 경
-                return jsonify({'message' : 'NON_EXISTING_DATA'}), 401
+                # 나머지 옵션을 가져오기 위해 딕셔너리를 생성
+                product_info = {
+                    'product_id' : product_id,
+                    'color_id'   : color_id
+                }
 
-            # DB에 연결이 되지 않았을 경우, DB에 연결되지 않았다는 에러메시지를 보내줍니다.
-            return jsonify({'message' : 'NO_DATABASE_CONNECTION'}), 500
+                # service에서 나머지 옵션(사이즈, 재고)을 묶은 정보들을 etc_options에 저장
+                # 나머지 옵션들의 정보가 없다면 service에서 raise를 이용한 에러 처리
+                etc_options = product_service.get_etc_options(product_info, db_connection)
 
-        # 요청은 들어오지만, Query Parameter의 키 값이 잘못 요청된 경우
-        except KeyError:
-            return jsonify({'message' : 'KEY_ERROR'}), 400
+                return fast_json({'data' : etc_options})
 
-        except Exception as e:
-            return jsonify({'message' : f"{e}"}), 400
+            return fast_json({'data' : details})
 
-        finally:
-            if db_connection:
-                db_connection.close()
+        # 상품 id에 해당하는 data가 존재하지 않은 경
+        return jsonify({'message' : 'NON_EXISTING_DATA'}), 401
 
     return service_product_app
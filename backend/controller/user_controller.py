@@ -1,4 +1,4 @@
-import requests, math
+import requests
 from flask                  import request, Blueprint, jsonify
 from flask_request_validator import (
     validate_params,
@@ -277,7 +277,7 @@ def create_user_endpoints(user_service):
 
     return user_app
 
-def create_admin_user_endpoints(user_service):
+def create_admin_user_endpoints(user_service, order_service):
     admin_user_app = Blueprint('admin_user_app', __name__, url_prefix='/admin/user')
 
     @admin_user_app.route('/userlist', methods=['GET'], endpoint='user_list')
@@ -336,6 +336,7 @@ def create_admin_user_endpoints(user_service):
         History:
             2020-08-20 (tnwjd060124@gmail.com) : 초기 생성
             2020-09-02 (tnwjd060124@gmail.com) : filter 기능 추가
+            2020-09-10 (tnwjd060124@gmail.com) : 총 유저의 수를 유저 리스트와 한 번의 query 로 조회
 
         """
 
@@ -364,21 +365,15 @@ def create_admin_user_endpoints(user_service):
                     'sort'            : args[11]
                 }
 
-                # 총 유저의 수를 가져와서 total_user에 저장
-                total_user = user_service.get_total_user_number(filter_info, db_connection)
+                # 유저 리스트와 총 유저의 수를 한 번에 가져와서 result, total_number에 저장
+                result, total_number = user_service.get_user_list(filter_info, db_connection)
 
-                # 총 유저가 존재할 경우에만 유저리스트 가져옴
-                if total_user['total_number']:
-
-                    # 요청으로 들어온 페이지가 총 유저수 / limit 한 페이지보다 작은 경우에만 유저리스트 가져옴
-                    if math.ceil(total_user['total_number']/filter_info['limit']) >= filter_info['page']:
-
-                        # 유저 리스트 가져와서 result에 저장
-                        result = user_service.get_user_list(filter_info, db_connection)
-
-                        return jsonify({"total_user_number" : total_user['total_number'], "data" : result}), 200
+                # 요청으로 들어온 페이지에 유저가 존재할 경우 유저리스트 리턴
+                if result:
+                    return jsonify({"total_user_number" : total_number, "data" : result}), 200
 
-                    # 요청으로 들어온 page가 바르지 않은 경우
+                # 첫 페이지 이후의 페이지가 비어있으면 요청으로 들어온 page가 바르지 않은 경우
+                if filter_info['page'] > 1:
                     return jsonify({"message" : "INVALID_PAGE"}), 400
 
                 # 총 유저가 없을 경우 빈 배열 리턴
@@ -426,6 +421,7 @@ def create_admin_user_endpoints(user_service):
 
         History:
             2020-09-07 (tnwjd060124@gmail.com)
+            2020-09-10 (tnwjd060124@gmail.com) : 배송지 변경 후 주문자 정보 cache 삭제
 
         """
 
@@ -454,6 +450,9 @@ def create_admin_user_endpoints(user_service):
 
                     db_connection.commit()
 
+                    # 변경 전 배송지 정보가 주문하기 페이지에 노출되지 않도록 주문자 정보 cache 삭제
+                    order_service.invalidate_orderer_info(user_info['user_no'])
+
                     return jsonify({"message" : "SUCCESS"}), 200
 
                 # 메소드 실행 결과가 None일 경우
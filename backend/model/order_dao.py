@@ -1,15 +1,393 @@
-import datetime
+import datetime, functools
+import pymysql
 
 class OrderDao:
 
-    def get_ordercompleted_list(self, filter_info, db_connection):
+    # 결제 완료 리스트 조회 시 사용하는 선택 필터 key
+    ORDER_COMPLETED_FILTER_KEYS = (
+        'from_date',
+        'to_date',
+        'order_detail_id',
+        'product_name',
+        'phone_number',
+        'orderer',
+        'order_id'
+    )
+
+    # 결제 완료 리스트, 총 결제 완료 건수 조회에 공통으로 사용하는 FROM, WHERE 절
+    ORDER_COMPLETED_FILTER_QUERY = """
+        FROM
+            orders_completed_mv
+
+        WHERE
+            order_status_id = 1
+            AND (%(from_date)s IS NULL OR order_time > %(from_date)s)
+            AND (%(to_date)s IS NULL OR order_time < %(to_date)s)
+            AND (%(order_detail_id)s IS NULL OR order_product_no = %(order_detail_id)s)
+            AND (%(product_name)s IS NULL OR MATCH(product_name_ft) AGAINST(%(product_name)s IN BOOLEAN MODE))
+            AND (%(product_name_like)s IS NULL OR product_name LIKE %(product_name_like)s)
+            AND (%(phone_number)s IS NULL OR phone_number = %(phone_number)s)
+            AND (%(orderer)s IS NULL OR user_name = %(orderer)s)
+            AND (%(order_id)s IS NULL OR order_no = %(order_id)s)
+        """
+
+    SELECT_ORDER_COMPLETED_COUNT_QUERY = """
+        SELECT
+            COUNT(*) AS total_number
+        """ + ORDER_COMPLETED_FILTER_QUERY
+
+    # 결제 완료 상세 정보 조회 쿼리문 입니다.
+    SELECT_ORDER_DETAIL_QUERY = """
+        SELECT
+            P2.order_no,
+            P1.start_time AS order_time,
+            P1.order_detail_no,
+            P1.start_time AS paid_time,
+            P3.name AS order_status,
+            P10.name AS orderer,
+            P4.phone_number,
+            P6.product_no,
+            P7.name AS product_name,
+            P7.price AS original_price,
+            P1.total_price,
+            P8.name AS color,
+            P9.name AS size,
+            P11.quantity,
+            P10.user_no,
+            P4.receiver,
+            P4.address,
+            P4.additional_address,
+            P4.zip_code,
+            P1.delivery_request,
+            -- 할인 기간이 무기한이거나 유효한 경우 할인율 적용 (base_discount_rate : 할인율이 NULL 이면 0)
+            IF(
+                P7.discount_start_date IS NULL OR P1.start_time BETWEEN P7.discount_start_date AND P7.discount_end_date,
+                P7.base_discount_rate,
+                0
+            ) AS discount_rate
+
+        FROM
+            orders_details P1
+
+        INNER JOIN orders P2
+        ON P1.order_id = P2.order_no
+
+        INNER JOIN order_status P3
+        ON P1.order_status_id = P3.order_status_no
+
+        INNER JOIN user_shipping_details P4
+        ON P1.user_shipping_id = P4.user_shipping_detail_no
+
+        INNER JOIN order_product P11
+        ON P1.order_detail_no = P11.order_detail_id
+
+        INNER JOIN product_options P5
+        ON P11.product_option_id = P5.product_option_no
+
+        INNER JOIN products P6
+        ON P5.product_id = P6.product_no
+
+        INNER JOIN product_details P7
+        ON P5.product_id = P7.product_id
+        AND P1.start_time >= P7.start_time
+        AND P7.close_time >= P1.start_time
+
+        INNER JOIN colors P8
+        ON P5.color_id = P8.color_no
+
+        INNER JOIN sizes P9
+        ON P5.size_id = P9.size_no
+
+        INNER JOIN users P10
+        ON P2.user_id = P10.user_no
+
+        WHERE order_detail_no = %(order_detail_id)s
+        """
+
+    # 주문하기, 결제 완료 시 매번 실행되는 query 는 class 정의 시점에 한번만 생성해 재사용합니다.
+    # sp_place_order Procedure 호출문 입니다.
+    # callproc 은 parameter 설정(SET), 호출(CALL), OUT parameter 조회(SELECT)를 따로 실행하므로
+    # CALL 문을 직접 실행하고 Procedure 의 결과(SELECT)로 생성된 주문 상세 id 를 받습니다.
+    PLACE_ORDER_QUERY = """
+        CALL sp_place_order(
+            %(user_no)s,
+            %(user_shipping_detail_no)s,
+            %(total_price)s,
+            %(delivery_request)s,
+            %(product_option_no)s,
+            %(quantity)s
+        )
+        """
+
+    # 유저의 배송지 정보가 있으면 update, 없으면 insert 하는 쿼리문 입니다.
+    # update 된 경우에도 lastrowid 로 배송지 id를 받을 수 있도록 LAST_INSERT_ID(expr)를 사용합니다.
+    UPSERT_USER_SHIPPING_DETAILS_QUERY = """
+        INSERT INTO user_shipping_details (
+            user_id,
+            receiver,
+            address,
+            additional_address,
+            zip_code,
+            phone_number
+        ) VALUES (
+            %(user_no)s,
+            %(receiver)s,
+            %(address)s,
+            %(additional_address)s,
+            %(zip_code)s,
+            %(phone_number)s
+        )
+        ON DUPLICATE KEY UPDATE
+            user_shipping_detail_no = LAST_INSERT_ID(user_shipping_detail_no),
+            receiver                = VALUES(receiver),
+            address                 = VALUES(address),
+            additional_address      = VALUES(additional_address),
+            zip_code                = VALUES(zip_code),
+            phone_number            = VALUES(phone_number)
+        """
+
+    # 유저를 기준으로 상품과 현재 유효한 상품 상세정보를 LEFT JOIN 하여 한 번에 가져오는 쿼리문 입니다.
+    SELECT_ORDER_PRECONDITIONS_QUERY = """
+        SELECT
+            U.user_no,
+            PD.price AS original_price,
+            IF(
+                PD.discount_start_date IS NULL OR NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date,
+                PD.base_discount_rate,
+                0
+            ) AS discount_rate,
+            PD.min_sales_quantity,
+            PD.max_sales_quantity
+
+        FROM
+            users AS U
+
+        LEFT JOIN products AS P
+        ON P.product_no = %(product_id)s
+        AND P.is_deleted = False
+
+        LEFT JOIN product_details AS PD
+        ON P.product_no = PD.product_id
+        AND PD.close_time = '9999-12-31 23:59:59'
+        AND PD.is_activated = True
+        AND PD.is_displayed = True
+
+        WHERE
+            U.is_deleted = False
+            AND U.user_no = %(user_no)s
+        LIMIT 1
+        """
+
+    # 주문하기 화면에 보여줄 셀러, 상품, 옵션 정보 조회 쿼리문 입니다.
+    SELECT_SELLER_PRODUCT_INFO_QUERY = """
+        SELECT
+            P.product_no AS product_id,
+            C.name AS color_name,
+            C.color_no AS color_id,
+            S.name AS size_name,
+            S.size_no AS size_id,
+            PO.product_option_no,
+            PO.current_quantity,
+            PD.name,
+            PD.price AS original_price,
+            I.image_small,
+            IF(
+                PD.discount_start_date IS NULL OR NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date,
+                PD.base_discount_rate,
+                0
+            ) AS discount_rate
+
+        FROM products AS P
+
+        INNER JOIN product_details AS PD
+        ON P.product_no = PD.product_id
+        AND PD.is_activated = True
+        AND PD.is_displayed = True
+        AND PD.close_time = '9999-12-31 23:59:59'
+
+        INNER JOIN product_images AS PI
+        ON P.product_no = PI.product_id
+        AND PI.is_main = True
+        AND PI.close_time = '9999-12-31 23:59:59'
+
+        INNER JOIN images AS I
+        ON PI.image_id = I.image_no
+        AND I.is_deleted = False
+
+        INNER JOIN product_options AS PO
+        ON P.product_no = PO.product_id
+        AND PO.is_deleted = False
+
+        INNER JOIN colors AS C
+        ON PO.color_id = C.color_no
+
+        INNER JOIN sizes AS S
+        ON PO.size_id = S.size_no
+
+        WHERE
+            P.is_deleted = False
+            AND P.product_no = %(product_id)s
+            AND C.color_no = %(color_id)s
+            AND S.size_no = %(size_id)s
+        LIMIT 1
+        """
+
+    # U라는 테이블이 '주문자 정보'에 관한 정보입니다.
+    # USD라는 테이블은 '배송지 정보'에 관한 정보입니다.
+    SELECT_ORDERER_INFO_QUERY = """
+        SELECT
+            U.name AS orderer_name,
+            U.email AS orderer_email,
+            USD.receiver,
+            USD.phone_number,
+            USD.address,
+            USD.additional_address,
+            USD.zip_code
+
+        FROM
+        users AS U
+
+        LEFT JOIN user_shipping_details AS USD
+        ON U.user_no = USD.user_id
+
+        WHERE
+            U.is_deleted = False
+            AND U.user_no = %s
+        LIMIT 1
+        """
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def build_ordercompleted_list_query(sort, with_total_number, paginate=True):
+
+        """
+
+        결제 완료 리스트 조회 query 를 정렬 방향, 총 건수 조회 여부 조합 별로 한 번만 생성하여 재사용합니다.
+
+        Args:
+            sort              : True 인 경우 주문일 오래된 순
+            with_total_number : True 인 경우 COUNT(*) OVER() 로 총 결제 완료 건수를 함께 조회
+            paginate          : False 인 경우 cursor 조건과 LIMIT, OFFSET 없이 전체 조회 (엑셀 다운로드용)
+
+        Returns:
+            결제 완료 리스트 조회 query
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
+                get_ordercompleted_list 에서 매 호출마다 query 문자열을 만들던 부분 분리
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                전체 조회(paginate=False) 추가
+
+        """
+
+        # 정렬 방향은 정해진 값만 query 에 들어가도록 제한
+        sort_direction  = 'ASC' if sort else 'DESC'
+        cursor_operator = '>' if sort else '<'
+
+        select_query = """
+        SELECT
+            order_time,
+            order_no,
+            order_detail_no,
+            order_product_no,
+            product_name,
+            size,
+            color,
+            quantity,
+            user_name,
+            phone_number,
+            order_status,
+            total_price
+            {total_number}
+        """.format(
+            total_number = ', COUNT(*) OVER () AS total_number' if with_total_number else ''
+        ) + OrderDao.ORDER_COMPLETED_FILTER_QUERY
+
+        if paginate:
+            select_query += """
+            AND (
+                %(cursor_time)s IS NULL
+                OR (order_time, order_product_no) {cursor_operator} (%(cursor_time)s, %(cursor_id)s)
+            )
+            """.format(cursor_operator = cursor_operator)
+
+        select_query += """
+        ORDER BY
+            order_time {sort_direction},
+            order_product_no {sort_direction}
+        """.format(sort_direction = sort_direction)
+
+        if paginate:
+            select_query += """
+        LIMIT
+            %(limit)s
+        OFFSET
+            %(offset)s
+        """
+
+        return select_query
+
+    def build_ordercompleted_filter_params(self, filter_info):
+
+        """
+
+        결제 완료 리스트, 총 결제 완료 건수 조회에 공통으로 사용하는 FROM, WHERE 절(ORDER_COMPLETED_FILTER_QUERY)의 query parameter 를 Return 합니다.
+
+        Args:
+            filter_info : 필터 리스트
+
+        Returns:
+            query parameter Dictionary 객체
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
+                orders_completed_mv 조회로 변경하면서 get_ordercompleted_list, get_total_num 에서 분리
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                필터 조건을 문자열로 이어붙이지 않고 항상 같은 query 문을 사용하도록 변경
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                FROM, WHERE 절을 class 상수(ORDER_COMPLETED_FILTER_QUERY)로 이동
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                2글자 미만 제품명은 LIKE 로 검색, 따옴표만 있는 제품명은 필터 미적용
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                query 는 class 상수를 그대로 사용하므로 query parameter 만 Return 하도록 이름 변경
+
+        """
+
+        # 필터 존재 여부와 관계없이 항상 같은 query 문이 실행되도록 모든 필터 key 를 채워서 사용
+        # (빈 값으로 들어온 필터는 기존과 같이 적용하지 않도록 None 으로 변환)
+        filter_params = dict(filter_info)
+        filter_params.update({key : filter_info.get(key) or None for key in self.ORDER_COMPLETED_FILTER_KEYS})
+
+        # 제품명 필터 존재하는 경우 FULLTEXT(ngram) 구문 검색어로 변환
+        # (ngram_token_size(2) 보다 짧은 검색어는 FULLTEXT 로 찾을 수 없으므로 LIKE 로 검색, 빈 검색어는 필터 미적용)
+        product_name = (filter_params['product_name'] or '').replace('"', '').strip()
+
+        filter_params['product_name']      = None
+        filter_params['product_name_like'] = None
+
+        if len(product_name) >= 2:
+            filter_params['product_name'] = f'"{product_name}"'
+        elif product_name:
+            filter_params['product_name_like'] = f'%{product_name}%'
+
+        return filter_params
+
+    def get_ordercompleted_list(self, filter_info, db_connection, with_total_number=False):
 
         """
 
         결제 완료 리스트 표출
 
         Args:
-            db_connection : 연결된 db 객체
+            filter_info       : 필터 리스트 (cursor_time, cursor_id 존재 시 해당 row 다음부터 조회)
+            db_connection     : 연결된 db 객체
+            with_total_number : True 인 경우 각 row 에 총 결제 완료 건수(total_number)를 함께 조회
 
         Returns:
             결제 완료 리스트
@@ -25,154 +403,86 @@ class OrderDao:
                 제품명 검색조건 LIKE로 변경
             2020-09-05 (tnwjd060124@gmail.com) : 수정
                 할인 기간에 따른 할인율 조건 추가
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                10개 Table JOIN 대신 orders_completed_mv 조회로 변경
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                정렬 방향을 제외하고 항상 같은 query 문을 사용하도록 변경
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                cursor(order_time, order_detail_no) 가 들어온 경우 OFFSET 대신 keyset pagination 으로 조회
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                주문 상세 하나에 주문 상품이 여러 개일 수 있으므로 cursor 를 (order_time, order_product_no) 로 변경
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                COUNT(*) OVER() 로 총 결제 완료 건수를 함께 조회하는 옵션 추가
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                정렬 방향, 총 건수 조회 여부 별로 미리 만들어 둔 query 사용
 
         """
 
         with db_connection.cursor() as cursor:
 
-            select_list = """
-            SELECT
-                P3.start_time AS order_time,
-                P1.order_no,
-                P3.order_detail_no,
-                P6.name AS product_name,
-                P4.name AS size,
-                P5.name AS color,
-                P2.quantity,
-                P11.name AS user_name,
-                P7.phone_number,
-                P9.name AS order_status,
-                P3.total_price
-
-            FROM
-                orders AS P1
-            """
-
-            # 조회 기간 필터 존재하는 경우 추가
-            if filter_info['from_date']:
-                select_list += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                AND P3.start_time > %(from_date)s
-                """
-            else:
-                select_list += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                """
-
-            # 조회 기간 endDate 필터 존재하는 경우 추가
-            if filter_info['to_date']:
-                select_list += """
-                AND P3.start_time < %(to_date)s
-                """
-
-            # 주문 상세정보 필터 존재하는 경우 추가
-            if filter_info['order_detail_id']:
-                select_list += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                AND P2.order_product_no = %(order_detail_id)s
-                """
-            else:
-                select_list += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                """
-
-            # JOIN 추가
-            select_list += """
-            INNER JOIN product_options AS P8
-            ON P2.product_option_id = P8.product_option_no
-
-            INNER JOIN sizes AS P4
-            ON P8.size_id = P4.size_no
-
-            INNER JOIN colors AS P5
-            ON P8.color_id = P5.color_no
-            """
-
-            # 제품명 필터 존재하는 경우 추가
-            if filter_info['product_name']:
-                select_list += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time -- 주문 시에 유효한 정보
-                AND P6.close_time >= P3.start_time -- 주문 시에 유효한 정보
-                AND P6.name LIKE %(product_name)s
-                """
-            else:
-                select_list += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time -- 주문 시에 유효한 정보
-                AND P6.close_time >= P3.start_time -- 주문 시에 유효한 정보
-                """
-
-            # JOIN 추가
-            select_list += """
-            INNER JOIN order_status AS P9
-            ON P3.order_status_id = P9.order_status_no
-            """
-
-            # 핸드폰번호 필터 존재하는 경우 추가
-            if filter_info['phone_number']:
-                select_list += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                AND P7.phone_number = %(phone_number)s
-                """
-            else:
-                select_list += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                """
-
-            # 주문자명 필터 존재하는 경우 추가
-            if filter_info['orderer']:
-                select_list += """
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                AND P11.name = %(orderer)s
-                """
-            else:
-                select_list +="""
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                """
+            filter_params = self.build_ordercompleted_filter_params(filter_info)
 
-            # 주문 id 필터 존재하는 경우 추가
-            if filter_info['order_id']:
-                select_list += """
-                WHERE order_no = %(order_id)s
-                """
+            # 이전 page 의 마지막 row (order_time, order_product_no) 가 cursor 로 들어온 경우 그 다음 row 부터 조회 (keyset pagination)
+            filter_params['cursor_time'] = filter_info.get('cursor_time')
+            filter_params['cursor_id']   = filter_info.get('cursor_id')
 
-            # 정렬 필터 존재하는 경우 주문일 오래된 순
-            if filter_info['sort']:
-                select_list += """
-                ORDER BY P3.start_time ASC
-                """
+            if filter_params['cursor_time'] is not None and filter_params['cursor_id'] is not None:
+                filter_params['offset'] = 0
             else:
-                select_list += """
-                ORDER BY P3.start_time DESC
-                """
+                filter_params['cursor_time'] = filter_params['cursor_id'] = None
 
-            # limit, offset 설정 추가
-            select_list += """
-            LIMIT
-                %(limit)s
-            OFFSET
-                %(offset)s
-            """
+            # 정렬 필터 존재하는 경우 주문일 오래된 순
+            select_list = self.build_ordercompleted_list_query(bool(filter_info['sort']), with_total_number)
 
-            cursor.execute(select_list, filter_info)
+            cursor.execute(select_list, filter_params)
 
             orders = cursor.fetchall()
 
             return orders
 
+    def stream_ordercompleted_list(self, filter_info, db_connection):
+
+        """
+
+        결제 완료 리스트 전체를 server side cursor(SSDictCursor)로 한 row 씩 조회합니다.
+        결과 전체를 메모리에 올리지 않으므로 엑셀 다운로드처럼 많은 row 를 내려줄 때 사용합니다.
+        query 실행과 첫 row 조회는 호출 시점에 바로 하므로 DB 에러는 응답을 보내기 전에 발생합니다.
+
+        Args:
+            filter_info   : 필터 리스트
+            db_connection : 연결된 db 객체
+
+        Returns:
+            (나머지 row 를 fetchone 으로 읽을 server side cursor, 첫 번째 결제 완료 row)
+            cursor 는 호출한 쪽에서 close 해야 하며, close 시 읽지 않은 row 를 모두 읽고 닫습니다.
+
+        Author:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                generator 대신 query 를 바로 실행하고 cursor, 첫 row 를 Return
+
+        """
+
+        filter_params = self.build_ordercompleted_filter_params(filter_info)
+
+        select_list = self.build_ordercompleted_list_query(bool(filter_info['sort']), False, paginate=False)
+
+        cursor = db_connection.cursor(pymysql.cursors.SSDictCursor)
+
+        try:
+            cursor.execute(select_list, filter_params)
+
+            first_order = cursor.fetchone()
+
+        except Exception as e:
+            cursor.close()
+            raise e
+
+        return cursor, first_order
+
     def get_total_num(self, filter_info, db_connection):
 
         """
@@ -195,121 +505,18 @@ class OrderDao:
                 주문시 유효한 데이터 조회하도록 조건 추가
             2020-09-04 (tnwjd060124@gmail.com) : 수정
                 제품명 검색조건 LIKE로 변경
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                10개 Table JOIN 대신 orders_completed_mv 조회로 변경
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                class 상수로 정의한 count query 사용
 
         """
 
         with db_connection.cursor() as cursor:
 
-            count_num = """
-            SELECT
-                COUNT(*) AS total_number
-
-            FROM
-                orders AS P1
-            """
-
-            # 조회 기간 필터 존재하는 경우 추가
-            if filter_info['from_date']:
-                count_num += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                AND P3.start_time > %(from_date)s
-                """
-            else:
-                count_num += """
-                INNER JOIN orders_details AS P3
-                ON P1.order_no = P3.order_id
-                AND P3.order_status_id=1
-                """
-
-            # 조회 기간 endDate 필터 존재하는 경우 추가
-            if filter_info['to_date']:
-                count_num += """
-                AND P3.start_time < %(to_date)s
-                """
-
-            # 주문 상세정보 필터 존재하는 경우 추가
-            if filter_info['order_detail_id']:
-                count_num += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                AND P2.order_product_no = %(order_detail_id)s
-                """
-            else:
-                count_num += """
-                INNER JOIN order_product AS P2
-                ON P3.order_detail_no = P2.order_detail_id
-                """
-
-            # JOIN 추가
-            count_num += """
-            INNER JOIN product_options AS P8
-            ON P2.product_option_id = P8.product_option_no
-
-            INNER JOIN sizes AS P4
-            ON P8.size_id = P4.size_no
-
-            INNER JOIN colors AS P5
-            ON P8.color_id = P5.color_no
-            """
-
-            # 제품명 필터 존재하는 경우 추가
-            if filter_info['product_name']:
-                count_num += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time
-                AND P6.close_time >= P3.start_time
-                AND P6.name LIKE %(product_name)s
-                """
-            else:
-                count_num += """
-                INNER JOIN product_details AS P6
-                ON P8.product_id = P6.product_id
-                AND P3.start_time >= P6.start_time
-                AND P6.close_time >= P3.start_time
-                """
-
-            # JOIN 추가
-            count_num += """
-            INNER JOIN order_status AS P9
-            ON P3.order_status_id = P9.order_status_no
-            """
-
-            # 핸드폰번호 필터 존재하는 경우 추가
-            if filter_info['phone_number']:
-                count_num += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                AND P7.phone_number = %(phone_number)s
-                """
-            else:
-                count_num += """
-                INNER JOIN user_shipping_details AS P7
-                ON P3.user_shipping_id = P7.user_shipping_detail_no
-                """
-
-            # 주문자명 필터 존재하는 경우 추가
-            if filter_info['orderer']:
-                count_num += """
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                AND P11.name = %(orderer)s
-                """
-            else:
-                count_num +="""
-                INNER JOIN users AS P11
-                ON P1.user_id = P11.user_no
-                """
-
-            # 주문 id 필터 존재하는 경우 추가
-            if filter_info['order_id']:
-                count_num += """
-                WHERE order_no = %(order_id)s
-                """
+            filter_params = self.build_ordercompleted_filter_params(filter_info)
 
-            cursor.execute(count_num, filter_info)
+            cursor.execute(self.SELECT_ORDER_COMPLETED_COUNT_QUERY, filter_params)
 
             total_num = cursor.fetchone()
 
@@ -339,77 +546,7 @@ class OrderDao:
 
         with db_connection.cursor() as cursor:
 
-            select_detail = """
-            SELECT
-                P2.order_no,
-                P1.start_time AS order_time,
-                P1.order_detail_no,
-                P1.start_time AS paid_time,
-                P3.name AS order_status,
-                P10.name AS orderer,
-                P4.phone_number,
-                P6.product_no,
-                P7.name AS product_name,
-                P7.price AS original_price,
-                P1.total_price,
-                P8.name AS color,
-                P9.name AS size,
-                P11.quantity,
-                P10.user_no,
-                P4.receiver,
-                P4.address,
-                P4.additional_address,
-                P4.zip_code,
-                P1.delivery_request,
-                CASE
-                    WHEN P7.discount_rate IS NULL THEN 0 -- 상품 미할인인 경우
-                    ELSE CASE
-                        WHEN P7.discount_start_date IS NULL THEN P7.discount_rate -- 상품 할인이 무기한인 경우
-                        WHEN P1.start_time BETWEEN P7.discount_start_date AND P7.discount_end_date THEN P7.discount_rate -- 상품 할인 기간 유효한 경우
-                        ELSE 0 -- 상품 할인기간이 아닌경우
-                        END
-                    END
-                AS discount_rate
-
-            FROM
-                orders_details P1
-
-            INNER JOIN orders P2
-            ON P1.order_id = P2.order_no
-
-            INNER JOIN order_status P3
-            ON P1.order_status_id = P3.order_status_no
-
-            INNER JOIN user_shipping_details P4
-            ON P1.user_shipping_id = P4.user_shipping_detail_no
-
-            INNER JOIN order_product P11
-            ON P1.order_detail_no = P11.order_detail_id
-
-            INNER JOIN product_options P5
-            ON P11.product_option_id = P5.product_option_no
-
-            INNER JOIN products P6
-            ON P5.product_id = P6.product_no
-
-            INNER JOIN product_details P7
-            ON P5.product_id = P7.product_id
-            AND P1.start_time >= P7.start_time
-            AND P7.close_time >= P1.start_time
-
-            INNER JOIN colors P8
-            ON P5.color_id = P8.color_no
-
-            INNER JOIN sizes P9
-            ON P5.size_id = P9.size_no
-
-            INNER JOIN users P10
-            ON P2.user_id = P10.user_no
-
-            WHERE order_detail_no = %(order_detail_id)s
-            """
-
-            cursor.execute(select_detail, order_detail)
+            cursor.execute(self.SELECT_ORDER_DETAIL_QUERY, order_detail)
 
             order_detail = cursor.fetchone()
 
@@ -429,6 +566,7 @@ class OrderDao:
         Returns:
             상품 id를 받아와 상품에 대한 이름, 이미지(S 사이즈)를 리턴해 줍니다.
             색상과 사이즈의 id값을 받아 해당 색상과 사이즈를 리턴해줍니다.
+            선택한 옵션의 id(product_option_no)와 현재 재고(current_quantity)도 함께 리턴해줍니다.
 
         Authors:
             minho.lee0716@gmail.com (이민호)
@@ -441,79 +579,23 @@ class OrderDao:
             2020-09-04 (tnwjd060124@gmail.com)   : 현재 유효한 데이터 리턴하는 조건 변경
             2020-09-05 (tnwjd060124@gmail.com)   : 할인 기간에 따른 유효한 할인률 조건 변경
             2020-09-08 (minho.lee0716@gmail.com) : DB병합으로 인한 product_option_id 리턴 제거.
+            2020-09-10 (minho.lee0716@gmail.com) : WHERE 조건으로 NULL 이 될 수 없는 LEFT JOIN 을 INNER JOIN 으로 변경.
+            2020-09-10 (minho.lee0716@gmail.com) : get_product_option_no, get_current_quantity 통합.
+                product_option_no, current_quantity 를 함께 리턴.
 
         """
 
-        try:
+        with db_connection.cursor() as cursor:
 
-            with db_connection.cursor() as cursor:
-
-                select_seller_product_info_query = """
-                SELECT
-                    P.product_no AS product_id,
-                    C.name AS color_name,
-                    C.color_no AS color_id,
-                    S.name AS size_name,
-                    S.size_no AS size_id,
-                    PD.name,
-                    PD.price AS original_price,
-                    I.image_small,
-                    CASE
-                        WHEN PD.discount_rate IS NULL THEN 0
-                        ELSE CASE
-                            WHEN PD.discount_start_date IS NULL THEN PD.discount_rate
-                            WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate
-                            ELSE 0
-                            END
-                        END
-                    AS discount_rate
-
-                FROM products AS P
-
-                LEFT JOIN product_details AS PD
-                ON P.product_no = PD.product_id
-                AND PD.is_activated = True
-                AND PD.is_displayed = True
-                AND PD.close_time = '9999-12-31 23:59:59'
-
-                LEFT JOIN product_images AS PI
-                ON P.product_no = PI.product_id
-                AND PI.is_main = True
-                AND PI.close_time = '9999-12-31 23:59:59'
-
-                LEFT JOIN images AS I
-                ON PI.image_id = I.image_no
-                AND I.is_deleted = False
-
-                LEFT JOIN product_options AS PO
-                ON P.product_no = PO.product_id
-                AND PO.is_deleted = False
-
-                LEFT JOIN colors AS C
-                ON PO.color_id = C.color_no
-
-                LEFT JOIN sizes AS S
-                ON PO.size_id = S.size_no
-
-                WHERE
-                    P.is_deleted = False
-                    AND P.product_no = %(product_id)s
-                    AND C.color_no = %(color_id)s
-                    AND S.size_no = %(size_id)s;
-                """
-
-                # 상품 번호만 받아와 해당 상품의 정보들을 seller_product에 담아줍니다.
-                cursor.execute(select_seller_product_info_query, product_info)
-                seller_product_info = cursor.fetchone()
-
-                # 셀러의 상품이(구매하려는 상품) 존재하지 않을 경우 예외처리
-                if not seller_product_info:
-                    raise Exception('THIS_PRODUCT_DOES_NOT_EXISTS')
-
-                return seller_product_info
-
-        except  Exception as e:
-            raise e
+            # 상품 번호만 받아와 해당 상품의 정보들을 seller_product에 담아줍니다.
+            cursor.execute(self.SELECT_SELLER_PRODUCT_INFO_QUERY, product_info)
+            seller_product_info = cursor.fetchone()
+
+            # 셀러의 상품이(구매하려는 상품) 존재하지 않을 경우 예외처리
+            if not seller_product_info:
+                raise Exception('THIS_PRODUCT_DOES_NOT_EXISTS')
+
+            return seller_product_info
 
     def get_orderer_info(self, user_no, db_connection):
 
@@ -539,587 +621,76 @@ class OrderDao:
 
         """
 
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # U라는 테이블이 '주문자 정보'에 관한 정보입니다.
-                # USD라는 테이블은 '배송지 정보'에 관한 정보입니다.
-                select_orderer_info_query = """
-                SELECT
-                    U.name AS orderer_name,
-                    U.email AS orderer_email,
-                    USD.receiver,
-                    USD.phone_number,
-                    USD.address,
-                    USD.additional_address,
-                    USD.zip_code
-
-                FROM
-                users AS U
-
-                LEFT JOIN user_shipping_details AS USD
-                ON U.user_no = USD.user_id
-
-                WHERE
-                    U.is_deleted = False
-                    AND U.user_no = %s;
-                """
-
-                # 헤더의 토큰에서 유저의 id를 받아와 인자로 넣어주면,
-                # 해당 유저의 이름, 이메일, 그리고 배송지 정보들(존재하지 않으면 NULL)을 리턴해 줍니다.
-                cursor.execute(select_orderer_info_query, user_no)
-                orderer_info = cursor.fetchone()
-
-                # 유저의 정보가 존재하지 않는다면
-                if not orderer_info:
-                    raise Exception('UNAUTHORIZED')
-
-                return orderer_info
-
-        except Exception as e:
-            raise e
-
-    def insert_orders(self, order_info, db_connection):
-
-        """
-
-        user의 id를 받아와 orders라는 주문 테이블의 행을 추가합니다.
-
-        Args:
-            order_info    : 주문 정보, 유저 id에 관한 정보도 있음.
-            db_connection : 연결된 db 객체
-
-        Returns:
-            order_no : insert한 해당 orders라는 테이블의 id(pk)
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-06 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # U라는 테이블이 '주문자 정보'에 관한 정보입니다.
-                # USD라는 테이블은 '배송지 정보'에 관한 정보입니다.
-                insert_orders_query = """
-                INSERT INTO orders (
-                    user_id
-                ) VALUES (
-                    %(user_no)s
-                );
-                """
-
-                new_orders_row = cursor.execute(insert_orders_query, order_info)
-
-                if new_orders_row <= 0:
-                    raise Exception('QUERY_FAILED')
-
-                return cursor.lastrowid
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def insert_orders_details(self, order_info, db_connection):
-
-        """
-
-        order객체를 받아와 orders_details라는 주문 테이블의 행을 추가합니다.
-
-        Args:
-            order_info    : 구매할 상품과 유저에 관한 정보가 담겨있는 객체
-            db_connection : 연결된 db 객체
-
-        Returns:
-            order_detail_no : insert한 해당 orders_details라는 테이블의 id(pk)
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-06 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 정보를 받아온 order_info객체를 인자로 주어 orders_details라는 테이블에 행을 생성하는 쿼리문 입니다.
-                insert_orders_details_query = """
-                INSERT INTO orders_details (
-                    order_id,
-                    user_shipping_id,
-                    order_status_id,
-                    total_price,
-                    delivery_request
-                ) VALUES (
-                    %(order_no)s,
-                    (SELECT user_shipping_detail_no FROM user_shipping_details WHERE user_id = %(user_no)s),
-                    1,
-                    %(total_price)s,
-                    %(delivery_request)s
-                )
-                """
-
-                new_orders_details_row = cursor.execute(insert_orders_details_query, order_info)
-
-                # 쿼리가 잘 실행되지 않았을 경우의 예외처리입니다.
-                if new_orders_details_row <= 0:
-                    raise Exception('QUERY_FAILED')
-
-
-                # orders_details의 생성된 테이블의 pk를 반환해줍니다.
-                return cursor.lastrowid
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def insert_order_product(self, order_info, db_connection):
-
-        """
-
-        order_info객체를 받아와 order_product라는 테이블에 행을 추가합니다.
-
-        Args:
-            order_info    : order_product테이블에 필요한 정보
-            db_connection : 연결된 db 객체
-
-        Returns:
-            order_product_no : insert한 해당 order_product라는 테이블의 id(pk)
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-06 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # order_info객체를 인자로 주고, 필요한 정보를 사용해 order_product테이블에 행을 추가하는 쿼리문입니다.
-                insert_order_product_query = """
-                INSERT INTO order_product (
-                    order_detail_id,
-                    product_option_id,
-                    quantity
-                ) VALUES (
-                    %(order_detail_no)s,
-                    %(product_option_no)s,
-                    %(quantity)s
-                )
-                """
-
-                # 한 유저당 하나의 배송지 정보를 저장할 수 있으므로 하나만 가져옵니다.
-
-                new_order_product_row = cursor.execute(insert_order_product_query, order_info)
-
-                # 쿼리문이 잘 실행되지 않았을 경우의 예외처리입니다.
-                if new_order_product_row <= 0:
-                    raise Exception('QUERY_FAILED')
-
-                # order_product의 생성된 테이블의 pk를 반환해줍니다.
-                return cursor.lastrowid
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def update_quantities(self, update_quantity_info, db_connection):
-
-        """
-
-        원래 quantity row의 close_time을 업데이트 합니다..
-
-        Args:
-            current_quantity_info:
-                quantity_no : 변경하려는 quantity_pk
-                start_time : 새로운 이력의 start_time
-            db_connection : 연결된 db 객체
-
-        Returns:
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-07 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # U라는 테이블이 '주문자 정보'에 관한 정보입니다.
-                update_quantities_query = """
-                UPDATE
-                    quantities
-                SET
-                    close_time = %(start_time)s
-                WHERE
-                    quantity_no = %(origin_quantity_no)s
-                """
-
-                affected_row = cursor.execute(update_quantities_query, update_quantity_info)
-
-                if affected_row < 0:
-                    raise Exception("Query Failed")
-
-                return 1
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def insert_quantities(self, order_info, db_connection):
-
-        """
-
-        user의 id를 받아와 orders라는 주문 테이블의 컬럼을 추가합니다.
-
-        Args:
-            user_no       : 토큰에서 부터 받아온 해당 유저의 id
-            db_connection : 연결된 db 객체
-
-        Returns:
-            order_no : insert한 해당 orders라는 테이블의 id(pk)
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-07 (minho.lee0716@gmail.com) : 초기 생성
-            2020-09-09 (minho.lee0716@gmail.com) : 수정
-                테이블 변경으로 인해, 새로운 선분을 추가하는 테이블에 수량은
-                product_options  테이블의 수량을 가져오는 것으로 변경하였습니다.
-                (현재 product_options 테이블에는, 원래의 재고에서 유저가 구매한 만큼의 재고가 빠져있기 때문입니다.)
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 새로운 선분이력을 생성하는 quantities테이블의 row를 생성하는 쿼리입니다.
-                insert_quantities_query = """
-                INSERT INTO quantities (
-                    product_option_id,
-                    quantity
-                ) VALUES (
-                    %(product_option_no)s,
-                    (
-                    SELECT
-                        current_quantity
-
-                    FROM
-                        product_options
-
-                    WHERE
-                    product_option_no = %(product_option_no)s
-                    )
-                )
-                """
-
-                # quantities테이블에 row를 생성하는 쿼리와 quantity관련 정보를 인자로 주어 row를 생성합니다.
-                affected_row = cursor.execute(insert_quantities_query, order_info)
-
-                if affected_row <= 0:
-                    raise Exception('QUERY_FAILED')
-
-                # 생성된 quantities테이블의 row id를 리턴해 줍니다.
-                return cursor.lastrowid
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def get_current_quantity(self, product_option_no, db_connection):
-
-        """
-
-        해당 옵션에 해당하는 product_option테이블의 id를 가져와 그 옵션의 현재 재고를 리턴해주는 메소드입니다.
-
-        Args:
-            product_option_no : 구매하려는 옵션의 id
-            db_connection     : 연결된 db 객체
-
-        Returns:
-            {"current_quantity" : 해당 옵션의 현재 재고 }
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-07 (minho.lee0716@gmail.com) : 초기 생성
-            2020-09-09 (minho.lee0716@gmail.com) : 수정
-                테이블 변경으로 인해 Quantities테이블에서 가져오던 현재 재고를
-                Product_options라는 테이블에서 가져오는걸로 변경하였습니다.
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 현재 상품의 재고를 가져오는 쿼리문 입니다.
-                select_quantities_query = """
-                SELECT
-                    PO.current_quantity
-
-                FROM
-                product_options AS PO
-
-                WHERE
-                PO.product_option_no = %(product_option_no)s
-                AND PO.is_deleted = False
-                """
-
-                # 어떤 옵션의 재고인지 product_option_no을 인자로 받아와,
-                cursor.execute(select_quantities_query, product_option_no)
-
-                # 해당 옵션의 재고를 반환해 줍니다.
-                return cursor.fetchone()
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def get_product_option_no(self, order_info, db_connection):
-
-        """
-
-        서브쿼리를 줄이기 위해, product_option_no(pk)를 가져와 리턴해 줍니다.
-
-        Args:
-            order_info    : product_option_no을 가져오기 위한 정보들
-            db_connection : 연결된 db 객체
-
-        Returns:
-            product_option_no : product_option_no(pk)
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-07 (minho.lee0716@gmail.com) : 초기 생성
-            2020-09-08 (minho.lee0716@gmail.com) : 수정
-                테이블 변경으로 인한 변경, product_options + option_details의 테이블을 product_options로 병합.
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 나중에 사용될 서브쿼리를 줄이기 위해, product_option_no을 가져오기 위한 쿼리문 입니다.
-                select_product_option_no_query = """
-                SELECT
-                    product_option_no
-
-                FROM
-                product_options
-
-                WHERE
-                color_id = %(color_id)s
-                AND size_id = %(size_id)s
-                AND is_deleted = False
-                AND product_id = %(product_id)s
-                """
-
-                # 쿼리문과 필요한 정보를 인자로 넘겨주어 메소드를 실행하고,
-                cursor.execute(select_product_option_no_query, order_info)
-
-                # 해당 옵션의 id 값을 리턴해 줍니다.
-                return cursor.fetchone()
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def get_quantity_start_time(self, quantity_no, db_connection):
-
-        """
-
-        인자로 들어온 quantity_no에 해당하는 row의 start_time을 리턴합니다.
-
-        Args:
-            order_detail_no : quantity_no (pk)
-            db_connection   : 연결된 db 객체
-
-        Returns:
-            start_time : row의 start_time
-
-        Author:
-            tnwjd060124@gmail.com (손수정)
-
-        History:
-            2020-09-08 (tnwjd060124@gmail.com) : 초기 생성
-
-        """
-
         with db_connection.cursor() as cursor:
 
-            select_start_time = """
-            SELECT
-                start_time
-            FROM
-                quantities
-            WHERE
-                quantity_no = %s
-            """
-
-            cursor.execute(select_start_time, quantity_no)
+            # 헤더의 토큰에서 유저의 id를 받아와 인자로 넣어주면,
+            # 해당 유저의 이름, 이메일, 그리고 배송지 정보들(존재하지 않으면 NULL)을 리턴해 줍니다.
+            cursor.execute(self.SELECT_ORDERER_INFO_QUERY, user_no)
+            orderer_info = cursor.fetchone()
 
-            start_time = cursor.fetchone()
+            # 유저의 정보가 존재하지 않는다면
+            if not orderer_info:
+                raise Exception('UNAUTHORIZED')
 
-            return start_time['start_time'].strftime('%Y-%m-%d %H:%M:%S')
+            return orderer_info
 
-    def select_user_shipping_details_info(self, order_info, db_connection):
+    def place_order(self, order_info, db_connection):
 
         """
 
-        user의 배송지 정보를 받아온 후, 유저의 배송지 정보가 없으면 insert, 있었으면 update를 해줍니다.
+        sp_place_order Procedure 를 호출하여 주문 생성에 필요한 모든 INSERT, UPDATE 를 한 번에 실행합니다.
+        (orders, orders_details, order_product 생성 + 현재 재고 차감 + quantities 선분이력 변경)
 
         Args:
-            order_info    : 해당 유저가 입력한 배송지 정보.
+            order_info    : 주문 정보 (user_no, user_shipping_detail_no, total_price, delivery_request, product_option_no, quantity)
             db_connection : 연결된 db 객체
 
         Returns:
+            order_detail_no : 생성된 orders_details 테이블의 id(pk)
 
         Authors:
             minho.lee0716@gmail.com (이민호)
 
         History:
-            2020-09-08 (minho.lee0716@gmail.com) : 초기 생성
-            2020-09-09 (minho.lee0716@gmail.com) : 수정
-                select, insert, update 쿼리문 분리
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 유저의 id를 확인후, 해당 유저의 배송지 정보를 가져오는 쿼리문 입니다.
-                select_user_shipping_details_query = """
-                SELECT
-                    USD.receiver,
-                    USD.address,
-                    USD.additional_address,
-                    USD.zip_code,
-                    USD.phone_number
-
-                FROM
-                user_shipping_details AS USD
-
-                WHERE
-                USD.user_id = %(user_no)s
-                """
-
-                cursor.execute(select_user_shipping_details_query, order_info)
-
-                return cursor.fetchone()
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def insert_user_shipping_details_info(self, order_info, db_connection):
+            2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
+                insert_orders, insert_orders_details, insert_order_product, update_current_quantity,
+                get_origin_quantity_no, insert_quantities, get_quantity_start_time, update_quantities 를 통합
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                배송지 id 를 subquery 대신 배송지 저장 시 확인한 user_shipping_detail_no 로 전달
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                재고가 부족하여 주문이 생성되지 않았을 경우 OUT_OF_STOCK 예외처리
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                callproc 대신 CALL 문을 직접 실행하고 결과로 주문 상세 id 를 받도록 변경
 
         """
 
-        order_info의 객체에서 배송지 정보를 받아와 해당 유저의 새로운 배송지 정보를 생성해주는 메소드입니다.
-
-        Args:
-            order_info    : 해당 유저가 입력한 배송지 정보.
-            db_connection : 연결된 db 객체
+        with db_connection.cursor() as cursor:
 
-        Returns:
+            cursor.execute(self.PLACE_ORDER_QUERY, order_info)
+            order_detail_no = cursor.fetchone()['order_detail_no']
 
-        Authors:
-            minho.lee0716@gmail.com (이민호)
+            # CALL 문의 상태 결과까지 읽어 다음 query 를 실행할 수 있도록 함
+            while cursor.nextset():
+                pass
 
-        History:
-            2020-09-08 (minho.lee0716@gmail.com) : 초기 생성
-            2020-09-09 (minho.lee0716@gmail.com) : 수정
-                select, insert, update 쿼리문 분리
+            # Procedure 는 재고가 구매 수량보다 적으면 재고를 차감하지 않고 주문도 생성하지 않습니다.
+            if not order_detail_no:
+                raise Exception('OUT_OF_STOCK')
 
-        """
+            return order_detail_no
 
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 유저의 id를 확인후, 해당 유저의 배송지 정보를 추가하는 쿼리문 입니다
-                insert_user_shipping_details_query = """
-                INSERT INTO user_shipping_details (
-                    user_id,
-                    receiver,
-                    address,
-                    additional_address,
-                    zip_code,
-                    phone_number
-                ) VALUES (
-                    %(user_no)s,
-                    %(receiver)s,
-                    %(address)s,
-                    %(additional_address)s,
-                    %(zip_code)s,
-                    %(phone_number)s
-                )
-                """
-
-                user_shipping_details_info = cursor.execute(insert_user_shipping_details_query, order_info)
-
-                if user_shipping_details_info <= 0:
-                    raise Exception('QUERY_FAILED')
-
-                return 1
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def update_user_shipping_details_info(self, order_info, db_connection):
+    def upsert_user_shipping_details(self, order_info, db_connection):
 
         """
 
-        order_info의 객체에서 배송지 정보를 받아와 해당 유저의 새로운 배송지 정보로 업데이트 해주는 메소드입니다.
+        유저의 배송지 정보가 없으면 insert, 있으면 update 를 한 번의 쿼리로 실행합니다.
 
         Args:
             order_info    : 해당 유저가 입력한 배송지 정보.
             db_connection : 연결된 db 객체
 
         Returns:
+            user_shipping_detail_no : 생성 또는 수정된 user_shipping_details 테이블의 id(pk)
 
         Authors:
             minho.lee0716@gmail.com (이민호)
@@ -1128,313 +699,52 @@ class OrderDao:
             2020-09-08 (minho.lee0716@gmail.com) : 초기 생성
             2020-09-09 (minho.lee0716@gmail.com) : 수정
                 select, insert, update 쿼리문 분리
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                select 후 insert/update 하던 쿼리를 user_id Unique Index 를 이용한 upsert 하나로 통합
 
         """
 
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 유저의 id를 확인후, 해당 유저의 배송지 정보를 업데이트하는 쿼리문 입니다.
-                update_user_shipping_details_query = """
-                UPDATE
-                user_shipping_details
-
-                SET
-                receiver           = %(receiver)s,
-                address            = %(address)s,
-                additional_address = %(additional_address)s,
-                zip_code           = %(zip_code)s,
-                phone_number       = %(phone_number)s
-
-                WHERE
-                user_id = %(user_no)s
-                """
-
-                cursor.execute(update_user_shipping_details_query, order_info)
-
-                return 1
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def update_current_quantity(self, order_info, db_connection):
-
-        """
-
-        product_options 테이블에있는 재고에서 받아온 주문 정보에 대한 수량을 빼주는 메소드입니다.
-
-        Args:
-            order_info    : 주문 정보
-            db_connection : 연결된 db 객체
-
-        Returns:
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-09 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 현재 재고에서 받아온 수량을 빼주는 update 쿼리입니다.
-                update_current_quantities_query = """
-                UPDATE
-                    product_options
-                SET
-                current_quantity = current_quantity - %(quantity)s
-
-                WHERE
-                product_option_no = %(product_option_no)s
-                """
-
-                # update쿼리문과 주문 정보를 인자로 주어 현재 재고를 업데이트 해줍니다.
-                affected_row = cursor.execute(update_current_quantities_query, order_info)
-
-                # 변경된 사항이 없다면 에러를 보내줍니다.
-                if affected_row < 0:
-                    raise Exception("Query Failed")
-
-                return 1
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def get_origin_quantity_no(self, order_info, db_connection):
-
-        """
-
-        quantities테이블의 원래 선분이력의 row id를 가져오는 메소드
-
-        Args:
-            order_info    : 주문 정보
-            db_connection : 연결된 db 객체
-
-        Returns:
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-09 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 현재 재고에서 받아온 수량을 빼주는 update 쿼리입니다.
-                get_origin_quantity_query = """
-                SELECT
-                quantity_no
-
-                FROM quantities
-
-                WHERE
-                product_option_id = %(product_option_no)s
-                AND close_time = '9999-12-31 23:59:59'
-                """
-
-                # update쿼리문과 주문 정보를 인자로 주어 현재 재고를 업데이트 해줍니다.
-                affected_row = cursor.execute(get_origin_quantity_query, order_info)
-
-                # 변경된 사항이 없다면 에러를 보내줍니다.
-                if affected_row < 0:
-                    raise Exception("Query Failed")
+        with db_connection.cursor() as cursor:
 
-                return cursor.fetchone()
+            cursor.execute(self.UPSERT_USER_SHIPPING_DETAILS_QUERY, order_info)
 
-        except KeyError as e:
-            raise e
+            if not cursor.lastrowid:
+                raise Exception('QUERY_FAILED')
 
-        except Exception as e:
-            raise e
+            return cursor.lastrowid
 
-    def select_product_quantity_range(self, product_info, db_connection):
+    def select_order_preconditions(self, order_info, db_connection):
 
         """
 
-        해당 상품의 최소구매 수량, 최대구매 수량의 개수를 가져오는 메소드입니다.
+        주문 전 확인이 필요한 유저의 존재 유무, 상품의 가격과 할인율, 최소/최대 구매 수량을 한 번에 가져오는 메소드입니다.
 
         Args:
-            product_info  : 상품 정보
+            order_info    : 유저의 id(user_no)와 상품의 id(product_id)
             db_connection : 연결된 db 객체
 
         Returns:
             {
+                "user_no"            : 1,
+                "original_price"     : 12500.00,
+                "discount_rate"      : 10,
                 "min_sales_quantity" : 1,
                 "max_sales_quantity" : 20
             }
+            유저가 존재하지 않으면 None, 상품이 존재하지 않으면 상품 관련 값이 None 입니다.
 
         Authors:
             minho.lee0716@gmail.com (이민호)
 
         History:
             2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
+                select_product_quantity_range, select_product_info, select_user_existence 를 하나의 쿼리로 통합
 
         """
 
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 해당 상품에 대한 최소, 최대 구매 가능한 개수를 가져오는 쿼리문 입니다.
-                select_sales_quantity = """
-                SELECT
-                    PD.min_sales_quantity,
-                    PD.max_sales_quantity
-
-                FROM
-                    products AS P
-
-                LEFT JOIN product_details AS PD
-                ON P.product_no = PD.product_id
-                AND PD.close_time = '9999-12-31 23:59:59'
-                AND PD.is_activated = True
-                AND PD.is_displayed = True
-
-                WHERE
-                    P.is_deleted = False
-                    AND P.product_no = %(product_id)s
-                """
-
-                # update쿼리문과 주문 정보를 인자로 주어 현재 재고를 업데이트 해줍니다.
-                affected_row = cursor.execute(select_sales_quantity, product_info)
-
-                # 변경된 사항이 없다면 에러를 보내줍니다.
-                if affected_row < 0:
-                    raise Exception("Query Failed")
-
-                return cursor.fetchone()
-
-        except KeyError as e:
-            raise e
-
-        except Exception as e:
-            raise e
-
-    def select_product_info(self, order_info, db_connection):
-
-        """
-
-        구매하고자 하는 상품의 정보들을 리턴해 줍니다.
-
-        Args:
-            order_info  : 주문 정보가 들어있습니다.
-            db_connection : 연결된 db 객체
-
-        Returns:
-            product_info : 구매하고자 하는 상품의 정보를 리턴해줍니다. (product_details 테이블의 정보)
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                select_product_info_query = """
-                SELECT
-                    PD.price AS original_price,
-                    CASE
-                        WHEN PD.discount_rate IS NULL THEN 0
-                        ELSE CASE
-                            WHEN PD.discount_start_date IS NULL THEN PD.discount_rate
-                            WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate
-                            ELSE 0
-                            END
-                        END
-                    AS discount_rate
-
-                FROM products AS P
-
-                LEFT JOIN product_details AS PD
-                ON P.product_no = PD.product_id
-                AND PD.is_activated = True
-                AND PD.is_displayed = True
-                AND PD.close_time = '9999-12-31 23:59:59'
-
-                WHERE
-                    P.is_deleted = False
-                    AND P.product_no = %(product_id)s
-                """
-
-                # 상품 번호만 받아와 해당 상품의 정보들을 seller_product에 담아줍니다.
-                cursor.execute(select_product_info_query, order_info)
-                product_info = cursor.fetchone()
-
-                # 셀러의 상품이(구매하려는 상품) 존재하지 않을 경우 예외처리
-                if not product_info:
-                    raise Exception('THIS_PRODUCT_DOES_NOT_EXISTS')
-
-                return product_info
-
-        except  Exception as e:
-            raise e
-
-    def select_user_existence(self, user_no, db_connection):
-
-        """
-
-        해당 유저의 정보를 찾아주는 메소드입니다.
-
-        Args:
-            user_no       : 유저의 id
-            db_connection : 연결된 db 객체
-
-        Returns:
-            유저의 존재 유무를 리턴해 줍니다.
-
-        Authors:
-            minho.lee0716@gmail.com (이민호)
-
-        History:
-            2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        try:
-
-            with db_connection.cursor() as cursor:
-
-                # 유저의 id를 검색해 존재하는 유저인지 확인해주는 쿼리입니다.
-                select_user_existence_query = """
-                SELECT
-                    user_no
-
-                FROM
-                    users
-
-                WHERE
-                    is_deleted = False
-                    AND user_no = %s
-                """
-
-                # 쿼리문을 실행하고,
-                cursor.execute(select_user_existence_query, user_no)
-
-                # 유저의 정보를 가져와 user_existence라는 변수에 담아줍니다.
-                user_existence = cursor.fetchone()
+        with db_connection.cursor() as cursor:
 
-                # 존재하는 유저라면 유저의 번호를, 존재하지 않는 유저라면 None(Null)을 리턴합니다.
-                return user_existence
+            cursor.execute(self.SELECT_ORDER_PRECONDITIONS_QUERY, order_info)
 
-        except  Exception as e:
-            raise e
+            # 존재하지 않는 유저라면 None(Null)을 리턴합니다.
+            return cursor.fetchone()
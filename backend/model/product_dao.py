@@ -2,13 +2,51 @@ import uuid
 
 class ProductDao:
 
-    def insert_product(self, db_connection):
+    # 상품등록 기준 정보(색상, 사이즈, 카테고리) 조회 query
+    # 요청마다 query 문자열을 새로 만들지 않도록 class 정의 시점에 한번만 생성해 재사용
+    SELECT_COLORS_QUERY = """
+    SELECT
+        color_no,
+        name
+
+    FROM colors
+    """
+
+    SELECT_SIZES_QUERY = """
+    SELECT
+        size_no,
+        name
+
+    FROM sizes
+    """
+
+    SELECT_MAIN_CATEGORIES_QUERY = """
+    SELECT
+        main_category_no,
+        name
+
+    FROM main_categories
+    """
+
+    SELECT_SUB_CATEGORIES_QUERY = """
+    SELECT
+        sub_category_no,
+        name
+
+    FROM sub_categories
+
+    WHERE
+        main_category_id = %s
+    """
+
+    def insert_product(self, product_info, db_connection):
 
         """
 
-        상품 테이블(products)에 insert 하고 product_no(PK)를 Return 합니다.
+        상품 테이블(products)과 상품 상세 테이블(product_details)에 insert 하고 product_no(PK)를 Return 합니다.
 
         Args:
+            product_info  : business layer로 부터 받은 Parameter
             db_connection : DATABASE Connection Instance
 
         Returns:
@@ -22,33 +60,53 @@ class ProductDao:
             2020-08-26 (sincerity410@gmail.com) : controller, service, model role 재정의에 따른 함수수정,
                                                   예외처리 추가
             2020-09-02 (sincerity410@gmail.com) : product_code 등록 추가
+            2020-09-10 (sincerity410@gmail.com) : sp_insert_product Procedure 호출로 상세정보 insert 까지
+                                                  한 번의 round-trip 으로 처리
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                # insert new product
+                # insert new product and product detail
+                # callproc 은 parameter 설정(SET) query 를 따로 실행하므로 CALL 문을 직접 실행하고
+                # OUT parameter 대신 Procedure 의 결과(SELECT)로 product_no 를 받음
                 insert_product_query = """
-                INSERT INTO products (
-                    created_at,
-                    is_deleted,
-                    product_code
-                ) VALUES (
-                    DEFAULT,
-                    DEFAULT,
-                    %s
-                    )
+                CALL sp_insert_product(
+                    %(product_code)s,
+                    %(sellYn)s,
+                    %(exhibitionYn)s,
+                    %(mainCategoryId)s,
+                    %(subCategoryId)s,
+                    %(productName)s,
+                    %(simpleDescription)s,
+                    %(detailInformation)s,
+                    %(price)s,
+                    %(discountRate)s,
+                    %(discountStartDate)s,
+                    %(discountEndDate)s,
+                    %(minSalesQuantity)s,
+                    %(maxSalesQuantity)s,
+                    %(now)s
+                )
                 """
 
                 # insert query execute
-                affected_row = cursor.execute(insert_product_query, str(uuid.uuid4()))
+                cursor.execute(insert_product_query, {**product_info, 'product_code' : str(uuid.uuid4())})
+                product = cursor.fetchone()
 
                 # check query execution
-                if affected_row <= 0:
+                if not product:
                     raise Exception('QUERY_FAILED')
 
-                return cursor.lastrowid
+                # CALL 문의 상태 결과까지 읽어 다음 query 를 실행할 수 있도록 함
+                while cursor.nextset():
+                    pass
+
+                return product['product_no']
+
+        except KeyError as e:
+            raise e
 
         except Exception as e:
             raise e
@@ -283,15 +341,12 @@ class ProductDao:
                 I.image_medium AS thumbnail_image,
                 PD.name AS product_name,
                 PD.price AS original_price,
-                CASE
-                    WHEN PD.discount_rate IS NULL THEN 0 -- discount_rate이 NULL 인 경우 0
-                    ELSE CASE
-                        WHEN PD.discount_start_date IS NULL THEN PD.discount_rate -- 할인 기간이 무기한인 경우
-                        WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate -- 할인기간이 유효한 경우
-                        ELSE 0 -- 할인 기간이 아닌 경우
-                        END
-                    END
-                AS discount_rate
+                -- 할인 기간이 무기한이거나 유효한 경우 할인율 적용 (base_discount_rate : 할인율이 NULL 이면 0)
+                IF(
+                    PD.discount_start_date IS NULL OR NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date,
+                    PD.base_discount_rate,
+                    0
+                ) AS discount_rate
 
             FROM products AS P
 
@@ -364,15 +419,11 @@ class ProductDao:
                 PD.price AS original_price,
                 PD.min_sales_quantity,
                 PD.max_sales_quantity,
-                CASE
-                    WHEN PD.discount_rate IS NULL THEN 0
-                    ELSE CASE
-                        WHEN PD.discount_start_date IS NULL THEN PD.discount_rate
-                        WHEN NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date THEN PD.discount_rate
-                        ELSE 0
-                        END
-                    END
-                AS discount_rate
+                IF(
+                    PD.discount_start_date IS NULL OR NOW() BETWEEN PD.discount_start_date AND PD.discount_end_date,
+                    PD.base_discount_rate,
+                    0
+                ) AS discount_rate
 
             FROM products AS P
 
@@ -416,21 +467,14 @@ class ProductDao:
 
         History:
             2020-08-29 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : class 단위 query 상수 사용
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                select_colors_query = """
-                SELECT
-                    color_no,
-                    name
-
-                FROM colors
-                """
-
-                cursor.execute(select_colors_query)
+                cursor.execute(self.SELECT_COLORS_QUERY)
                 colors = cursor.fetchall()
 
                 return colors
@@ -464,21 +508,14 @@ class ProductDao:
 
         History:
             2020-08-29 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : class 단위 query 상수 사용
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                select_colors_query = """
-                SELECT
-                    size_no,
-                    name
-
-                FROM sizes
-                """
-
-                cursor.execute(select_colors_query)
+                cursor.execute(self.SELECT_SIZES_QUERY)
                 colors = cursor.fetchall()
 
                 return colors
@@ -607,6 +644,146 @@ class ProductDao:
         except Exception as e:
             raise e
 
+    def insert_product_options(self, product_id, options, db_connection):
+
+        """
+
+        상품의 옵션 정보 테이블(product_options)에 모든 옵션을 한번에 insert 하고
+        (color_id, size_id) 별 product_option_no(PK)를 Return 합니다.
+
+        Args:
+            product_id    : 상품 테이블(products) PK
+            options       : color_id, size_id, quantity 를 가진 옵션 List
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            {(color_id, size_id) : product_option_no}
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                # 모든 값이 placeholder 인 경우에만 pymysql 이 multi-row INSERT 로 변환하므로
+                # is_deleted 는 column 목록에서 제외해 DEFAULT 값 사용
+                insert_product_options_query = """
+                INSERT INTO product_options (
+                    product_id,
+                    color_id,
+                    size_id,
+                    current_quantity
+                ) VALUES (
+                    %s,
+                    %s,
+                    %s,
+                    %s
+                )
+                """
+
+                affected_row = cursor.executemany(
+                    insert_product_options_query,
+                    [
+                        (
+                            product_id,
+                            option['color_id'],
+                            option['size_id'],
+                            option['quantity']
+                        )
+                        for option in options
+                    ]
+                )
+
+                if affected_row != len(options) :
+                    raise Exception('QUERY_FAILED')
+
+                # auto increment 값이 연속된다는 보장이 없으므로 등록한 옵션의 PK 를 다시 조회
+                select_product_options_query = """
+                SELECT
+                    product_option_no,
+                    color_id,
+                    size_id
+
+                FROM product_options
+
+                WHERE
+                    product_id = %s
+                """
+
+                cursor.execute(select_product_options_query, product_id)
+
+                return {
+                    (product_option['color_id'], product_option['size_id']) : product_option['product_option_no']
+                    for product_option in cursor.fetchall()
+                }
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
+    def insert_quantities(self, now, quantities, db_connection):
+
+        """
+
+        상품 제고 수량 테이블(quantities)에 모든 옵션의 수량을 한번에 insert 합니다.
+
+        Args:
+            now           : 선분이력 시작 시간
+            quantities    : (product_option_id, quantity) tuple List
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        try:
+            with db_connection.cursor() as cursor:
+
+                insert_quantities_query = """
+                INSERT INTO quantities (
+                    product_option_id,
+                    quantity,
+                    start_time
+                ) VALUES (
+                    %s,
+                    %s,
+                    %s
+                )
+                """
+
+                affected_row = cursor.executemany(
+                    insert_quantities_query,
+                    [
+                        (product_option_id, quantity, now)
+                        for product_option_id, quantity in quantities
+                    ]
+                )
+
+                if affected_row != len(quantities) :
+                    raise Exception('QUERY_FAILED')
+
+                return None
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
     def select_main_category_list(self, db_connection):
 
         """
@@ -630,21 +807,14 @@ class ProductDao:
 
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : class 단위 query 상수 사용
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                select_main_categories_query = """
-                SELECT
-                    main_category_no,
-                    name
-
-                FROM main_categories
-                """
-
-                cursor.execute(select_main_categories_query)
+                cursor.execute(self.SELECT_MAIN_CATEGORIES_QUERY)
                 main_categories = cursor.fetchall()
 
                 return main_categories
@@ -679,24 +849,14 @@ class ProductDao:
 
         History:
             2020-08-30 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : class 단위 query 상수 사용
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                select_sub_categories_query = """
-                SELECT
-                    sub_category_no,
-                    name
-
-                FROM sub_categories
-
-                WHERE
-                    main_category_id = %s
-                """
-
-                cursor.execute(select_sub_categories_query, main_cetegory_id)
+                cursor.execute(self.SELECT_SUB_CATEGORIES_QUERY, main_cetegory_id)
                 sub_categories = cursor.fetchall()
 
                 if len(sub_categories) ==0 :
@@ -904,12 +1064,147 @@ class ProductDao:
 
             return etc_options
 
+    def get_registered_product_filter_query(self, filter_info):
+
+        """
+
+        [상품관리 > 상품관리]
+        등록된 상품 List, Total Count 조회에 공통으로 사용하는 FROM, WHERE 절과 query parameter 를 Return 합니다.
+
+        Args:
+            filter_info : Parameter로 들어온 filter의 Dictionary 객체
+
+        Returns:
+            (FROM, WHERE 절 query, query parameter Dictionary 객체)
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : select_registered_product_list 에서 분리
+            2020-09-10 (sincerity410@gmail.com) : 상품명 검색을 LIKE 대신 FULLTEXT 검색으로 변경
+            2020-09-10 (sincerity410@gmail.com) : 2글자 미만 상품명은 LIKE 로 검색
+
+        """
+
+        try:
+            # 전달받은 filter_info 를 변경하지 않도록 복사해서 사용
+            filter_params = dict(filter_info)
+
+            filter_query = """
+            FROM (
+                SELECT products.*,
+                CASE
+                	WHEN (product_details.discount_end_date IS NULL AND product_details.discount_start_date IS NULL) AND product_details.discount_rate IS NOT NULL
+                		THEN product_details.discount_rate
+                	WHEN (product_details.discount_end_date IS NOT NULL AND product_details.discount_start_date IS NOT NULL) AND (product_details.discount_start_date <= now() AND product_details.discount_end_date >= now())
+                		THEN product_details.discount_rate
+                	ELSE 0
+                END AS discountRate
+                FROM products
+
+            INNER JOIN product_details
+            ON product_details.product_id = products.product_no
+            AND product_details.close_time = '9999-12-31 23:59:59'
+            ) AS P
+
+            INNER JOIN product_images as PI
+            ON P.product_no = PI.product_id
+            AND PI.close_time = '9999-12-31 23:59:59'
+            AND PI.is_main = 1
+
+            INNER JOIN images as I
+            ON PI.image_id = I.image_no
+            AND I.is_deleted = 0
+
+            INNER JOIN product_details as PD
+            ON PD.product_id = P.product_no
+            AND PD.close_time = '9999-12-31 23:59:59'
+
+            WHERE
+                P.is_deleted = False
+            """
+
+            # Filtering 시작
+
+            # 판매 여부 필터링
+            if filter_info['sellYn'] is not None :
+                filter_query += """
+                AND PD.is_activated = %(sellYn)s
+                """
+
+            # 할인 여부 필터링
+            if filter_info['discountYn'] is not None :
+                filter_query += """
+                AND (
+                CASE
+                    WHEN discountRate = 0
+                        THEN FALSE
+                    ELSE TRUE
+                END) = %(discountYn)s
+                """
+
+            # 진열 여부 필터링
+            if filter_info['exhibitionYn'] is not None :
+                filter_query += """
+                AND PD.is_displayed = %(exhibitionYn)s
+                """
+
+            # 상품 등록 기간 시작일자 필터링
+            if filter_info['startDate'] is not None :
+                filter_query += """
+                AND P.created_at >= %(startDate)s
+                """
+
+            # 상품 등록 기간 종료일자 필터링
+            if filter_info['endDate'] is not None :
+                filter_params['endDate'] = filter_info['endDate'] + 1
+                filter_query += """
+                AND P.created_at < %(endDate)s
+                """
+
+            # 상품명 일부 일치 조건 필터링 (FULLTEXT(ngram) 구문 검색)
+            # ngram_token_size(2) 보다 짧은 검색어는 FULLTEXT 로 찾을 수 없으므로 LIKE 로 검색, 빈 검색어는 필터 미적용
+            product_name = (filter_info['productName'] or '').replace('"', '').strip()
+
+            if len(product_name) >= 2 :
+                filter_params['productName'] = f'"{product_name}"'
+                filter_query += """
+                AND MATCH(PD.name) AGAINST(%(productName)s IN BOOLEAN MODE)
+                """
+
+            elif product_name :
+                filter_params['productName'] = f"%{product_name}%"
+                filter_query += """
+                AND PD.name LIKE %(productName)s
+                """
+
+            # 상품 번호 일치 조건 필터링
+            if filter_info['productNo'] is not None :
+                filter_query += """
+                AND P.product_no = %(productNo)s
+                """
+
+            # 상품 코드 일치 조건 필터링
+            if filter_info['productCode'] is not None :
+                filter_query += """
+                AND P.product_code = %(productCode)s
+                """
+
+            return filter_query, filter_params
+
+        except KeyError as e:
+            raise e
+
+        except Exception as e:
+            raise e
+
     def select_registered_product_list(self, filter_info, db_connection):
 
         """
 
         [상품관리 > 상품관리]
-        관리자 페이지에서 등록된 상품의 List와 Total Count를 Return 합니다.
+        관리자 페이지에서 등록된 상품의 List를 Return 합니다.
 
         Args:
             filter_info   : Parameter로 들어온 filter의 Dictionary 객체
@@ -931,10 +1226,7 @@ class ProductDao:
                         productSmallImageUrl : SMALL SIZE IMAGE URL
                         sellPrice            : 상품 가격
                     }
-                ],
-                    {
-                        "total": 검색된 상품 개수
-                    }
+                ]
             ]
 
         Author:
@@ -943,16 +1235,18 @@ class ProductDao:
         History:
             2020-09-01 (sincerity410@gmail.com) : 초기생성
             2020-09-03 (sincerity410@gmail.com) : Filtering 조건 추가
+            2020-09-10 (sincerity410@gmail.com) : SQL_CALC_FOUND_ROWS 제거, Total Count 조회 함수 분리
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
+                filter_query, filter_params = self.get_registered_product_filter_query(filter_info)
+
                 select_product_list_query = """
                 -- 상품 조회 Query Start
                 SELECT
-                    SQL_CALC_FOUND_ROWS
                     P.created_at as productRegistDate,
                     I.image_small as productSmallImageUrl,
                     PD.name as productName,
@@ -968,96 +1262,7 @@ class ProductDao:
                     END AS discountYn,
                     IF(PD.is_displayed = 1, "진열", "미진열") as productExhibitYn,
                     IF(PD.is_activated = 1, "판매", "미판매") as productSellYn
-
-                FROM (
-                    SELECT products.*,
-                    CASE
-                    	WHEN (product_details.discount_end_date IS NULL AND product_details.discount_start_date IS NULL) AND product_details.discount_rate IS NOT NULL
-                    		THEN product_details.discount_rate
-                    	WHEN (product_details.discount_end_date IS NOT NULL AND product_details.discount_start_date IS NOT NULL) AND (product_details.discount_start_date <= now() AND product_details.discount_end_date >= now())
-                    		THEN product_details.discount_rate
-                    	ELSE 0
-                    END AS discountRate
-                    FROM products
-
-                INNER JOIN product_details
-                ON product_details.product_id = products.product_no
-                AND product_details.close_time = '9999-12-31 23:59:59'
-                ) AS P
-
-                INNER JOIN product_images as PI
-                ON P.product_no = PI.product_id
-                AND PI.close_time = '9999-12-31 23:59:59'
-                AND PI.is_main = 1
-
-                INNER JOIN images as I
-                ON PI.image_id = I.image_no
-                AND I.is_deleted = 0
-
-                INNER JOIN product_details as PD
-                ON PD.product_id = P.product_no
-                AND PD.close_time = '9999-12-31 23:59:59'
-
-                WHERE
-                    P.is_deleted = False
-                """
-
-                # Filtering 시작
-
-                # 판매 여부 필터링
-                if filter_info['sellYn'] is not None :
-                    select_product_list_query += """
-                    AND PD.is_activated = %(sellYn)s
-                    """
-
-                # 할인 여부 필터링
-                if filter_info['discountYn'] is not None :
-                    select_product_list_query += """
-                    AND (
-                    CASE
-                        WHEN discountRate = 0
-                            THEN FALSE
-                        ELSE TRUE
-                    END) = %(discountYn)s
-                    """
-
-                # 진열 여부 필터링
-                if filter_info['exhibitionYn'] is not None :
-                    select_product_list_query += """
-                    AND PD.is_displayed = %(exhibitionYn)s
-                    """
-
-                # 상품 등록 기간 시작일자 필터링
-                if filter_info['startDate'] is not None :
-                    select_product_list_query += """
-                    AND P.created_at >= %(startDate)s
-                    """
-
-                # 상품 등록 기간 종료일자 필터링
-                if filter_info['endDate'] is not None :
-                    filter_info['endDate'] += 1
-                    select_product_list_query += """
-                    AND P.created_at < %(endDate)s
-                    """
-
-                # 상품명 일부 일치 조건 필터링
-                if filter_info['productName'] is not None :
-                    filter_info['productName'] = f"%{filter_info['productName']}%"
-                    select_product_list_query += """
-                    AND PD.name like %(productName)s
-                    """
-
-                # 상품 번호 일치 조건 필터링
-                if filter_info['productNo'] is not None :
-                    select_product_list_query += """
-                    AND P.product_no = %(productNo)s
-                    """
-
-                # 상품 코드 일치 조건 필터링
-                if filter_info['productCode'] is not None :
-                    select_product_list_query += """
-                    AND P.product_code = %(productCode)s
-                    """
+                """ + filter_query
 
                 # 정렬 및 Page Nation 적용
                 select_product_list_query += """
@@ -1070,17 +1275,10 @@ class ProductDao:
                     %(offset)s
                 """
 
-                cursor.execute(select_product_list_query, filter_info)
+                cursor.execute(select_product_list_query, filter_params)
                 product_list = cursor.fetchall()
 
-                select_product_count = """
-                SELECT FOUND_ROWS() as total
-                """
-
-                cursor.execute(select_product_count)
-                total = cursor.fetchone()
-
-                return product_list, total
+                return product_list
 
         except KeyError as e:
             raise e
@@ -1088,47 +1286,44 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def select_product_code(self, product_id, db_connection):
+    def select_registered_product_count(self, filter_info, db_connection):
 
         """
 
-        상품 테이블(products)의 product_code 값을 Return 합니다.
+        [상품관리 > 상품관리]
+        관리자 페이지에서 filter 조건에 해당하는 등록된 상품의 Total Count를 Return 합니다.
 
         Args:
-            product_id : products 테이블의 PK
+            filter_info   : Parameter로 들어온 filter의 Dictionary 객체
             db_connection : DATABASE Connection Instance
 
         Returns:
-            product_code : products Table의 product_code(Unique Value)
+            {
+                "total": 검색된 상품 개수
+            }
 
         Author:
             sincerity410@gmail.com (이곤호)
 
         History:
-            2020-09-02 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                select_product_code_query = """
-                SELECT
-                    product_code
-
-                FROM products
-
-                WHERE
-                    product_no = %s
-                """
+                filter_query, filter_params = self.get_registered_product_filter_query(filter_info)
 
-                cursor.execute(select_product_code_query, product_id)
-                product_code = cursor.fetchone()
+                select_product_count_query = """
+                SELECT
+                    COUNT(*) as total
+                """ + filter_query
 
-                if product_code is None:
-                    raise Exception("INVALID_PRODUCT_ID")
+                cursor.execute(select_product_count_query, filter_params)
+                total = cursor.fetchone()
 
-                return product_code
+                return total
 
         except KeyError as e:
             raise e
@@ -1136,47 +1331,47 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def select_color_id(self, option, db_connection):
+    def select_product_code(self, product_id, db_connection):
 
         """
 
-        option Dictionary 객체의 colorName으로 부터 color id(PK)를 Return 합니다.
+        상품 테이블(products)의 product_code 값을 Return 합니다.
 
         Args:
-            option        : product regist의 optionQuantity key의 value
+            product_id : products 테이블의 PK
             db_connection : DATABASE Connection Instance
 
         Returns:
-            color_no : colors table PK
+            product_code : products Table의 product_code(Unique Value)
 
         Author:
             sincerity410@gmail.com (이곤호)
 
         History:
-            2020-09-05 (sincerity410@gmail.com) : 초기생성
+            2020-09-02 (sincerity410@gmail.com) : 초기생성
 
         """
 
         try:
             with db_connection.cursor() as cursor:
 
-                select_color_id_query = """
+                select_product_code_query = """
                 SELECT
-                    color_no
+                    product_code
 
-                FROM colors
+                FROM products
 
                 WHERE
-                    name = %s
+                    product_no = %s
                 """
 
-                cursor.execute(select_color_id_query, option['color'])
-                color_id = cursor.fetchone()
+                cursor.execute(select_product_code_query, product_id)
+                product_code = cursor.fetchone()
 
-                if color_id is None:
-                    raise Exception('INVALID_COLOR_NAME')
+                if product_code is None:
+                    raise Exception("INVALID_PRODUCT_ID")
 
-                return color_id['color_no']
+                return product_code
 
         except KeyError as e:
             raise e
@@ -1184,47 +1379,68 @@ class ProductDao:
         except Exception as e:
             raise e
 
-    def select_size_id(self, option, db_connection):
+    def select_option_ids(self, options, db_connection):
 
         """
 
-        option Dictionary 객체의 sizeName으로 부터 size id(PK)를 Return 합니다.
+        option Dictionary 객체 List의 colorName, sizeName으로 부터 color id(PK), size id(PK)를 한번에 Return 합니다.
 
         Args:
-            option        : product regist의 optionQuantity key의 value
+            options       : product regist의 optionQuantity key의 value List
             db_connection : DATABASE Connection Instance
 
         Returns:
-            size_no : sizes table PK
+            color_ids : { 소문자 color name : colors table PK }
+            size_ids  : { 소문자 size name : sizes table PK }
 
         Author:
             sincerity410@gmail.com (이곤호)
 
         History:
             2020-09-05 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : 옵션 별 select_color_id, select_size_id 조회를
+                                                  IN 조건으로 한번에 조회하도록 통합
 
         """
 
         try:
+            if not options:
+                return {}, {}
+
             with db_connection.cursor() as cursor:
 
-                select_size_id_query = """
+                select_color_ids_query = """
                 SELECT
-                    size_no
+                    color_no,
+                    name
+
+                FROM colors
+
+                WHERE
+                    name IN %s
+                """
+
+                cursor.execute(select_color_ids_query, (tuple({option['color'] for option in options}),))
+
+                # DB collation(utf8mb4_general_ci)과 같이 대소문자 구분 없이 찾을 수 있도록 소문자 key 사용
+                color_ids = {color['name'].lower() : color['color_no'] for color in cursor.fetchall()}
+
+                select_size_ids_query = """
+                SELECT
+                    size_no,
+                    name
 
                 FROM sizes
 
                 WHERE
-                    name = %s
+                    name IN %s
                 """
 
-                cursor.execute(select_size_id_query, option['size'])
-                size_id = cursor.fetchone()
+                cursor.execute(select_size_ids_query, (tuple({option['size'] for option in options}),))
 
-                if size_id is None:
-                    raise Exception('INVALID_SIZE_NAME')
+                size_ids = {size['name'].lower() : size['size_no'] for size in cursor.fetchall()}
 
-                return size_id['size_no']
+                return color_ids, size_ids
 
         except KeyError as e:
             raise e
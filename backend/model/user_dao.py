@@ -2,6 +2,189 @@ from flask import jsonify
 
 class UserDao:
 
+    # filter 조건에 따라 달라지지 않는 query
+    # 요청마다 query 문자열을 새로 만들지 않도록 class 정의 시점에 한번만 생성해 재사용
+    INSERT_USER_QUERY = """
+        INSERT INTO users (
+            name,
+            email,
+            social_id,
+            user_social_id
+        ) VALUES (
+            %(name)s,
+            %(email)s,
+            %(social_id)s,
+            %(user_social_id)s
+        )
+        """
+
+    SELECT_SOCIAL_USER_QUERY = """
+        SELECT
+            user_no
+        FROM
+            users
+        WHERE
+            social_id = %(social_id)s
+            AND user_social_id = %(user_social_id)s
+        LIMIT 1
+        """
+
+    SELECT_USER_PASSWORD_QUERY = """
+        SELECT
+            user_no,
+            password
+        FROM
+            users
+        WHERE
+            email = %(email)s
+        LIMIT 1
+        """
+
+    UPDATE_USER_LAST_ACCESS_QUERY = """
+        UPDATE
+            users
+        SET
+            last_access = CURRENT_TIMESTAMP
+        WHERE
+            user_no = %(user_no)s
+        """
+
+    SELECT_USER_ORDERS_QUERY = """
+        SELECT
+            P1.order_no,
+            P2.order_detail_no,
+            P2.start_time,
+            P7.image_small,
+            P12.product_no,
+            P8.name AS product_name,
+            P9.name AS color,
+            P10.name AS size,
+            P3.quantity,
+            P2.total_price,
+            P11.name AS order_status
+
+        FROM orders AS P1
+
+        INNER JOIN orders_details AS P2
+        ON P1.order_no = P2.order_id
+
+        INNER JOIN order_product AS P3
+        ON P2.order_detail_no = P3.order_detail_id
+
+        INNER JOIN product_options AS P4
+        ON P3.product_option_id = P4.product_option_no
+
+        INNER JOIN product_images AS P6
+        ON P4.product_id = P6.product_id
+        AND P6.is_main = 1
+        AND P2.start_time >= P6.start_time
+        AND P6.close_time >= P2.start_time
+
+        INNER JOIN images AS P7
+        ON P7.image_no = P6.image_id
+
+        INNER JOIN product_details AS P8
+        ON P4.product_id = P8.product_id
+        AND P2.start_time >= P8.start_time
+        AND P8.close_time >= P2.start_time
+
+        INNER JOIN colors AS P9
+        ON P9.color_no = P4.color_id
+
+        INNER JOIN sizes AS P10
+        ON P10.size_no = P4.size_id
+
+        INNER JOIN order_status AS P11
+        ON P11.order_status_no = P2.order_status_id
+
+        INNER JOIN products AS P12
+        ON P12.product_no = P4.product_id
+
+        WHERE P1.user_id = %(user_no)s
+
+        ORDER BY P1.order_no DESC
+        """
+
+    SELECT_USER_ORDER_DETAIL_QUERY = """
+        SELECT
+            P1.order_detail_no,
+            P1.start_time,
+            P3.name AS orderer,
+            P7.name AS product_name,
+            P7.price,
+            P9.image_small,
+            P11.name AS color,
+            P12.name AS size,
+            P5.quantity,
+            P13.name AS order_status,
+            P4.receiver,
+            P4.phone_number,
+            P4.address,
+            P4.additional_address,
+            P4.delivery_request,
+            IF(
+                P7.discount_start_date IS NULL OR P1.start_time BETWEEN P7.discount_start_date AND P7.discount_end_date,
+                P7.base_discount_rate,
+                0
+            ) AS discount_rate
+
+        FROM
+            orders_details AS P1
+
+        INNER JOIN orders AS P2
+        ON P2.order_no = P1.order_id
+        AND P2.user_id = %(user_no)s
+
+        INNER JOIN users AS P3
+        ON P2.user_id = P3.user_no
+
+        INNER JOIN user_shipping_details AS P4
+        ON P1.user_shipping_id = P4.user_shipping_detail_no
+
+        INNER JOIN order_product AS P5
+        ON P1.order_detail_no = P5.order_detail_id
+
+        INNER JOIN product_options AS P6
+        ON P6.product_option_no = P5.product_option_id
+
+        INNER JOIN product_details AS P7
+        ON P6.product_id = P7.product_id
+        AND P1.start_time >= P7.start_time
+        AND P7.close_time >= P1.start_time
+
+        INNER JOIN product_images AS P8
+        ON P6.product_id = P8.product_id
+
+        INNER JOIN images AS P9
+        ON P9.image_no = P8.image_id
+        AND P1.start_time >= P9.start_time
+        AND P9.close_time >= P1.start_time
+
+        INNER JOIN colors AS P11
+        ON P6.color_id = P11.color_no
+
+        INNER JOIN sizes AS P12
+        ON P6.size_id = P12.size_no
+
+        INNER JOIN order_status AS P13
+        ON P1.order_status_id = P13.order_status_no
+
+        WHERE
+            P1.order_detail_no = %(order_detail_no)s
+        """
+
+    UPDATE_USER_SHIPPING_DETAIL_QUERY = """
+        UPDATE
+            user_shipping_details
+        SET
+            phone_number = %(phone_number)s,
+            address = %(address)s,
+            additional_address = %(additional_address)s,
+            zip_code = %(zip_code)s
+        WHERE
+            user_id = %(user_no)s
+        """
+
     def signup_user(self, user_info, db_connection):
 
         """
@@ -31,21 +214,7 @@ class UserDao:
 
         with db_connection.cursor() as cursor:
 
-            insert_user_query = """
-            INSERT INTO users (
-                name,
-                email,
-                social_id,
-                user_social_id
-            ) VALUES (
-                %(name)s,
-                %(email)s,
-                %(social_id)s,
-                %(user_social_id)s
-            )
-            """
-
-            cursor.execute(insert_user_query, user_info)
+            cursor.execute(self.INSERT_USER_QUERY, user_info)
 
             user = cursor.lastrowid
             return user
@@ -96,6 +265,11 @@ class UserDao:
                         user_no = %(user_no)s
                     """
 
+            # email, user_no 모두 unique 하므로 첫번째 row 에서 조회 종료
+            select_user_query += """
+            LIMIT 1
+            """
+
             cursor.execute(select_user_query, user_info)
 
             user = cursor.fetchone()
@@ -129,35 +303,25 @@ class UserDao:
 
         with db_connection.cursor() as cursor:
 
-            select_user_query = """
-            SELECT
-                user_no
-            FROM
-                users
-            WHERE
-                social_id = %(social_id)s
-                AND user_social_id = %(user_social_id)s
-            """
-
-            cursor.execute(select_user_query, user_info)
+            cursor.execute(self.SELECT_SOCIAL_USER_QUERY, user_info)
 
             user = cursor.fetchone()
 
             return user
 
-    def get_user_password(self, user_info, db_connection):
+    def authenticate(self, user_info, db_connection):
 
         """
 
-        유저의 비밀번호를 리턴합니다.
+        로그인 할 유저의 pk와 비밀번호를 한 번에 리턴합니다.
 
         Args:
             user_info:
-                user_no : 유저의 pk
+                email : 이메일
             db_connection : 연결된 db 객체
 
         Returns:
-            유저의 password
+            유저의 pk와 password
 
             400 : KeyError
 
@@ -166,25 +330,18 @@ class UserDao:
 
         History:
             2020-08-21 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                유저 확인(check_user)과 비밀번호 조회(get_user_password)를 하나의 쿼리로 통합
 
         """
 
         with db_connection.cursor() as cursor:
 
-            select_password_query = """
-            SELECT
-                password
-            FROM
-                users
-            WHERE
-                user_no = %(user_no)s
-            """
-
-            cursor.execute(select_password_query, user_info)
+            cursor.execute(self.SELECT_USER_PASSWORD_QUERY, user_info)
 
-            password = cursor.fetchone()
+            user = cursor.fetchone()
 
-            return password
+            return user
 
     def update_user_last_access(self, user_info, db_connection):
 
@@ -209,16 +366,7 @@ class UserDao:
 
         with db_connection.cursor() as cursor:
 
-            update_user_query = """
-            UPDATE
-                users
-            SET
-                last_access = CURRENT_TIMESTAMP
-            WHERE
-                user_no = %(user_no)s
-            """
-
-            cursor.execute(update_user_query, user_info)
+            cursor.execute(self.UPDATE_USER_LAST_ACCESS_QUERY, user_info)
 
             return cursor.lastrowid
 
@@ -242,13 +390,16 @@ class UserDao:
             2020-08-21 (tnwjd060124@gmail.com) : 초기 생성
             2020-08-24 (tnwjd060124@gmail.com) : pagination 기능 추가
             2020-09-02 (tnwjd060124@gmail.com) : 필터 기능 추가
+            2020-09-10 (tnwjd060124@gmail.com) : 총 유저의 수(total_number)를 window 함수로 함께 조회
 
         """
 
         with db_connection.cursor() as cursor:
 
+            # COUNT(*) OVER() 는 LIMIT 적용 전 filter 조건에 맞는 전체 유저의 수
             select_user_query = """
             SELECT
+                COUNT(*) OVER() AS total_number,
                 users.user_no,
                 users.name,
                 users.email,
@@ -354,114 +505,6 @@ class UserDao:
 
             return users
 
-    def get_total_user(self, filter_info, db_connection):
-
-        """
-
-        총 유저의 수를 보여줍니다.
-
-        Args:
-            filter_info: filter 정보
-            db_connection : 연결된 db 객체
-
-        Returns:
-            총 유저의 수
-
-        Authors:
-            tnwjd060124@gmail.com (손수정)
-
-        History:
-            2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
-            2020-09-02 (tnwjd060124@gmail.com) : 필터 기능 추가
-
-        """
-
-        with db_connection.cursor() as cursor:
-
-            select_user_query = """
-            SELECT
-                COUNT(*) AS total_number
-            FROM
-                users
-
-            LEFT JOIN
-                user_shipping_details
-            ON users.user_no = user_shipping_details.user_id
-
-            LEFT JOIN
-                social_networks
-            ON users.social_id = social_networks.social_network_no
-            """
-
-            # 삭제 되지 않은 데이터만 조회
-            select_user_query += """
-            WHERE
-                users.is_deleted = 0
-            """
-
-            # 회원 번호 filter 기능
-            if filter_info['user_no']:
-                select_user_query += """
-                AND users.user_no = %(user_no)s
-                """
-
-            # 회원명 filter 기능
-            if filter_info['user_name']:
-                select_user_query += """
-                AND users.name = %(user_name)s
-                """
-
-            # 이메일 filter 기능
-            if filter_info['email']:
-                select_user_query += """
-                AND users.email = %(email)s
-                """
-
-            # 최종 접속일 filter 기능
-            if filter_info['lastaccess_from']:
-                select_user_query += """
-                AND users.last_access >= %(lastaccess_from)s
-                """
-
-            if filter_info['lastaccess_to']:
-                select_user_query += """
-                AND users.last_access <= %(lastaccess_to)s
-                """
-
-            # 등록일 filter 기능
-            if filter_info['created_from']:
-                select_user_query += """
-                AND users.created_at >= %(created_from)s
-                """
-
-            if filter_info['created_to']:
-                select_user_query += """
-                AND users.created_at <= %(created_to)s
-                """
-
-            # 핸드폰 번호 filter 기능
-            if filter_info['phone_number']:
-                select_user_query += """
-                AND user_shipping_details.phone_number = %(phone_number)s
-                """
-
-            # 소셜 계정 filter 기능
-            if filter_info['social_network']:
-                if filter_info['social_network'] == '브랜디':
-                    select_user_query += """
-                    AND users.social_id IS NULL
-                    """
-                else:
-                    select_user_query += """
-                    AND social_networks.name = %(social_network)s
-                    """
-
-            cursor.execute(select_user_query, filter_info)
-
-            total_number = cursor.fetchone()
-
-            return total_number
-
     def get_user_orders(self, user_info, db_connection):
 
         """
@@ -490,63 +533,7 @@ class UserDao:
 
         with db_connection.cursor() as cursor:
 
-            select_user_orders = """
-            SELECT
-                P1.order_no,
-                P2.order_detail_no,
-                P2.start_time,
-                P7.image_small,
-                P12.product_no,
-                P8.name AS product_name,
-                P9.name AS color,
-                P10.name AS size,
-                P3.quantity,
-                P2.total_price,
-                P11.name AS order_status
-
-            FROM orders AS P1
-
-            INNER JOIN orders_details AS P2
-            ON P1.order_no = P2.order_id
-
-            INNER JOIN order_product AS P3
-            ON P2.order_detail_no = P3.order_detail_id
-
-            INNER JOIN product_options AS P4
-            ON P3.product_option_id = P4.product_option_no
-
-            INNER JOIN product_images AS P6
-            ON P4.product_id = P6.product_id
-            AND P6.is_main = 1
-            AND P2.start_time >= P6.start_time
-            AND P6.close_time >= P2.start_time
-
-            INNER JOIN images AS P7
-            ON P7.image_no = P6.image_id
-
-            INNER JOIN product_details AS P8
-            ON P4.product_id = P8.product_id
-            AND P2.start_time >= P8.start_time
-            AND P8.close_time >= P2.start_time
-
-            INNER JOIN colors AS P9
-            ON P9.color_no = P4.color_id
-
-            INNER JOIN sizes AS P10
-            ON P10.size_no = P4.size_id
-
-            INNER JOIN order_status AS P11
-            ON P11.order_status_no = P2.order_status_id
-
-            INNER JOIN products AS P12
-            ON P12.product_no = P4.product_id
-
-            WHERE P1.user_id = %(user_no)s
-
-            ORDER BY P1.order_no DESC
-            """
-
-            cursor.execute(select_user_orders, user_info)
+            cursor.execute(self.SELECT_USER_ORDERS_QUERY, user_info)
 
             orders = cursor.fetchall()
 
@@ -577,79 +564,7 @@ class UserDao:
 
         with db_connection.cursor() as cursor:
 
-            select_order_detail = """
-            SELECT
-                P1.order_detail_no,
-                P1.start_time,
-                P3.name AS orderer,
-                P7.name AS product_name,
-                P7.price,
-                P9.image_small,
-                P11.name AS color,
-                P12.name AS size,
-                P5.quantity,
-                P13.name AS order_status,
-                P4.receiver,
-                P4.phone_number,
-                P4.address,
-                P4.additional_address,
-                P4.delivery_request,
-                CASE
-                    WHEN P7.discount_rate IS NULL THEN 0
-                    ELSE CASE
-                        WHEN P7.discount_start_date IS NULL THEN P7.discount_rate
-                        WHEN P1.start_time BETWEEN P7.discount_start_date AND P7.discount_end_date THEN P7.discount_rate
-                        ELSE 0
-                        END
-                    END
-                AS discount_rate
-
-            FROM
-                orders_details AS P1
-
-            INNER JOIN orders AS P2
-            ON P2.order_no = P1.order_id
-            AND P2.user_id = %(user_no)s
-
-            INNER JOIN users AS P3
-            ON P2.user_id = P3.user_no
-
-            INNER JOIN user_shipping_details AS P4
-            ON P1.user_shipping_id = P4.user_shipping_detail_no
-
-            INNER JOIN order_product AS P5
-            ON P1.order_detail_no = P5.order_detail_id
-
-            INNER JOIN product_options AS P6
-            ON P6.product_option_no = P5.product_option_id
-
-            INNER JOIN product_details AS P7
-            ON P6.product_id = P7.product_id
-            AND P1.start_time >= P7.start_time
-            AND P7.close_time >= P1.start_time
-
-            INNER JOIN product_images AS P8
-            ON P6.product_id = P8.product_id
-
-            INNER JOIN images AS P9
-            ON P9.image_no = P8.image_id
-            AND P1.start_time >= P9.start_time
-            AND P9.close_time >= P1.start_time
-
-            INNER JOIN colors AS P11
-            ON P6.color_id = P11.color_no
-
-            INNER JOIN sizes AS P12
-            ON P6.size_id = P12.size_no
-
-            INNER JOIN order_status AS P13
-            ON P1.order_status_id = P13.order_status_no
-
-            WHERE
-                P1.order_detail_no = %(order_detail_no)s
-            """
-
-            cursor.execute(select_order_detail, user_info)
+            cursor.execute(self.SELECT_USER_ORDER_DETAIL_QUERY, user_info)
 
             order_detail = cursor.fetchone()
 
@@ -681,19 +596,8 @@ class UserDao:
         """
 
         with db_connection.cursor() as cursor:
-            update_shipping_detail = """
-            UPDATE
-                user_shipping_details
-            SET
-                phone_number = %(phone_number)s,
-                address = %(address)s,
-                additional_address = %(additional_address)s,
-                zip_code = %(zip_code)s
-            WHERE
-                user_id = %(user_no)s
-            """
 
-            affected_rows = cursor.execute(update_shipping_detail, user_info)
+            affected_rows = cursor.execute(self.UPDATE_USER_SHIPPING_DETAIL_QUERY, user_info)
 
             if affected_rows < 1:
                 return None
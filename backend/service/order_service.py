@@ -1,4 +1,15 @@
-import math, datetime
+import math, datetime, hashlib, orjson
+
+from connection import get_redis_connection
+
+# 결제 완료 리스트의 filter 조건 별 총 건수 cache 설정
+ORDER_TOTAL_NUMBER_CACHE_TTL = 60
+ORDER_TOTAL_NUMBER_VERSION_KEY = 'ordercount:version'
+ORDER_TOTAL_NUMBER_CACHE_KEY = 'ordercount:v{}:{}'
+
+# 주문하기 페이지의 주문자, 배송지 정보 cache 설정
+ORDERER_INFO_CACHE_TTL = 600
+ORDERER_INFO_CACHE_KEY = 'orderer:{}'
 
 class OrderService:
 
@@ -16,20 +27,121 @@ class OrderService:
             db_connection : 연결된 db 객체
 
         Returns:
-            결제 완료 리스트
+            (결제 완료 리스트, 총 결제 완료 건수, 다음 page 조회 시 사용할 cursor)
+            다음 page 가 없으면 cursor 는 None
 
         Authors:
             tnwjd060124@gmail.com (손수정)
 
         History:
             2020-08-24 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                총 결제 완료 건수를 함께 리턴, cache 에 건수가 없으면 리스트 조회 시 COUNT(*) OVER() 로 함께 조회
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                limit + 1 개를 조회해 다음 page 가 있는 경우에만 cursor 리턴
+
+        """
+
+        redis_connection = get_redis_connection()
+        count_key        = self.get_total_number_cache_key(filter_info, redis_connection)
+        cached_total     = redis_connection.get(count_key)
+
+        # 다음 page 존재 여부를 알 수 있도록 한 개 더 조회 (offset 은 요청한 limit 기준으로 이미 계산됨)
+        list_filter = dict(filter_info, limit=filter_info['limit'] + 1)
+
+        # cache 된 건수가 있으면 리스트만 조회
+        if cached_total is not None:
+            orders = self.order_dao.get_ordercompleted_list(list_filter, db_connection)
+
+            orders, next_cursor = self.get_next_cursor(orders, filter_info['limit'])
+
+            return orders, {'total_number' : int(cached_total)}, next_cursor
+
+        total_number = None
+
+        # cursor 로 조회하는 경우 cursor 이후의 row 만 집계되므로 window COUNT 를 사용하지 않음
+        if filter_info.get('cursor_time') and filter_info.get('cursor_id'):
+            orders = self.order_dao.get_ordercompleted_list(list_filter, db_connection)
+
+        else:
+            # 결제 완료 리스트와 총 건수를 한 번의 조회로 가져오는 메소드 실행
+            orders = self.order_dao.get_ordercompleted_list(list_filter, db_connection, with_total_number=True)
+
+            if orders:
+                total_number = orders[0]['total_number']
+
+                for order in orders:
+                    del order['total_number']
+
+        # page 에 해당하는 data 가 없거나 cursor 로 조회한 경우 총 결제 완료 건수 조회 메소드 실행
+        if total_number is None:
+            total_number = self.order_dao.get_total_num(filter_info, db_connection)['total_number']
+
+        redis_connection.setex(count_key, ORDER_TOTAL_NUMBER_CACHE_TTL, total_number)
+
+        orders, next_cursor = self.get_next_cursor(orders, filter_info['limit'])
+
+        return orders, {'total_number' : total_number}, next_cursor
+
+    def get_next_cursor(self, orders, limit):
+
+        """
+
+        limit + 1 개로 조회한 결제 완료 리스트에서 limit 개만 남기고, 다음 page 가 있으면 cursor 를 만듭니다.
+
+        Args:
+            orders : limit + 1 개로 조회한 결제 완료 리스트
+            limit  : 요청한 row 갯수
+
+        Returns:
+            (limit 개 이하의 결제 완료 리스트, 다음 page 조회 시 사용할 마지막 row 의 cursor 또는 None)
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
 
         """
 
-        # 결제 완료 리스트 가져오는 메소드 실행
-        orders = self.order_dao.get_ordercompleted_list(filter_info, db_connection)
+        # limit 개 이하로 조회된 경우 마지막 page
+        if len(orders) <= limit:
+            return orders, None
+
+        orders = orders[:limit]
+
+        next_cursor = {
+            "cursor_time" : orders[-1]['order_time'].strftime('%Y-%m-%d %H:%M:%S'),
+            "cursor_id"   : orders[-1]['order_product_no']
+        }
 
-        return orders
+        return orders, next_cursor
+
+    def export_order_list(self, filter_info, db_connection):
+
+        """
+
+        결제 완료 리스트 전체 다운로드 로직
+
+        Args:
+            filter_info : 필터 리스트
+            db_connection : 연결된 db 객체
+
+        Returns:
+            (나머지 row 를 읽을 server side cursor, 첫 번째 결제 완료 row)
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                응답 전에 query 를 실행하도록 cursor, 첫 row 를 Return
+
+        """
+
+        # 결과 전체를 메모리에 올리지 않도록 server side cursor 로 조회하는 메소드 실행
+        return self.order_dao.stream_ordercompleted_list(filter_info, db_connection)
 
     def check_filter_list(self, filter_info):
 
@@ -58,11 +170,28 @@ class OrderService:
 
         History:
             2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                제품명 검색이 FULLTEXT 검색으로 변경되어 LIKE 패턴 변환 제거
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                page, limit 없이 들어온 전체 조회 filter 허용
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                cursor 는 cursor_time, cursor_id 를 함께 전달해야 하며 page 1 에서만 사용 가능
 
         """
 
-        # offset 설정
-        filter_info['offset'] = (filter_info['page']*filter_info['limit']) - filter_info['limit']
+        # cursor(keyset pagination) 와 page(OFFSET) 를 함께 사용하지 않도록 제한
+        cursor_time = filter_info.get('cursor_time')
+        cursor_id   = filter_info.get('cursor_id')
+
+        if (cursor_time is None) != (cursor_id is None):
+            raise Exception('CURSOR_TIME_AND_CURSOR_ID_REQUIRED')
+
+        if cursor_time is not None and (filter_info.get('page') or 1) > 1:
+            raise Exception('PAGE_CANNOT_BE_USED_WITH_CURSOR')
+
+        # offset 설정 (전체 조회인 경우 page, limit 없음)
+        if filter_info.get('page') and filter_info.get('limit'):
+            filter_info['offset'] = (filter_info['page']*filter_info['limit']) - filter_info['limit']
 
         if not (filter_info['from_date'] or filter_info['to_date']):
 
@@ -77,36 +206,87 @@ class OrderService:
         if filter_info['to_date']:
             filter_info['to_date'] += 1
 
-        if filter_info['product_name']:
-            filter_info['product_name'] = f"%{filter_info['product_name']}%"
-
         return filter_info
 
-    def get_total_number(self, filters, db_connection):
+    def get_total_number_cache_key(self, filters, redis_connection):
 
         """
 
-        총 결제 완료 건수 조회
+        총 결제 완료 건수 cache key 생성
 
         Args:
-            filters : 필터 리스트
-            db_connection : 연결된 db 객체
+            filters          : 필터 리스트
+            redis_connection : 연결된 redis 객체
 
         Returns:
-            총 결제 완료 건수
+            총 결제 완료 건수 cache key
 
         Authors:
             tnwjd060124@gmail.com (손수정)
 
         History:
             2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                page 가 바뀌어도 같은 filter 조건의 총 건수는 동일하므로 Redis cache 적용
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                건수 조회는 get_order_list 에서 함께 처리하고 cache key 생성만 담당하도록 변경
 
         """
 
-        # 총 결제 완료 건수 조회 메소드 실행
-        total_number = self.order_dao.get_total_num(filters, db_connection)
+        # limit, offset 등 page 관련 정보를 제외한 filter 조건으로 cache key 생성
+        count_filter = {
+            key : value for key, value in filters.items()
+            if key not in ('page', 'limit', 'offset', 'sort', 'cursor_time', 'cursor_id')
+        }
+
+        version = redis_connection.get(ORDER_TOTAL_NUMBER_VERSION_KEY) or b'0'
 
-        return total_number
+        return ORDER_TOTAL_NUMBER_CACHE_KEY.format(
+            version.decode(),
+            hashlib.blake2b(orjson.dumps(count_filter, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+        )
+
+    def invalidate_total_number(self):
+
+        """
+
+        주문 생성, 재고 이력 변경 후 cache 된 총 결제 완료 건수를 무효화합니다.
+        version 을 증가시켜 이전 version 의 cache key 는 더 이상 조회되지 않고 TTL 이 지나면 삭제됩니다.
+
+        Returns:
+            None
+
+        Authors:
+            tnwjd060124@gmail.com (손수정)
+
+        History:
+            2020-09-10 (tnwjd060124@gmail.com) : 초기 생성
+
+        """
+
+        get_redis_connection().incr(ORDER_TOTAL_NUMBER_VERSION_KEY)
+
+    def invalidate_orderer_info(self, user_no):
+
+        """
+
+        배송지 정보가 변경된 후 cache 된 주문자 정보를 삭제합니다.
+
+        Args:
+            user_no : 유저의 id
+
+        Returns:
+            None
+
+        Authors:
+            minho.lee0716@gmail.com(이민호)
+
+        History:
+            2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
+
+        """
+
+        get_redis_connection().delete(ORDERER_INFO_CACHE_KEY.format(user_no))
 
     def get_order_detail(self, order_detail, db_connection):
 
@@ -166,6 +346,8 @@ class OrderService:
                 상품을 주문할 수 있게 프론트에게 option_detail_id를 리턴해 줍니다.
             2020-09-10 (minho.lee0716@gmail.com) : 수정
                 테이블 변경으로 인해 option_detail_id의 정보는 주지 않습니다.
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                주문자 정보를 Redis에 cache 합니다.
 
         """
 
@@ -175,8 +357,19 @@ class OrderService:
         # 할인된 가격 계산
         seller_product_info['sales_price'] = round(seller_product_info['original_price'] * (100 - seller_product_info['discount_rate'])/ 100, -1)
 
-        # 유저의 정보를 넘겨줌으로써 유저의 정보와 배송지 정보를 리턴해 줍니다.
-        orderer_info = self.order_dao.get_orderer_info(user_no, db_connection)
+        # 주문자 정보는 배송지를 변경할 때만 바뀌므로 Redis에 cache 된 정보가 있다면 그대로 사용합니다.
+        redis_connection = get_redis_connection()
+        orderer_key      = ORDERER_INFO_CACHE_KEY.format(user_no)
+        cached_orderer   = redis_connection.get(orderer_key)
+
+        if cached_orderer is not None:
+            orderer_info = orjson.loads(cached_orderer)
+
+        else:
+            # 유저의 정보를 넘겨줌으로써 유저의 정보와 배송지 정보를 리턴해 줍니다.
+            # (유저가 존재하지 않으면 UNAUTHORIZED 예외가 발생하므로 존재하는 유저의 정보만 cache 됩니다.)
+            orderer_info = self.order_dao.get_orderer_info(user_no, db_connection)
+            redis_connection.setex(orderer_key, ORDERER_INFO_CACHE_TTL, orjson.dumps(orderer_info))
 
         # 셀러 상품의 정보와 주문자의 정보, 주문자의 배송지 정보까지 한번에 리턴해 줍니다.
         return {**seller_product_info, **orderer_info}
@@ -200,44 +393,23 @@ class OrderService:
 
         History:
             2020-09-06 (minho.lee0716@gmail.com) : 초기 생성
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                주문 관련 INSERT, UPDATE 를 sp_place_order Procedure 호출 한 번으로 변경
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                재고 확인 시 가져온 product_option_no 를 그대로 사용
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                주문 전 재고 조회 대신 Procedure 의 재고 차감 결과로 재고 부족 확인
 
         """
 
-        # 유저의 id를 넘겨주고, orders 테이블에 insert하는 메소드를 실행 후, 해당 order_no의 id(pk)를 가져옵니다.
-        order_info['order_no'] = self.order_dao.insert_orders(order_info, db_connection)
-
-        # orders_details를 insert하는 메소드를 실행 후, 생성된 테이블의 id(pk)를 order_info에 넣어줍니다.
-        order_info['order_detail_no'] = self.order_dao.insert_orders_details(order_info, db_connection)
-
-        # 서브쿼리를 줄이기 위해 메소드를 실행하여 product_option_no을 가져와 order_info에 넣어줍니다.
-        product_option_no = self.order_dao.get_product_option_no(order_info, db_connection)
-
-        # 위에서 반환된 product_option_no 타입은 딕셔너리이므로, order_info와 병합해 줍니다.
-        order_info = {**order_info, **product_option_no}
-
-        # order_product를 insert하는 메소드를 실행 후, 생성된 테이블의 id(pk)를 order_info에 넣어줍니다.
-        order_info['order_product_no'] = self.order_dao.insert_order_product(order_info, db_connection)
-
-        # 주문 정보에서 받아온 상품의 개수를 현재 재고에서 빼주는 메소드 입니다.
-        self.order_dao.update_current_quantity(order_info, db_connection)
-
-        # 원래 선분이력의 row id를 가져오는 메소드입니다.
-        origin_quantity_info = self.order_dao.get_origin_quantity_no(order_info, db_connection)
-
-        # 현재 옵션에 대한 재고의 선분이력을 관리해주는 quantities테이블을 생성하는 메소드 실행하여 id(pk)를 반홥해 줍니다.
-        new_quantity_no = self.order_dao.insert_quantities(order_info, db_connection)
+        # product_option_no을 가져오지 않았다면 구매할 상품 옵션을 조회하여 order_info에 넣어줍니다.
+        if 'product_option_no' not in order_info:
+            self.get_product_option_no(order_info, db_connection)
 
-        # 선분이력을 관리하는 최신 재고에 대한 생성이력을 가져오는 메소드를 실행하여 start_time이라는 변수에 넣어줍니다.
-        start_time = self.order_dao.get_quantity_start_time(new_quantity_no, db_connection)
-
-        # quantities테이블에 선분이력 관리를 위해 새로 만들어준 선분에 해당하는 row의 정보 객체를 만들어줍니다.
-        # 원래 재고의 선분이력 종료시간을 update해주기 위해 새로운 테이블의 생성시간을 가져옵니다.
-        update_quantity_info = {
-            "origin_quantity_no" : origin_quantity_info['quantity_no'], # 원래 있었던 선분의 no
-            "start_time"         : start_time                           # 새로 생긴 선분의 start_time입니다.
-        }
-        # 선분이력을 관리하는 quantities 테이블의 종료시간에 새롭게 생성된 재고의 생성성시간을 넣어주는 메소드를 실행합니다.
-        self.order_dao.update_quantities(update_quantity_info, db_connection)
+        # 주문 생성(orders, orders_details, order_product), 재고 차감, 재고 선분이력 변경을
+        # sp_place_order Procedure 한 번의 호출로 처리하고 생성된 orders_details의 id(pk)를 넣어줍니다.
+        # 현재 재고가 구매 수량보다 적으면 OUT_OF_STOCK 에러가 발생합니다.
+        order_info['order_detail_no'] = self.order_dao.place_order(order_info, db_connection)
 
         return 1
 
@@ -261,85 +433,95 @@ class OrderService:
             2020-09-06 (minho.lee0716@gmail.com) : 초기 생성
             2020-09-09 (minho.lee0716@gmail.com) : 수정
                 user_shipping_details 테이블과 주문관련 테이블을 따로 작업하도록 메소드를 분리하였습니다.
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                주문 생성 시 사용할 배송지 id를 order_info에 넣어줍니다.
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                배송지 조회 후 Insert/Update 하던 것을 upsert 한 번으로 변경
 
         """
 
-        # 해당 유저의 배송지 정보를 찾는 메소드를 실행하고, 먄악 배송지 정보가 존재 할 경우,
-        if self.order_dao.select_user_shipping_details_info(order_info, db_connection):
-
-            # 받아온 정보를 유저의 배송지 정보에 Update 해줍니다.
-            self.order_dao.update_user_shipping_details_info(order_info, db_connection)
-
-        # 해당 유저의 배송지 정보가 존재하지 않을 경우,
-        else:
-
-            # 받아온 정보를 유저의 배송지 정보에 Insert 해줍니다.
-            self.order_dao.insert_user_shipping_details_info(order_info, db_connection)
+        # 받아온 정보로 유저의 배송지 정보를 Insert 또는 Update 하고, 주문 생성 시 사용할 배송지 id를 넣어줍니다.
+        order_info['user_shipping_detail_no'] = self.order_dao.upsert_user_shipping_details(order_info, db_connection)
 
         return 1
 
-    def get_current_quantity(self, order_info, db_connection):
+    def get_product_option_no(self, order_info, db_connection):
 
         """
 
-        상품을 구매하기 전, 구매하려는 상품의 개수와 현재 상품의 재고를 비교해주는 메소드 입니다.
+        구매하려는 상품 옵션의 id를 가져와 order_info에 넣어주는 메소드 입니다.
 
         Args:
-            order_info    : 유저의 id와 배송지 관련 정보가 들어있는 객체입니다.
+            order_info    : 상품의 id, 색상의 id, 사이즈의 id가 들어있는 객체입니다.
             db_connection : 연결된 db 객체
 
         Returns:
+            product_option_no : 해당 옵션의 id
+            (order_info에 해당 옵션의 id(product_option_no)를 넣어줍니다.)
 
         Authors:
             minho.lee0716@gmail.com(이민호)
 
         History:
             2020-09-09 (minho.lee0716@gmail.com) : 초기 생성
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                옵션 id 조회와 재고 조회를 get_seller_product_info 한 번의 조회로 변경
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                재고 확인은 주문 생성 시 재고 차감으로 처리하므로 get_current_quantity 에서 옵션 id 조회만 남김
 
         """
 
-        # 해당 옵션의 상품 재고를 가져오기 위해 먼저 해당 상품의 id를 가져오는 메소드를 실행해 줍니다.
-        product_option_no = self.order_dao.get_product_option_no(order_info, db_connection)
+        # 구매할 상품 정보를 조회하여 해당 옵션의 id를 가져옵니다.
+        seller_product_info = self.order_dao.get_seller_product_info(order_info, db_connection)
 
-        # 해당 옵션의 상품 재고를 가져오기 위해 해당 상품 옵션의 id값을 인자로 넘겨주고 현재 재고를 받아옵니다.
-        current_quantity = self.order_dao.get_current_quantity(product_option_no, db_connection)
+        # 주문 생성 시 사용할 옵션의 id를 order_info에 넣어줍니다.
+        order_info['product_option_no'] = seller_product_info['product_option_no']
 
-        return current_quantity
+        return order_info['product_option_no']
 
-    def get_product_quantity_range(self, product_info, db_connection):
+    def get_order_preconditions(self, product_info, user_no, db_connection):
 
         """
 
-        해당 상품의 구매가능한 최소수량과 최대수량의 개수를 가져오는 메소드입니다.
+        주문 전 확인이 필요한 유저의 존재 유무, 상품의 가격과 할인율, 구매가능한 최소수량과 최대수량을 가져오는 메소드입니다.
 
         Args:
-            product_info  : 유저의 id와 배송지 관련 정보가 들어있는 객체입니다.
+            product_info  : 구매하려는 상품의 id(product_id)가 들어있는 객체입니다.
+            user_no       : 토큰에서 받은 유저 id입니다.
             db_connection : 연결된 db 객체
 
         Returns:
+            유저의 정보가 없다면 None(Null)을, 있다면 상품의 가격, 할인율, 최소/최대 구매 수량을 리턴해 줍니다.
 
         Authors:
             minho.lee0716@gmail.com(이민호)
 
         History:
             2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
+                check_user_existence, get_product_quantity_range, 총 가격 계산용 상품 조회를 하나로 통합
 
         """
 
-        # 해당 옵션의 상품 재고를 가져오기 위해 해당 상품 옵션의 id값을 인자로 넘겨주고 현재 재고를 받아옵니다.
-        product_quantity_range = self.order_dao.select_product_quantity_range(product_info, db_connection)
+        order_preconditions = self.order_dao.select_order_preconditions(
+            {'user_no' : user_no, 'product_id' : product_info['product_id']},
+            db_connection
+        )
 
-        return product_quantity_range
+        # 유저는 존재하지만 구매하려는 상품이 존재하지 않을 경우 예외처리
+        if order_preconditions and order_preconditions['original_price'] is None:
+            raise Exception('THIS_PRODUCT_DOES_NOT_EXISTS')
 
-    def check_total_price(self, order_info, db_connection):
+        return order_preconditions
+
+    def check_total_price(self, order_info, order_preconditions):
 
         """
 
         프론트에서 받아온 주문 정보를 통해, 구매하고자 하는 상품의 총 가격에 대한 검사를 진행하는 메소드 입니다.
 
         Args:
-            order_info    : 주문 정보가 들어있는 객체입니다.
-            db_connection : 연결된 db 객체
+            order_info          : 주문 정보가 들어있는 객체입니다.
+            order_preconditions : get_order_preconditions 에서 가져온 상품의 원 가격과 할인율
 
         Returns:
             total_price : 구매하고자 하는 상품 * 수량을 한 총 가격.
@@ -349,15 +531,14 @@ class OrderService:
 
         History:
             2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
+            2020-09-10 (minho.lee0716@gmail.com) : 수정
+                상품 정보를 다시 조회하지 않고 get_order_preconditions 의 결과를 사용
 
         """
 
-        # 총 가격을 계산하기 위해, 해당 상품에 대한 원 가격과, 할인율을 가져옵니다.
-        product_info = self.order_dao.select_product_info(order_info, db_connection)
-
         # 가져온 해당 상품에 대한 원 가격과, 할인율 그리고 유저가 구매하고자 하는 수량을 받아온 후,
-        original_price = product_info['original_price']
-        discount_rate  = product_info['discount_rate']
+        original_price = order_preconditions['original_price']
+        discount_rate  = order_preconditions['discount_rate']
         quantity       = order_info['quantity']
 
         # 총 가격을 계산해 줍니다.
@@ -365,29 +546,3 @@ class OrderService:
 
         # 프론트에서 받아오는 총 가격을 int타입으로 유효성 검사를 진행 하였기에, int타입으로 리턴을 해줍니다.
         return int(total_price)
-
-    def check_user_existence(self, user_no, db_connection):
-
-        """
-
-        Access_Token에서 얻어온 유저의 정보가 올바른 유저인지 판단해주는 메소드입니다.
-
-        Args:
-            user_no       : 유저의 id
-            db_connection : 연결된 db 객체
-
-        Returns:
-            유저의 정보가 있다면 user_no를, 없다면 None(Null)을 리턴해 줍니다.
-
-        Authors:
-            minho.lee0716@gmail.com(이민호)
-
-        History:
-            2020-09-10 (minho.lee0716@gmail.com) : 초기 생성
-
-        """
-
-        # 총 가격을 계산하기 위해, 해당 상품에 대한 원 가격과, 할인율을 가져옵니다.
-        user_existence = self.order_dao.select_user_existence(user_no, db_connection)
-
-        return user_existence
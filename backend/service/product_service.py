@@ -1,8 +1,26 @@
-import json, datetime, time, io, math
+import json, datetime, time, io, math, hashlib, orjson, uuid
 from PIL import Image
+from werkzeug.datastructures import FileStorage
 
-from utils import ResizeImage
-from config import S3
+from utils      import ResizeImage
+from config     import S3
+from connection import get_redis_connection
+
+# background worker 가 읽을 수 있도록 상품 원본 이미지를 임시 저장하는 S3 key
+PRODUCT_IMAGE_STAGING_KEY = 'staging/product/{}/{}'
+
+# 미리 업로드 된 상품 이미지 URL 로 허용하는 prefix (상품 bucket 또는 설정된 CDN 의 product/ 경로)
+PRODUCT_IMAGE_URL_PREFIXES = tuple(
+    f'{base_url}product/' for base_url in (S3['aws_url'], S3.get('cdn_url')) if base_url
+)
+
+# 상품 변경 시 증가하는 상품 List cache version key
+PRODUCT_LIST_VERSION_KEY = 'prodlist:version'
+
+# 상품관리 List 의 filter 조건 별 Total Count cache 설정
+# (상품 List cache 와 같은 version 을 key 에 포함해 상품 변경 시 함께 무효화)
+REGISTERED_PRODUCT_COUNT_CACHE_TTL = 30
+REGISTERED_PRODUCT_COUNT_CACHE_KEY = 'prodcount:v{}:{}'
 
 class ProductService:
 
@@ -53,36 +71,44 @@ class ProductService:
                                                   quantities) insert 수행
             2020-09-02 (sincerity410@gmail.com) : product_code(unique 값)의 insert로 구조 수정
             2020-09-08 (sincerity410@gmail.com) : 스키마 수정에 따른 함수 수정
+            2020-09-10 (sincerity410@gmail.com) : 옵션, 재고수량 insert 를 executemany 로 일괄 처리
+            2020-09-10 (sincerity410@gmail.com) : 선분 관리 시간을 문자열 변환 없이 datetime 으로 전달
+            2020-09-10 (sincerity410@gmail.com) : 상품, 상품 상세정보 insert 를 Procedure 호출 한 번으로 처리
+            2020-09-10 (sincerity410@gmail.com) : 옵션 별 색상, 사이즈 id 조회를 한번에 처리
 
         """
 
         try:
             # 선분 관리할 현재 시간 product_info에 저장
-            product_info['now'] = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            product_info['now'] = datetime.datetime.now().replace(microsecond=0)
 
-            # product에 insert 한 id를 product_info에 포함 > 상세정보(product_details) insert query 실행
-            product_info['product_id'] = self.product_dao.insert_product(db_connection)
-            self.product_dao.insert_product_detail(product_info, db_connection)
+            # 상품(products)과 상세정보(product_details)를 한번에 insert 하고 생성된 id를 product_info에 포함
+            product_info['product_id'] = self.product_dao.insert_product(product_info, db_connection)
 
             # nested JSON 구조인 optionQuantity를 form-data request로 받아 JSON 변환
             options = json.loads(product_info['optionQuantity'])
 
-            # 상품 옵션 별 produc_options, option_details, quantities 테이블 insert 수행 
-            for option in options :
-
-                # name으로 입력된 각 옵션의 id를 받아옴
-                color_id = self.product_dao.select_color_id(option, db_connection)
-                size_id  = self.product_dao.select_size_id(option, db_connection)
+            # name으로 입력된 각 옵션의 id를 한번에 받아옴
+            self.set_option_ids(options, db_connection)
 
-                # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                option['color_id'] = color_id
-                option['size_id']  = size_id
+            if options :
 
-                # 옵션 정보 저장
-                product_option_id  = self.product_dao.insert_product_option(product_info, option, db_connection)
+                # 옵션 정보를 한번에 저장하고 (color_id, size_id) 별 product_option_id 를 받아옴
+                product_option_ids = self.product_dao.insert_product_options(
+                    product_info['product_id'],
+                    options,
+                    db_connection
+                )
 
-                # 옵션에 해당하는 수량 정보 저장
-                self.product_dao.insert_quantity(product_info['now'], product_option_id, option, db_connection)
+                # 옵션에 해당하는 수량 정보를 한번에 저장
+                self.product_dao.insert_quantities(
+                    product_info['now'],
+                    [
+                        (product_option_ids[(option['color_id'], option['size_id'])], option['quantity'])
+                        for option in options
+                    ],
+                    db_connection
+                )
 
             # Image S3 Upload 및 RDB에 URL Link insert를 위해 product_id return
             return product_info['product_id']
@@ -90,6 +116,40 @@ class ProductService:
         except Exception as e:
             raise e
 
+    def set_option_ids(self, options, db_connection):
+
+        """
+
+        name으로 입력된 각 옵션의 color id, size id를 한번에 조회하여 옵션 정보에 저장합니다.
+
+        Args:
+            options       : color, size 를 name으로 가진 옵션 정보 List
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None (각 옵션에 color_id, size_id 저장)
+
+        Author :
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        color_ids, size_ids = self.product_dao.select_option_ids(options, db_connection)
+
+        for option in options:
+
+            if option['color'].lower() not in color_ids:
+                raise Exception('INVALID_COLOR_NAME')
+
+            if option['size'].lower() not in size_ids:
+                raise Exception('INVALID_SIZE_NAME')
+
+            option['color_id'] = color_ids[option['color'].lower()]
+            option['size_id']  = size_ids[option['size'].lower()]
+
     def get_product_list(self, db_connection):
 
         """
@@ -121,28 +181,28 @@ class ProductService:
         # 모든 상품을 리턴
         return products
 
-    def upload_product_image(self, images, product_id, s3_connection, db_connection):
+    def validate_product_image(self, images):
 
         """
 
-        상품 이미지 등록 - Business Layer(service) function
+        상품 이미지 유효성 검사 - Business Layer(service) function
+        (대표사진 등록 여부, 등록 순서, 이미지 사이즈 확인)
 
         Args:
-            images        : File Request(List)
+            images : File Request(List)
                 [
                     { 'product_image_<int>' : <FileStorage: {filename} ({content_type})>}
                 ]
-            s3_connection : S3 Connection Instance
 
         Returns:
-            None
+            { 'product_image_<int>' : <FileStorage: {filename} ({content_type})> }
 
         Author:
             sincerity410@gmail.com (이곤호)
 
         History:
             2020-08-27 (sincerity410@gmail.com) : 초기생성
-            2020-09-02 (sincerity410@gmail.com) : product_code 추가에 따른 구조 수정
+            2020-09-10 (sincerity410@gmail.com) : upload_product_image 에서 유효성 검사 분리
 
         """
 
@@ -173,6 +233,37 @@ class ProductService:
                     if width < 640 or height < 720 :
                         raise Exception('IMAGE_SIZE_IS_TOO_SMALL')
 
+            return product_images
+
+        except Exception as e:
+            raise e
+
+    def save_product_image(self, product_images, product_id, s3_connection, db_connection):
+
+        """
+
+        유효성 검사를 통과한 상품 이미지를 사이즈 별로 S3에 저장하고 URL을 DB에 Insert - Business Layer(service) function
+
+        Args:
+            product_images : { 'product_image_<int>' : <FileStorage: {filename} ({content_type})> }
+            product_id     : products Table의 PK
+            s3_connection  : S3 Connection Instance
+            db_connection  : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-08-27 (sincerity410@gmail.com) : 초기생성
+            2020-09-02 (sincerity410@gmail.com) : product_code 추가에 따른 구조 수정
+            2020-09-10 (sincerity410@gmail.com) : upload_product_image 에서 S3 저장 기능 분리
+
+        """
+
+        try:
             # image file name에 등록되는 product_code 조회
             product_code = self.product_dao.select_product_code(product_id, db_connection)
 
@@ -190,6 +281,232 @@ class ProductService:
         except Exception as e:
             raise e
 
+    def stage_product_image(self, product_images, product_id, s3_connection):
+
+        """
+
+        background worker 에서 처리할 상품 원본 이미지를 S3에 임시 저장 - Business Layer(service) function
+        (web 서버와 worker 가 같은 파일 시스템을 공유하지 않아도 되도록 원본을 S3에 둠)
+
+        Args:
+            product_images : { 'product_image_<int>' : <FileStorage: {filename} ({content_type})> }
+            product_id     : products Table의 PK
+            s3_connection  : S3 Connection Instance
+
+        Returns:
+            [
+                {
+                    'name'         : 'product_image_<int>',
+                    'key'          : 임시 저장한 S3 object key,
+                    'filename'     : 원본 파일 이름,
+                    'content_type' : Content-Type
+                }
+            ]
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        try:
+            staged_images = []
+
+            for name, image in product_images.items():
+                key = PRODUCT_IMAGE_STAGING_KEY.format(product_id, name)
+
+                # 유효성 검사에서 읽은 stream 을 처음으로 되돌린 뒤 upload
+                image.stream.seek(0)
+                s3_connection.upload_fileobj(
+                    image.stream,
+                    'brandi-project',
+                    key,
+                    ExtraArgs = {'ContentType' : image.content_type}
+                )
+
+                staged_images.append({
+                    'name'         : name,
+                    'key'          : key,
+                    'filename'     : image.filename,
+                    'content_type' : image.content_type
+                })
+
+            return staged_images
+
+        except Exception as e:
+            raise e
+
+    def load_staged_product_image(self, staged_images, s3_connection):
+
+        """
+
+        S3에 임시 저장한 상품 원본 이미지 조회 - Business Layer(service) function
+
+        Args:
+            staged_images : stage_product_image 에서 Return 한 List
+            s3_connection : S3 Connection Instance
+
+        Returns:
+            { 'product_image_<int>' : <FileStorage: {filename} ({content_type})> }
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        try:
+            product_images = {}
+
+            for staged_image in staged_images:
+                s3_object = s3_connection.get_object(Bucket='brandi-project', Key=staged_image['key'])
+
+                product_images[staged_image['name']] = FileStorage(
+                    stream       = io.BytesIO(s3_object['Body'].read()),
+                    filename     = staged_image['filename'],
+                    name         = staged_image['name'],
+                    content_type = staged_image['content_type']
+                )
+
+            return product_images
+
+        except Exception as e:
+            raise e
+
+    def delete_staged_product_image(self, staged_images, s3_connection):
+
+        """
+
+        S3에 임시 저장한 상품 원본 이미지 삭제 - Business Layer(service) function
+
+        Args:
+            staged_images : stage_product_image 에서 Return 한 List
+            s3_connection : S3 Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        try:
+            if staged_images:
+                s3_connection.delete_objects(
+                    Bucket = 'brandi-project',
+                    Delete = {'Objects' : [{'Key' : staged_image['key']} for staged_image in staged_images]}
+                )
+
+            return None
+
+        except Exception as e:
+            raise e
+
+    def register_product_image_url(self, image_urls, product_id, db_connection):
+
+        """
+
+        미리 업로드 된 상품 이미지 URL 등록 - Business Layer(service) function
+        (S3 upload, resize 없이 URL만 DB에 Insert)
+
+        Args:
+            image_urls    : 상품 이미지 순서대로 정렬된 사이즈 별 URL List (최대 5개, 첫번째가 대표사진)
+                            (create_product_image_upload_url 로 발급받은 경로에 업로드한 URL 만 허용)
+                [
+                    {
+                        'product_image_L' : Large 사이즈 url,
+                        'product_image_M' : Medium 사이즈 url,
+                        'product_image_S' : Small 사이즈 url
+                    }
+                ]
+            product_id    : products Table의 PK
+            db_connection : DATABASE Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : 상품 bucket(CDN) 의 product/ 경로 URL 만 등록하도록 제한
+
+        """
+
+        try:
+            # 대표사진 미등록 시 예외처리
+            if not image_urls :
+                raise Exception('THUMBNAIL_IMAGE_IS_REQUIRED')
+
+            # 상품사진은 최대 5개까지 등록 가능
+            if len(image_urls) > 5 :
+                raise Exception('TOO_MANY_IMAGES')
+
+            for idx, image_url in enumerate(image_urls, start=1) :
+
+                # 사이즈 별 URL이 모두 있고, 모두 상품 bucket(CDN) 의 product/ 경로인 경우에만 등록
+                if not isinstance(image_url, dict) or \
+                    any(
+                        not isinstance(image_url.get(size), str)
+                        or not image_url[size].startswith(PRODUCT_IMAGE_URL_PREFIXES)
+                        or '..' in image_url[size]
+                        for size in ('product_image_L', 'product_image_M', 'product_image_S')
+                    ) :
+                    raise Exception('INVALID_IMAGE_URL')
+
+                # 사진크기 별 image URL insert & product_images(매핑테이블) insert
+                image_no = self.product_dao.insert_image(image_url, db_connection)
+                self.product_dao.insert_product_image(product_id, image_no, f'product_image_{idx}', db_connection)
+
+            return None
+
+        except Exception as e:
+            raise e
+
+    def upload_product_image(self, images, product_id, s3_connection, db_connection):
+
+        """
+
+        상품 이미지 등록 - Business Layer(service) function
+
+        Args:
+            images        : File Request(List)
+                [
+                    { 'product_image_<int>' : <FileStorage: {filename} ({content_type})>}
+                ]
+            s3_connection : S3 Connection Instance
+
+        Returns:
+            None
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-08-27 (sincerity410@gmail.com) : 초기생성
+            2020-09-02 (sincerity410@gmail.com) : product_code 추가에 따른 구조 수정
+            2020-09-10 (sincerity410@gmail.com) : 유효성 검사, S3 저장 함수 분리
+
+        """
+
+        try:
+            product_images = self.validate_product_image(images)
+            self.save_product_image(product_images, product_id, s3_connection, db_connection)
+
+            return None
+
+        except Exception as e:
+            raise e
+
     def get_option_list(self, db_connection) :
 
         """
@@ -397,29 +714,37 @@ class ProductService:
         except Exception as e:
             raise e
 
-    def get_registered_product_list(self, filter_info, db_connection) :
+    def get_registered_product_list(
+        self,
+        sell_yn,
+        discount_yn,
+        exhibition_yn,
+        start_date,
+        end_date,
+        product_name,
+        product_no,
+        product_code,
+        page,
+        limit,
+        db_connection
+    ) :
 
         """
 
         Filtering을 통한 상품 List와 Total Count를 Return 하는Business Layer(service) function
 
         Args:
-            product_info:
-                sellYN       : 판매 여부
-                exhibitionYn : 진열 여부
-                discountYn   : 할인 여부
-                registDate   : 등록 일자(기준 시작일, 기준 종료일)
-                {
-                    startDate : "YYYYmmdd",
-                    endDate   : "YYYYmmdd"
-                }
-                productName  : 상품 이름
-                productNo    : 상품 번호
-                productCode  : 상품 코드
-                limit        : 페이지 당 상품 수
-                page         : 페이지 리스트 시작 기준
-
-            db_connection    : DATABASE Connection Instance
+            sell_yn       : 판매 여부
+            discount_yn   : 할인 여부
+            exhibition_yn : 진열 여부
+            start_date    : 등록 일자 기준 시작일("YYYYmmdd")
+            end_date      : 등록 일자 기준 종료일("YYYYmmdd")
+            product_name  : 상품 이름
+            product_no    : 상품 번호
+            product_code  : 상품 코드
+            page          : 페이지 리스트 시작 기준
+            limit         : 페이지 당 상품 수
+            db_connection : DATABASE Connection Instance
 
         Returns:
             data: [
@@ -448,17 +773,53 @@ class ProductService:
 
         History:
             2020-09-02 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : filter 조건을 위치 인자로 전달받도록 변경
+            2020-09-10 (sincerity410@gmail.com) : Total Count 별도 조회 및 Redis cache 적용
+            2020-09-10 (sincerity410@gmail.com) : Total Count cache key 에 상품 List version 포함
 
         """
 
         try:
-            # page 값으로 offset 정보 획득
-            filter_info['offset'] = filter_info['page'] * filter_info['limit'] - filter_info['limit']
-
-            # DB connection으로 (상품 List & Total Count) Return 하는 select_registered_product_list 함수 호출
+            # query parameter 로 사용할 filter 정보 생성 (page 값으로 offset 정보 획득)
+            filter_info = {
+                'sellYn'       : sell_yn,
+                'discountYn'   : discount_yn,
+                'exhibitionYn' : exhibition_yn,
+                'startDate'    : start_date,
+                'endDate'      : end_date,
+                'productName'  : product_name,
+                'productNo'    : product_no,
+                'productCode'  : product_code,
+                'limit'        : limit,
+                'offset'       : page * limit - limit
+            }
+
+            # 상품 List 조회 (LIMIT/OFFSET 적용)
             product_list = self.product_dao.select_registered_product_list(filter_info, db_connection)
 
-            return product_list
+            # 같은 filter 조건의 Total Count 는 page 가 바뀌어도 동일하므로 Redis에 cache
+            count_filter = (
+                sell_yn, discount_yn, exhibition_yn, start_date, end_date,
+                product_name, product_no, product_code
+            )
+            redis_connection = get_redis_connection()
+            version          = redis_connection.get(PRODUCT_LIST_VERSION_KEY) or b'0'
+
+            count_key = REGISTERED_PRODUCT_COUNT_CACHE_KEY.format(
+                version.decode(),
+                hashlib.blake2b(orjson.dumps(count_filter), digest_size=16).hexdigest()
+            )
+
+            cached_total = redis_connection.get(count_key)
+
+            if cached_total is not None:
+                total = {'total' : int(cached_total)}
+
+            else:
+                total = self.product_dao.select_registered_product_count(filter_info, db_connection)
+                redis_connection.setex(count_key, REGISTERED_PRODUCT_COUNT_CACHE_TTL, total['total'])
+
+            return product_list, total
 
         except Exception as e:
             raise e
@@ -532,6 +893,123 @@ class ProductService:
         except Exception as e:
             raise e
 
+    def create_detail_image_upload_url(self, content_type, s3_connection):
+
+        """
+
+        상품 상세 이미지 S3 직접 업로드용 presigned URL 발급 - Business Layer(service) function
+        (브라우저가 S3로 직접 PUT 하므로 서버는 이미지 파일을 전달받지 않음)
+
+        Args:
+            content_type  : 업로드 할 이미지의 Content-Type
+            s3_connection : S3 Connection Instance
+
+        Returns:
+            {
+                url        : presigned PUT URL,
+                fileName   : S3 object key,
+                public_url : 업로드 완료 후 사용할 image URL
+            }
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        try:
+            # 이미지 파일만 업로드 허용
+            if not content_type.startswith('image/'):
+                raise Exception('INVALID_CONTENT_TYPE')
+
+            # image file name 설정: detail_yyyy_mm_dd_{unix_time_stamp}
+            time_now  = datetime.datetime.now()
+            file_name = f"detail/{time_now.year}/{time_now.month}/{time_now.day}/{int(time.time())}"
+
+            # 5분간 유효한 PUT URL 발급
+            upload_url = s3_connection.generate_presigned_url(
+                'put_object',
+                Params = {
+                    'Bucket'      : 'brandi-project',
+                    'Key'         : file_name,
+                    'ContentType' : content_type
+                },
+                ExpiresIn = 300
+            )
+
+            return {
+                'url'        : upload_url,
+                'fileName'   : file_name,
+                'public_url' : f"{S3['aws_url']}{file_name}"
+            }
+
+        except Exception as e:
+            raise e
+
+    def create_product_image_upload_url(self, content_type, s3_connection):
+
+        """
+
+        상품 이미지(L, M, S 사이즈) S3 직접 업로드용 presigned URL 발급 - Business Layer(service) function
+        (브라우저에서 사이즈 별로 resize 한 이미지를 각 URL 로 PUT 한 뒤, public_url 을 imageUrls 로 상품등록 요청)
+
+        Args:
+            content_type  : 업로드 할 이미지의 Content-Type
+            s3_connection : S3 Connection Instance
+
+        Returns:
+            {
+                'product_image_L' : { url : presigned PUT URL, fileName : S3 object key, public_url : image URL },
+                'product_image_M' : { url : presigned PUT URL, fileName : S3 object key, public_url : image URL },
+                'product_image_S' : { url : presigned PUT URL, fileName : S3 object key, public_url : image URL }
+            }
+
+        Author:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기생성
+
+        """
+
+        try:
+            # 이미지 파일만 업로드 허용
+            if not content_type.startswith('image/'):
+                raise Exception('INVALID_CONTENT_TYPE')
+
+            # image file name 설정: product/yyyy/mm/dd/{uuid}_{size} (사이즈 별 이미지는 같은 uuid 사용)
+            time_now   = datetime.datetime.now()
+            image_name = f"product/{time_now.year}/{time_now.month}/{time_now.day}/{uuid.uuid4().hex}"
+
+            upload_url_info = {}
+
+            for size in ('L', 'M', 'S'):
+                file_name = f"{image_name}_{size}"
+
+                # 5분간 유효한 PUT URL 발급
+                upload_url = s3_connection.generate_presigned_url(
+                    'put_object',
+                    Params = {
+                        'Bucket'      : 'brandi-project',
+                        'Key'         : file_name,
+                        'ContentType' : content_type
+                    },
+                    ExpiresIn = 300
+                )
+
+                upload_url_info[f'product_image_{size}'] = {
+                    'url'        : upload_url,
+                    'fileName'   : file_name,
+                    'public_url' : f"{S3['aws_url']}{file_name}"
+                }
+
+            return upload_url_info
+
+        except Exception as e:
+            raise e
+
     def get_product_detail(self, product_id, db_connection) :
 
         """
@@ -632,6 +1110,8 @@ class ProductService:
 
         History:
             2020-09-07 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : 선분 관리 시간을 문자열 변환 없이 datetime 으로 전달
+            2020-09-10 (sincerity410@gmail.com) : 옵션 별 색상, 사이즈 id 조회를 한번에 처리
 
         """
         try:
@@ -649,11 +1129,14 @@ class ProductService:
             product_option = self.product_dao.select_product_option_to_compare(product_id, db_connection)
 
             # 선분 관리할 시간 생성
-            now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            now = datetime.datetime.now().replace(microsecond=0)
 
             # 옵션의 변경 발생 -> 옵션정보 수정 및 옵션 삭제(재고수량(quantities Table) 포함)
             if product_option['optionQuantity'] != option_quantity :
 
+                # name으로 입력된 request, DB 옵션의 id를 한번에 받아옴
+                self.set_option_ids(option_quantity + product_option['optionQuantity'], db_connection)
+
                 # request에만 존재하는 옵션을 저장
                 request_only_option = option_quantity
 
@@ -669,14 +1152,6 @@ class ProductService:
                         # option은 동일, 수량만 변경된 경우
                         if request_option['color'] == db_option['color'] and request_option['size'] == db_option['size'] and request_option['quantity'] != db_option['quantity']:
 
-                            # name으로 입력된 각 옵션의 id를 받아옴
-                            color_id = self.product_dao.select_color_id(request_option, db_connection)
-                            size_id  = self.product_dao.select_size_id(request_option, db_connection)
-
-                            # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                            request_option['color_id'] = color_id
-                            request_option['size_id']  = size_id
-
                             # 상품옵션 정보 Return
                             product_option_id = self.product_dao.select_product_option_number(product_id, request_option, db_connection)
 
@@ -708,14 +1183,6 @@ class ProductService:
                     # request(수정사항)에 새로 추가된 상품옵션(product_options) DB 상품옵션 soft delete
                     if not is_option_db:
 
-                        # name으로 입력된 각 옵션의 id를 받아옴
-                        color_id = self.product_dao.select_color_id(db_option, db_connection)
-                        size_id  = self.product_dao.select_size_id(db_option, db_connection)
-
-                        # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                        db_option['color_id'] = color_id
-                        db_option['size_id']  = size_id
-
                         # 상품 옵션 삭제 처리를 위해 product option number select
                         product_option_id = self.product_dao.select_product_option_number(product_id, db_option, db_connection)
 
@@ -725,14 +1192,6 @@ class ProductService:
                 # request에만 존재하는 option 정보 product_options 테이블에 insert
                 for option in request_only_option:
 
-                    # name으로 입력된 각 옵션의 id를 받아옴
-                    color_id = self.product_dao.select_color_id(option, db_connection)
-                    size_id  = self.product_dao.select_size_id(option, db_connection)
-
-                    # insert_product_option 함수 인자를 줄이기 위해 option 정보 별도 저장
-                    option['color_id'] = color_id
-                    option['size_id']  = size_id
-
                     # product_id 설정
                     product_info['product_id'] = product_id
 
@@ -783,6 +1242,7 @@ class ProductService:
 
         History:
             2020-09-09 (sincerity410@gmail.com) : 초기생성
+            2020-09-10 (sincerity410@gmail.com) : 선분 관리 시간을 문자열 변환 없이 datetime 으로 전달
 
         """
 
@@ -820,7 +1280,7 @@ class ProductService:
             resizing      = ResizeImage(product_code['product_code'], product_images, s3_connection)
             resized_image = resizing()
 
-            now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            now = datetime.datetime.now().replace(microsecond=0)
             self.product_dao.close_product_image(now, product_id, db_connection)
             self.product_dao.delete_image(product_id, db_connection)
 
@@ -32,22 +32,23 @@ class UserService:
                 로그인 시 최종 접속일 업데이트 로직 추가
             2020-08-22 (tnwjd060124@gmail.com) : 수정
                 dao 메소드 실행 시 db_connection을 parameter로 전달
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                유저 확인과 password 조회를 한 번의 쿼리로 실행
 
         """
-        # request로 들어온 정보와 일치하는 유저가 있는지 확인
-        user = self.user_dao.check_user(user_info, db_connection)
+        # request로 들어온 정보와 일치하는 유저와 해당 유저의 password 를 함께 가져옴
+        user = self.user_dao.authenticate(user_info, db_connection)
 
         # 일치하는 유저가 없으면 None 리턴
         if not user:
             return None
 
-        # 일치하는 유저가 있으면 해당 유저의 password 가져옴
-        password = self.user_dao.get_user_password(user, db_connection)
-
         # request로 들어온 password와 db에 있는 password가 일치한지 확인
-        if int(password['password']) != user_info['password']:
+        if int(user['password']) != user_info['password']:
             return None
 
+        user = {'user_no' : user['user_no']}
+
         # 비밀번호 일치 시 최종 접속 시간 업데이트
         self.user_dao.update_user_last_access(user, db_connection)
 
@@ -104,6 +105,8 @@ class UserService:
                 로그인 시 최종 접속일 업데이트 로직 추가
             2020-08-22 (tnwjd060124@gmail.com) : 수정
                 dao 메소드 실행 시 db_connection을 parameter로 전달
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                신규 가입 유저는 최종 접속일 update 생략
 
         """
 
@@ -114,11 +117,12 @@ class UserService:
         user = self.user_dao.check_social_user(user_info, db_connection)
 
         # 유저가 없으면 db에 유저 정보 저장
+        # (생성된 pk 는 insert 결과의 lastrowid 를 사용하고, 최종 접속일은 생성 시 기본값(CURRENT_TIMESTAMP)으로 저장됨)
         if not user:
             user_no = self.user_dao.signup_user(user_info, db_connection)
-            user = {"user_no" : user_no}
+            return {"user_no" : user_no}
 
-        # 유저의 최종 접속시간 update
+        # 기존 유저의 최종 접속시간 update
         self.user_dao.update_user_last_access(user, db_connection)
 
         return user
@@ -134,7 +138,7 @@ class UserService:
             db_connection : 연결된 db 객체
 
         Returns:
-            유저 목록
+            유저 목록, 총 유저의 수
 
         Authors:
             tnwjd060124@gmail.com (손수정)
@@ -145,6 +149,8 @@ class UserService:
                 dao 메소드 실행 시 db_connection을 parameter로 전달
             2020-08-24 (tnwjd060124@gmail.com) : pagination 기능 추가
             2020-09-02 (tnwjd060124@gmail.com) : filter 기능 추가
+            2020-09-10 (tnwjd060124@gmail.com) : 수정
+                총 유저의 수를 유저 리스트 조회 결과에서 함께 리턴
 
         """
 
@@ -154,34 +160,13 @@ class UserService:
         # 유저 리스트 가져오는 메소드 실행
         users = self.user_dao.get_user_list(filter_info, db_connection)
 
-        return users
-
-    def get_total_user_number(self, filter_info, db_connection):
-
-        """
-
-        총 유저의 수를 보여줍니다.
-
-        Args:
-            filter_info : 필터 정보
-            db_connection : 연결된 db 객체
-
-        Returns:
-            총 유저의 수
-
-        Authors:
-            tnwjd060124@gmail.com (손수정)
-
-        History:
-            2020-08-25 (tnwjd060124@gmail.com) : 초기 생성
-            2020-09-02 (tnwjd060124@gmail.com) : 필터 기능 추가
-
-        """
+        # 총 유저의 수는 모든 row 에 같은 값으로 들어있으므로 첫번째 row 에서 가져오고 응답에서는 제외
+        total_number = users[0]['total_number'] if users else 0
 
-        # 총 유저의 수를 가져오는 메소드 실행
-        total_number = self.user_dao.get_total_user(filter_info, db_connection)
+        for user in users:
+            del user['total_number']
 
-        return total_number
+        return users, total_number
 
     def get_user_orders(self, user_info, db_connection):
 
@@ -0,0 +1,104 @@
+from celery           import Celery
+from celery.utils.log import get_task_logger
+
+from config     import CELERY
+from connection import get_connection, get_s3_connection, get_redis_connection
+from model      import ProductDao
+from service    import ProductService
+
+# 상품 이미지 resize, S3 upload 처럼 오래 걸리는 작업을 처리하는 background worker
+# 실행 : celery -A tasks worker
+celery_app = Celery('brandi', broker=CELERY['broker_url'])
+
+product_service = ProductService(ProductDao())
+
+logger = get_task_logger(__name__)
+
+# 상품 이미지 처리 실패 시 재시도 설정 (재시도 간격은 1, 2, 4 ... 초로 늘어나며 최대 600초)
+PRODUCT_IMAGE_MAX_RETRIES = CELERY.get('product_image_max_retries', 5)
+
+@celery_app.task(
+    bind              = True,
+    name              = 'product.process_images',
+    autoretry_for     = (Exception,),
+    max_retries       = PRODUCT_IMAGE_MAX_RETRIES,
+    retry_backoff     = True,
+    retry_backoff_max = 600,
+    retry_jitter      = True
+)
+def process_product_images(self, product_id, staged_images, product_list_version_key):
+
+    """
+
+    상품등록 요청에서 S3에 임시 저장한 상품 원본 이미지를 사이즈 별로 S3에 저장하고 URL을 DB에 Insert 합니다.
+    실패 시 자동으로 재시도하며, 임시 저장한 원본은 성공하거나 마지막 재시도까지 실패한 경우에만 삭제합니다.
+
+    Args:
+        product_id               : products Table의 PK
+        staged_images            : S3에 임시 저장한 상품 원본 이미지 정보 List
+            [
+                {
+                    'name'         : 'product_image_<int>',
+                    'key'          : 임시 저장한 S3 object key,
+                    'filename'     : 원본 파일 이름,
+                    'content_type' : Content-Type
+                }
+            ]
+        product_list_version_key : 이미지 저장 후 증가시킬 상품 List cache version key
+
+    Returns:
+        None
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+        2020-09-10 (sincerity410@gmail.com) : 원본 이미지를 S3에 임시 저장, 실패 시 재시도 추가
+
+    """
+
+    db_connection  = None
+    product_images = {}
+    s3_connection  = get_s3_connection()
+
+    try:
+        product_images = product_service.load_staged_product_image(staged_images, s3_connection)
+
+        db_connection = get_connection()
+
+        product_service.save_product_image(
+            product_images,
+            product_id,
+            s3_connection,
+            db_connection
+        )
+
+        db_connection.commit()
+
+    except Exception as e:
+        if db_connection:
+            db_connection.rollback()
+
+        # 마지막 재시도까지 실패한 경우에만 임시 저장한 원본 삭제 (그 전에는 재시도에서 다시 사용)
+        if self.request.retries >= self.max_retries:
+            product_service.delete_staged_product_image(staged_images, s3_connection)
+
+        raise e
+
+    finally:
+        if db_connection:
+            db_connection.close()
+
+        for image in product_images.values():
+            image.close()
+
+    # 이미지 Insert 가 commit 된 이후에 재시도하면 이미지가 중복 Insert 되므로 아래 작업은 실패해도 재시도하지 않음
+    try:
+        # 대표 이미지가 등록되어야 상품 List 에 노출되므로 이미지 저장 후 상품 List cache 무효화
+        get_redis_connection().incr(product_list_version_key)
+
+        product_service.delete_staged_product_image(staged_images, s3_connection)
+
+    except Exception:
+        logger.exception('product %s : post-processing after image commit failed', product_id)
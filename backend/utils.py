@@ -1,11 +1,17 @@
-import time, jwt, io
-from PIL        import Image
-from functools  import wraps
+import time, jwt, io, decimal, datetime, orjson, tempfile, json, pymysql
+from PIL                import Image
+from functools          import wraps
+from concurrent.futures import ThreadPoolExecutor
 
-from flask_request_validator import AbstractRule
-from flask                   import request, jsonify
+from flask_request_validator import AbstractRule, GET, PATH
+from flask                   import request, jsonify, Response, g
+from werkzeug.datastructures import ImmutableMultiDict, FileStorage
+from streaming_form_data     import StreamingFormDataParser
+from streaming_form_data.targets import ValueTarget, BaseTarget
+from boto3.s3.transfer       import TransferConfig
 
-from config import SECRET, S3
+from config     import SECRET, S3
+from connection import get_connection
 
 class DatetimeRule(AbstractRule):
 
@@ -101,6 +107,58 @@ class LimitRule(AbstractRule):
 
         return errors
 
+class OptionQuantityRule(AbstractRule):
+
+    def validate(self, value):
+
+        """
+
+        상품등록/수정 시 optionQuantity 로 들어온 값이
+        color, size, quantity 를 가진 옵션 List(JSON) 형식인지 확인합니다.
+
+        Args:
+            value: form optionQuantity
+
+        Returns:
+            errors: 형식이 맞지 않으면 value 를 담은 list
+                    유효성 검사를 통과하면 빈 list
+
+        Authors:
+            sincerity410@gmail.com (이곤호)
+
+        History:
+            2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+        """
+
+        errors = []
+
+        try:
+            options = orjson.loads(value)
+
+        except orjson.JSONDecodeError:
+            errors.append(value)
+            return errors
+
+        # 옵션은 1개 이상의 List 여야 함
+        if not isinstance(options, list) or len(options) == 0:
+            errors.append(value)
+            return errors
+
+        for option in options:
+
+            # 색상, 사이즈 이름과 0 이상의 정수 재고수량이 있어야 함
+            if not isinstance(option, dict) \
+                or not isinstance(option.get('color'), str) \
+                or not isinstance(option.get('size'), str) \
+                or not isinstance(option.get('quantity'), int) \
+                or isinstance(option.get('quantity'), bool) \
+                or option['quantity'] < 0:
+                errors.append(value)
+                break
+
+        return errors
+
 def login_required(func):
 
     """
@@ -146,6 +204,154 @@ def login_required(func):
 
     return wrapper
 
+class FormFieldTarget(ValueTarget):
+
+    """
+
+    multipart 요청에서 해당 field 가 실제로 전달되었는지 기록하는 ValueTarget
+    (값이 비어있는 field 와 전달되지 않은 field 를 구분하기 위해 사용)
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.received = False
+
+    def on_start(self):
+        self.received = True
+
+class FileFieldTarget(BaseTarget):
+
+    """
+
+    multipart 요청의 file field 를 SpooledTemporaryFile 에 저장하는 target
+    (일정 크기를 넘는 이미지는 메모리 대신 임시 파일에 저장)
+
+    """
+
+    def __init__(self, max_memory_size=1024 * 1024, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.received = False
+        self.file     = tempfile.SpooledTemporaryFile(max_size=max_memory_size)
+
+    def on_start(self):
+        self.received = True
+
+    def on_data_received(self, chunk):
+        self.file.write(chunk)
+
+    def on_finish(self):
+        self.file.seek(0)
+
+def stream_form_data(form_fields, file_fields, chunk_size=65536):
+
+    """
+
+    werkzeug multipart parser 대신 streaming-form-data 로 요청 body 를 parsing 한 후
+    request.form, request.files 에 채워 넣습니다.
+    (validate_params 보다 먼저 실행되어야 하므로 catch_exception 과 validate_params 사이에 위치)
+
+    application/json 요청은 multipart parsing 없이 orjson 으로 읽어 form_fields 값을 request.form 에 채우고,
+    미리 업로드 된 이미지 URL(imageUrls)은 g.image_urls 에 저장합니다.
+
+    Args:
+        form_fields : 전달받을 form field 이름 List
+        file_fields : 전달받을 file field 이름 List
+        chunk_size  : request stream 을 읽어들이는 단위(byte)
+
+    Returns:
+        multipart / json 요청을 미리 parsing 한 뒤 func 를 실행하는 wrapper
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+        2020-09-10 (sincerity410@gmail.com) : application/json 요청 처리 추가
+
+    """
+
+    def decorator(func):
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            # json 요청인 경우 multipart parsing 없이 body 를 그대로 읽음
+            if request.is_json:
+                body = orjson.loads(request.get_data())
+
+                if not isinstance(body, dict):
+                    raise Exception('INVALID_JSON_BODY')
+
+                g.image_urls = body.get('imageUrls', [])
+
+                # validate_params 가 form 값(문자열)으로 검사할 수 있도록 변환
+                form = []
+
+                for field in form_fields:
+                    value = body.get(field)
+
+                    if value is None:
+                        continue
+
+                    if isinstance(value, (list, dict)):
+                        value = orjson.dumps(value).decode('utf-8')
+
+                    form.append((field, str(value)))
+
+                request.__dict__['form']  = ImmutableMultiDict(form)
+                request.__dict__['files'] = ImmutableMultiDict()
+
+                return func(*args, **kwargs)
+
+            # multipart 요청이 아닌 경우 기존 parser 사용
+            if request.mimetype != 'multipart/form-data':
+                return func(*args, **kwargs)
+
+            parser  = StreamingFormDataParser(headers=request.headers)
+            targets = {}
+
+            for field in form_fields:
+                targets[field] = FormFieldTarget()
+                parser.register(field, targets[field])
+
+            for field in file_fields:
+                targets[field] = FileFieldTarget()
+                parser.register(field, targets[field])
+
+            # request body 를 chunk 단위로 읽어 각 field target 에 저장
+            while True:
+                chunk = request.stream.read(chunk_size)
+
+                if not chunk:
+                    break
+
+                parser.data_received(chunk)
+
+            form = [
+                (field, targets[field].value.decode('utf-8'))
+                for field in form_fields if targets[field].received
+            ]
+            files = [
+                (field, FileStorage(
+                    stream       = targets[field].file,
+                    filename     = targets[field].multipart_filename,
+                    name         = field,
+                    content_type = targets[field].multipart_content_type
+                ))
+                for field in file_fields if targets[field].received and targets[field].multipart_filename
+            ]
+
+            # werkzeug 가 request body 를 다시 parsing 하지 않도록 결과를 캐시에 채워 넣음
+            request.__dict__['form']  = ImmutableMultiDict(form)
+            request.__dict__['files'] = ImmutableMultiDict(files)
+
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 class ResizeImage:
 
     """
@@ -200,6 +406,10 @@ class ResizeImage:
     History:
         2020-08-27 (tnwjd060124@gmail.com)  : 초기 생성
         2020-08-27 (sincerity410@gmail.com) : S3 저장기능 추가 구현
+        2020-09-10 (sincerity410@gmail.com) : S3 업로드를 thread pool 에서 병렬로 실행
+        2020-09-10 (sincerity410@gmail.com) : put_object 대신 upload_fileobj(multipart) 사용
+        2020-09-10 (sincerity410@gmail.com) : LANCZOS resampling + reducing_gap 적용 (Pillow-SIMD)
+        2020-09-10 (sincerity410@gmail.com) : 원본 image 한번만 decode, L -> M -> S 순서로 단계적 resize
 
     """
 
@@ -210,26 +420,32 @@ class ResizeImage:
         self.large_width    = 640
         self.medium_width   = 320
         self.small_width    = 150
+        self.upload_workers = 16
+        # multipart_threshold 를 넘는 파일은 chunk 단위 multipart upload 로 전송
+        self.transfer_config = TransferConfig(
+            multipart_threshold = 8 * 1024 * 1024,
+            multipart_chunksize = 8 * 1024 * 1024,
+            use_threads         = False
+        )
         self.resize_images  = {}
+        self.upload_jobs    = []
 
     def resizing(self):
 
         for key, values in self.images.items():
 
-            # image 파일 open
+            # image 파일 open 후 한번만 decode
             image = Image.open(values)
+            image.load()
 
-            # image 사이즈 측정
-            width, height = image.size
-
-            # large size로 resizing 하는 메소드 실행
-            large_size_image = self.resize_image_to_large(values, width, height, self.product_code, self.s3_connection)
+            # large size로 resizing 하는 메소드 실행 (원본 image 기준)
+            image_L, large_size_image = self.resize_image_to_large(image, values, self.product_code)
 
-            # medium size로 resizing 하는 메소드 실행
-            medium_size_image = self.resize_image_to_medium(values, width, height, self.product_code, self.s3_connection)
+            # medium size로 resizing 하는 메소드 실행 (large image 기준)
+            image_M, medium_size_image = self.resize_image_to_medium(image_L, values, self.product_code)
 
-            # small size로 resizing 하는 메소드 실행
-            small_size_image = self.resize_image_to_small(values, width, height, self.product_code, self.s3_connection)
+            # small size로 resizing 하는 메소드 실행 (medium image 기준)
+            image_S, small_size_image = self.resize_image_to_small(image_M, values, self.product_code)
 
             # resize_images dictionary에 결과 저장
             self.resize_images[key] = {
@@ -238,78 +454,131 @@ class ResizeImage:
                 'product_image_S' : small_size_image
             }
 
-    def resize_image_to_large(self, image_file, width, height, product_code, s3_connection):
+    def resize_and_queue(self, image, image_file, product_code, target_width, size):
 
-        # image 파일 open
-        image = Image.open(image_file)
+        # image 사이즈 측정
+        width, height = image.size
 
         # image resize
-        image_L = image.resize((self.large_width,int((height*self.large_width)/width)))
+        resized_image = image.resize((target_width, int((height*target_width)/width)), Image.LANCZOS, reducing_gap=3.0)
 
         buffer = io.BytesIO()
-        image_L.save(buffer, "JPEG")
+        resized_image.save(buffer, "JPEG")
         buffer.seek(0)
 
-        s3_connection.put_object(
-            Body        = buffer,
-            Bucket      = 'brandi-project',
-            Key         = f"{product_code}_{image_file.name.split('product_')[1]}_L",
-            ContentType = image_file.content_type
-        )
+        # S3 업로드는 upload 메소드에서 한번에 병렬로 실행
+        self.upload_jobs.append({
+            'Fileobj'   : buffer,
+            'Bucket'    : 'brandi-project',
+            'Key'       : f"{product_code}_{image_file.name.split('product_')[1]}_{size}",
+            'ExtraArgs' : {'ContentType' : image_file.content_type},
+            'Config'    : self.transfer_config
+        })
 
-        image_L_url = f"{S3['aws_url']}{product_code}_{image_file.name.split('product_')[1]}_L"
+        image_url = f"{S3['aws_url']}{product_code}_{image_file.name.split('product_')[1]}_{size}"
 
-        return image_L_url
+        return resized_image, image_url
 
-    def resize_image_to_medium(self, image_file, width, height, product_code, s3_connection):
+    def resize_image_to_large(self, image, image_file, product_code):
+        return self.resize_and_queue(image, image_file, product_code, self.large_width, 'L')
 
-        # image 파일 open
-        image = Image.open(image_file)
+    def resize_image_to_medium(self, image, image_file, product_code):
+        return self.resize_and_queue(image, image_file, product_code, self.medium_width, 'M')
 
-        # image resize
-        image_M = image.resize((self.medium_width, int((height*self.medium_width)/width)))
+    def resize_image_to_small(self, image, image_file, product_code):
+        return self.resize_and_queue(image, image_file, product_code, self.small_width, 'S')
 
-        buffer = io.BytesIO()
-        image_M.save(buffer, "JPEG")
-        buffer.seek(0)
+    def upload(self):
 
-        s3_connection.put_object(
-            Body        = buffer,
-            Bucket      = 'brandi-project',
-            Key         = f"{product_code}_{image_file.name.split('product_')[1]}_M",
-            ContentType = image_file.content_type
-        )
+        # boto3 client 는 thread-safe 하므로 하나의 client 를 공유해 모든 사이즈의 이미지를 동시에 업로드
+        # (with 블록을 빠져나올 때 모든 업로드가 끝나며, 실패 시 exception 이 전달된다)
+        with ThreadPoolExecutor(max_workers=self.upload_workers) as executor:
+            list(executor.map(lambda job: self.s3_connection.upload_fileobj(**job), self.upload_jobs))
 
-        image_M_url = f"{S3['aws_url']}{product_code}_{image_file.name.split('product_')[1]}_M"
+    def __call__(self):
+        self.resizing()
+        self.upload()
+        return self.resize_images
 
-        return image_M_url
+def fast_validate_params(*params):
 
-    def resize_image_to_small(self, image_file, width, height, product_code, s3_connection):
+    """
 
-        # image 파일 open
-        image = Image.open(image_file)
+    validate_params 와 동일한 Param 정의를 사용하지만,
+    (name, 위치, type, 필수 여부, 기본값, rules) spec 을 데코레이터 생성 시점에 한번만 만들어 두고
+    요청마다 해당 spec 만 순회하며 유효성 검사를 합니다. (GET, PATH parameter 전용)
 
-        # image resize
-        image_S = image.resize((self.small_width, int((height*self.small_width)/width)))
+    Args:
+        params : flask_request_validator Param 객체
 
-        buffer = io.BytesIO()
-        image_S.save(buffer, "JPEG")
-        buffer.seek(0)
+    Returns:
+        유효성 검사를 통과한 값을 순서대로 func 에 전달하는 wrapper
+        (유효성 검사 실패 시 Exception 발생 → catch_exception 에서 400 반환)
 
-        s3_connection.put_object(
-            Body        = buffer,
-            Bucket      = 'brandi-project',
-            Key         = f"{product_code}_{image_file.name.split('product_')[1]}_S",
-            ContentType = image_file.content_type
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+    """
+
+    spec = tuple(
+        (
+            param.name,
+            param.param_type == PATH,
+            None if param.value_type is str else param.value_type,
+            param.required,
+            param.default,
+            tuple(param.rules or ())
         )
+        for param in params
+    )
 
-        image_S_url = f"{S3['aws_url']}{product_code}_{image_file.name.split('product_')[1]}_S"
+    if any(param.param_type not in (GET, PATH) for param in params):
+        raise ValueError('ONLY_GET_AND_PATH_PARAMS_ARE_SUPPORTED')
 
-        return image_S_url
+    def decorator(func):
 
-    def __call__(self):
-        self.resizing()
-        return self.resize_images
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            query_args = request.args
+            path_args  = request.view_args or {}
+            values     = []
+            errors     = []
+
+            for name, is_path, value_type, required, default, rules in spec:
+                value = (path_args if is_path else query_args).get(name)
+
+                if value is None:
+                    if required:
+                        errors.append(name)
+                    values.append(default)
+                    continue
+
+                if value_type is not None:
+                    try:
+                        value = value_type(value)
+                    except (TypeError, ValueError):
+                        errors.append(name)
+                        continue
+
+                for rule in rules:
+                    if rule.validate(value):
+                        errors.append(name)
+                        break
+
+                values.append(value)
+
+            if errors:
+                raise Exception(errors)
+
+            return func(*values)
+
+        return wrapper
+
+    return decorator
 
 def catch_exception(func, *args, **kwargs):
 
@@ -343,3 +612,191 @@ def catch_exception(func, *args, **kwargs):
             return jsonify({"message" : f"INVALID_PARAMETER_{e}"}), 400
 
     return wrapper
+
+def orjson_default(obj):
+
+    """
+
+    orjson 이 기본으로 직렬화하지 못하는 객체를 변환합니다.
+    (app.py CustomJSONEncoder 와 동일한 형태로 반환)
+
+    Args:
+        obj : json 형태로 반환하고자 하는 객체
+
+    Returns:
+        Decimal  : float
+        datetime : 'YYYY-mm-dd HH:MM:SS' 형태의 문자열
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+    """
+
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+
+    if isinstance(obj, datetime.datetime):
+        return obj.strftime('%Y-%m-%d %H:%M:%S')
+
+    raise TypeError
+
+def dumps_json(obj):
+
+    """
+
+    orjson 으로 객체를 직렬화합니다. (cache 저장, 응답 생성에 사용)
+
+    Args:
+        obj : json 형태로 반환하고자 하는 객체
+
+    Returns:
+        직렬화된 bytes
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+    """
+
+    return orjson.dumps(
+        obj,
+        default = orjson_default,
+        option  = orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+def fast_json(obj, status=200):
+
+    """
+
+    jsonify 대신 orjson 으로 직렬화한 json 응답을 생성합니다.
+
+    Args:
+        obj    : json 형태로 반환하고자 하는 객체
+        status : HTTP status code
+
+    Returns:
+        application/json Response 객체
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+    """
+
+    return Response(dumps_json(obj), status=status, mimetype='application/json')
+
+class LazyConnection:
+
+    """
+
+    실제로 query 가 실행될 때 pool 에서 connection 을 가져오는 database connection proxy
+    (cache hit 처럼 DB 조회가 필요 없는 요청은 connection 을 가져오지 않음)
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+    """
+
+    def __init__(self):
+        self.connection = None
+
+    def __getattr__(self, name):
+
+        if self.connection is None:
+            self.connection = get_connection()
+
+        return getattr(self.connection, name)
+
+    def commit(self):
+        if self.connection:
+            self.connection.commit()
+
+    def rollback(self):
+        if self.connection:
+            self.connection.rollback()
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+def with_db(exception_status=500):
+
+    """
+
+    database connection 을 첫번째 인자로 주입하고
+    commit / rollback / close 및 pymysql exception 처리를 한 곳에서 수행하는 데코레이터
+    (validate_params 아래에 위치해 유효성 검사를 통과한 요청만 connection 을 사용)
+
+    Args:
+        exception_status : 처리되지 않은 Exception 발생 시 반환할 HTTP status code
+
+    Returns:
+        200 : func 의 반환값
+        400 : DATA_ERROR, KEY_ERROR, optionQuantity_VALUE_INVALID_JSON
+        500 : DATABASE_DOES_NOT_EXIST, DATABASE_AUTHORIZATION_DENIED,
+              DATABASE_SYNTAX_ERROR, FOREIGN_KEY_CONSTRAINT_ERROR
+
+    Author:
+        sincerity410@gmail.com (이곤호)
+
+    History:
+        2020-09-10 (sincerity410@gmail.com) : 초기 생성
+
+    """
+
+    def decorator(func):
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            db_connection = LazyConnection()
+
+            try:
+                result = func(db_connection, *args, **kwargs)
+
+                # Exception이 발생하지 않았다면, commit 처리
+                db_connection.commit()
+
+                return result
+
+            except pymysql.err.InternalError:
+                db_connection.rollback()
+                return jsonify({'message' : 'DATABASE_DOES_NOT_EXIST'}), 500
+            except pymysql.err.OperationalError:
+                return jsonify({'message' : 'DATABASE_AUTHORIZATION_DENIED'}), 500
+            except pymysql.err.ProgrammingError:
+                db_connection.rollback()
+                return jsonify({'message' : 'DATABASE_SYNTAX_ERROR'}), 500
+            except pymysql.err.IntegrityError:
+                db_connection.rollback()
+                return jsonify({'message' : 'FOREIGN_KEY_CONSTRAINT_ERROR'}), 500
+            except pymysql.err.DataError:
+                db_connection.rollback()
+                return jsonify({'message' : 'DATA_ERROR'}), 400
+            except KeyError:
+                db_connection.rollback()
+                return jsonify({'message' : 'KEY_ERROR'}), 400
+            except json.decoder.JSONDecodeError:
+                db_connection.rollback()
+                return jsonify({'message' : 'optionQuantity_VALUE_INVALID_JSON'}), 400
+            except Exception as e:
+                db_connection.rollback()
+                return jsonify({'message' : f'{e}'}), exception_status
+
+            finally:
+                db_connection.close()
+
+        return wrapper
+
+    return decorator